@@ -11,8 +11,13 @@ if _EXTERNAL_LIB_DIR.exists() and str(_EXTERNAL_LIB_DIR) not in sys.path:
 
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
+from .connection_scheduler import DATA_CONNECTION_SCHEDULER, BookooConnectionScheduler
+from .const import DOMAIN
 from .coordinator import BookooConfigEntry, BookooCoordinator
+from .services import async_setup_services
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -23,6 +28,16 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Bookoo services and the shared connection scheduler."""
+
+    hass.data[DATA_CONNECTION_SCHEDULER] = BookooConnectionScheduler(hass)
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: BookooConfigEntry) -> bool:
     """Set up bookoo as config entry."""
@@ -34,10 +49,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: BookooConfigEntry) -> bo
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
+
     return True
 
 
+async def _async_update_options(hass: HomeAssistant, entry: BookooConfigEntry) -> None:
+    """Apply changed options without reloading the entry."""
+
+    entry.runtime_data.async_apply_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: BookooConfigEntry) -> bool:
     """Unload a config entry."""
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded and not hass.config_entries.async_loaded_entries(DOMAIN):
+        hass.data[DATA_CONNECTION_SCHEDULER].async_stop()
+    return unloaded
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from aiobookoo_ultra.bookooscale import BookooScale
+from aiobookoo_ultra.const import BookooField
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -14,14 +15,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .entity import BookooEntity, BookooEntityDescription
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
 
 
 @dataclass(kw_only=True, frozen=True)
-class BookooBinarySensorEntityDescription(BinarySensorEntityDescription):
+class BookooBinarySensorEntityDescription(
+    BinarySensorEntityDescription, BookooEntityDescription
+):
     """Description for Bookoo binary sensor entities."""
 
     is_on_fn: Callable[[BookooScale], bool]
@@ -32,6 +35,7 @@ BINARY_SENSORS: tuple[BookooBinarySensorEntityDescription, ...] = (
         key="connected",
         translation_key="connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        update_fields=BookooField.CONNECTION,
         is_on_fn=lambda scale: scale.connected,
     ),
 )
@@ -11,13 +11,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .entity import BookooEntity, BookooEntityDescription
 
 PARALLEL_UPDATES = 0
 
 
 @dataclass(kw_only=True, frozen=True)
-class BookooButtonEntityDescription(ButtonEntityDescription):
+class BookooButtonEntityDescription(ButtonEntityDescription, BookooEntityDescription):
     """Description for bookoo button entities."""
 
     press_fn: Callable[[BookooScale], Coroutine[Any, Any, None]]
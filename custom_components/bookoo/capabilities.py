@@ -0,0 +1,157 @@
+"""Scale settings the library supports, resolved once per config entry."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields
+import inspect
+from operator import attrgetter
+from typing import Any
+
+from aiobookoo_ultra.bookooscale import BookooDeviceState, BookooScale
+
+CAPABILITY_BEEPER_LEVEL = "beeper_level"
+CAPABILITY_BEEPER_LEVELS = "beeper_levels"
+CAPABILITY_FLOW_SMOOTHING = "flow_smoothing"
+CAPABILITY_AUTO_OFF = "auto_off"
+
+# candidate names across library versions, the first one present wins;
+# getters are looked up on the scale before its device state
+_GETTERS: dict[str, tuple[str, ...]] = {
+    CAPABILITY_BEEPER_LEVEL: ("beeper_level", "buzzer_level", "buzzer_gear"),
+    CAPABILITY_BEEPER_LEVELS: ("supported_beeper_levels",),
+    CAPABILITY_FLOW_SMOOTHING: (
+        "flow_smoothing_enabled",
+        "flow_smoothing",
+        "flow_smoothing_mode",
+        "flow_rate_smoothing",
+    ),
+    CAPABILITY_AUTO_OFF: (
+        "auto_off_time",
+        "auto_off_duration",
+        "auto_off",
+        "auto_off_seconds",
+    ),
+}
+_SETTERS: dict[str, tuple[str, ...]] = {
+    CAPABILITY_BEEPER_LEVEL: ("set_beep_level", "set_beeper_level", "set_buzzer_level"),
+    CAPABILITY_FLOW_SMOOTHING: (
+        "set_flow_rate_smoothing",
+        "set_flow_smoothing_enabled",
+        "set_flow_smoothing",
+        "set_flow_smoothing_mode",
+    ),
+    CAPABILITY_AUTO_OFF: (
+        "set_auto_off_duration",
+        "set_auto_off_time",
+        "set_auto_off",
+        "set_auto_off_seconds",
+    ),
+}
+# accessors in seconds; the auto-off entity works in minutes
+_SECONDS = frozenset({"auto_off_seconds", "set_auto_off_seconds"})
+
+_DEVICE_STATE_ATTRIBUTES = frozenset(
+    {field.name for field in fields(BookooDeviceState)}
+    | {name for name in dir(BookooDeviceState) if not name.startswith("_")}
+)
+
+
+def _unsupported(_scale: BookooScale) -> None:
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class BookooCapability:
+    """Bound accessors for one setting, `set` is None if it is read-only."""
+
+    getter: str | None = None
+    setter: str | None = None
+    get: Callable[[BookooScale], Any] = _unsupported
+    set: Callable[[Any], Awaitable[None]] | None = None
+
+    def as_dict(self) -> dict[str, str | None]:
+        """Return the resolved accessor names, e.g. for diagnostics."""
+        return {"getter": self.getter, "setter": self.setter}
+
+
+def resolve_capabilities(scale: BookooScale) -> dict[str, BookooCapability]:
+    """Resolve the getter and setter of every setting for `scale`."""
+    capabilities: dict[str, BookooCapability] = {}
+    for key, names in _GETTERS.items():
+        getter, get = _resolve_getter(scale, names)
+        setter, set_value = _resolve_setter(scale, key)
+        capabilities[key] = BookooCapability(
+            getter=getter, setter=setter, get=get, set=set_value
+        )
+    return capabilities
+
+
+def _resolve_getter(
+    scale: BookooScale, names: tuple[str, ...]
+) -> tuple[str | None, Callable[[BookooScale], Any]]:
+    """Return the path and a reader for the first attribute present."""
+    for name in names:
+        if hasattr(scale, name):
+            path, get = name, attrgetter(name)
+            break
+    else:
+        for name in names:
+            if name in _DEVICE_STATE_ATTRIBUTES:
+                path = f"device_state.{name}"
+                get = _from_device_state(attrgetter(name))
+                break
+        else:
+            return None, _unsupported
+    return path, _to_minutes(get) if name in _SECONDS else get
+
+
+def _resolve_setter(
+    scale: BookooScale, key: str
+) -> tuple[str | None, Callable[[Any], Awaitable[None]] | None]:
+    """Return the name and a coroutine function for the first setter present."""
+    for name in _SETTERS.get(key, ()):
+        if callable(method := getattr(scale, name, None)):
+            break
+    else:
+        return None, None
+    if not inspect.iscoroutinefunction(method):
+        method = _awaitable(method)
+    return name, _from_minutes(method) if name in _SECONDS else method
+
+
+def _from_device_state(
+    get: Callable[[BookooDeviceState], Any],
+) -> Callable[[BookooScale], Any]:
+    def get_from_device_state(scale: BookooScale) -> Any:
+        if (device_state := scale.device_state) is None:
+            return None
+        return get(device_state)
+
+    return get_from_device_state
+
+
+def _to_minutes(get: Callable[[BookooScale], Any]) -> Callable[[BookooScale], Any]:
+    def get_minutes(scale: BookooScale) -> Any:
+        if (value := get(scale)) is None:
+            return None
+        return float(value) / 60
+
+    return get_minutes
+
+
+def _awaitable(method: Callable[[Any], Any]) -> Callable[[Any], Awaitable[None]]:
+    async def call(value: Any) -> None:
+        if inspect.isawaitable(result := method(value)):
+            await result
+
+    return call
+
+
+def _from_minutes(
+    method: Callable[[Any], Awaitable[None]],
+) -> Callable[[Any], Awaitable[None]]:
+    async def set_seconds(value: Any) -> None:
+        await method(int(value * 60))
+
+    return set_seconds
@@ -3,6 +3,10 @@
 import logging
 from typing import Any
 
+from aiobookoo_ultra.estimator import (
+    DEFAULT_MEASUREMENT_NOISE,
+    DEFAULT_PROCESS_NOISE,
+)
 from aiobookoo_ultra.exceptions import (
     BookooDeviceNotFound,
     BookooError,
@@ -15,20 +19,71 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
 )
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
 )
 
-from .const import CONF_IS_VALID_SCALE, DOMAIN
+from .const import (
+    CONF_FLOW_ESTIMATOR,
+    CONF_IDLE_RELEASE,
+    CONF_INSTRUMENTATION,
+    CONF_IS_VALID_SCALE,
+    CONF_MEASUREMENT_NOISE,
+    CONF_PROCESS_NOISE,
+    CONF_TARGET_ACTION,
+    DEFAULT_FLOW_ESTIMATOR,
+    DEFAULT_IDLE_RELEASE,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_MAX_RATE,
+    DEFAULT_TARGET_ACTION,
+    DOMAIN,
+    RATE_LIMIT_OPTIONS,
+    TARGET_ACTIONS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_NOISE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=0.0001, max=100, step="any", mode=NumberSelectorMode.BOX)
+)
+
+_MAX_RATE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=10,
+        step=0.5,
+        unit_of_measurement="Hz",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
+
+_IDLE_RELEASE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=3600,
+        step=30,
+        unit_of_measurement="s",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
 
 class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for bookoo."""
@@ -36,7 +91,13 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered: dict[str, Any] = {}
-        self._discovered_devices: dict[str, str] = {}
+        self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow."""
+        return BookooOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -47,8 +108,12 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             mac = user_input[CONF_ADDRESS]
+            discovery_info = self._discovered_devices[mac]
             try:
-                is_valid_bookoo_scale = await is_bookoo_scale(mac)
+                # the advertisement usually suffices, no connection needed
+                is_valid_bookoo_scale = await is_bookoo_scale(
+                    discovery_info.device, discovery_info.advertisement
+                )
             except BookooDeviceNotFound:
                 errors["base"] = "device_not_found"
             except BookooError:
@@ -62,15 +127,15 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
 
             if not errors:
                 return self.async_create_entry(
-                    title=self._discovered_devices[mac],
+                    title=discovery_info.name,
                     data={
                         CONF_ADDRESS: mac,
                         CONF_IS_VALID_SCALE: is_valid_bookoo_scale,
                     },
                 )
 
-        for device in async_discovered_service_info(self.hass):
-            self._discovered_devices[device.address] = device.name
+        for discovery_info in async_discovered_service_info(self.hass):
+            self._discovered_devices[discovery_info.address] = discovery_info
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
@@ -78,9 +143,9 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
         options = [
             SelectOptionDict(
                 value=device_mac,
-                label=f"{device_name} ({device_mac})",
+                label=f"{discovery_info.name} ({device_mac})",
             )
-            for device_mac, device_name in self._discovered_devices.items()
+            for device_mac, discovery_info in self._discovered_devices.items()
         ]
 
         return self.async_show_form(
@@ -111,7 +176,7 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
 
         try:
             self._discovered[CONF_IS_VALID_SCALE] = await is_bookoo_scale(
-                discovery_info.address
+                discovery_info.device, discovery_info.advertisement
             )
         except BookooDeviceNotFound:
             _LOGGER.debug("Device not found during discovery")
@@ -151,3 +216,67 @@ class BookooConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="bluetooth_confirm",
             description_placeholders=placeholders,
         )
+
+
+class BookooOptionsFlow(OptionsFlow):
+    """Handle Bookoo options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage update rates, the flow estimator, target action and idle release."""
+
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        option, default=options.get(option, DEFAULT_MAX_RATE)
+                    ): _MAX_RATE_SELECTOR
+                    for option in dict.fromkeys(RATE_LIMIT_OPTIONS.values())
+                }
+            ).extend(
+                {
+                    vol.Required(
+                        CONF_FLOW_ESTIMATOR,
+                        default=options.get(
+                            CONF_FLOW_ESTIMATOR, DEFAULT_FLOW_ESTIMATOR
+                        ),
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_PROCESS_NOISE,
+                        default=options.get(CONF_PROCESS_NOISE, DEFAULT_PROCESS_NOISE),
+                    ): _NOISE_SELECTOR,
+                    vol.Required(
+                        CONF_MEASUREMENT_NOISE,
+                        default=options.get(
+                            CONF_MEASUREMENT_NOISE, DEFAULT_MEASUREMENT_NOISE
+                        ),
+                    ): _NOISE_SELECTOR,
+                    vol.Required(
+                        CONF_TARGET_ACTION,
+                        default=options.get(CONF_TARGET_ACTION, DEFAULT_TARGET_ACTION),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=TARGET_ACTIONS,
+                            translation_key=CONF_TARGET_ACTION,
+                            mode=SelectSelectorMode.LIST,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_IDLE_RELEASE,
+                        default=options.get(CONF_IDLE_RELEASE, DEFAULT_IDLE_RELEASE),
+                    ): _IDLE_RELEASE_SELECTOR,
+                    vol.Required(
+                        CONF_INSTRUMENTATION,
+                        default=options.get(
+                            CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION
+                        ),
+                    ): BooleanSelector(),
+                }
+            ),
+        )
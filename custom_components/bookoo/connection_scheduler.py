@@ -0,0 +1,229 @@
+"""Connection slot scheduling across all Bookoo scales."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+
+from aiobookoo_ultra.exceptions import BookooDeviceNotFound, BookooError
+from bleak.backends.device import BLEDevice
+from habluetooth import HaBluetoothSlotAllocations, get_manager
+
+from homeassistant.components.bluetooth import (
+    BluetoothScannerDevice,
+    async_scanner_devices_by_address,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONNECTION_SCHEDULER: HassKey[BookooConnectionScheduler] = HassKey(
+    f"{DOMAIN}_connection_scheduler"
+)
+
+# assumed slots per adapter when it does not report its allocations
+DEFAULT_ADAPTER_SLOTS = 3
+ACQUIRE_TIMEOUT = 30.0  # seconds
+
+# lower values are served first
+PRIORITY_SHOT = 0
+PRIORITY_COMMAND = 1
+PRIORITY_RECONNECT = 2
+
+
+@dataclass(order=True)
+class _Request:
+    """A scale waiting for a connection slot."""
+
+    priority: int
+    sequence: int
+    address: str = field(compare=False)
+    queued_at: float = field(compare=False)
+    future: asyncio.Future[BLEDevice] = field(compare=False)
+
+
+@dataclass
+class _Slot:
+    """A connection slot held by a scale."""
+
+    source: str
+    priority: int
+    connected: bool = False
+
+
+class BookooConnectionScheduler:
+    """Share the connection slots of all adapters between the scales.
+
+    A scale asks for a slot before it connects and keeps it until its link
+    is gone. Requests are served by priority, a scale in the middle of a
+    shot first, then in arrival order. Each request is granted on the
+    adapter or proxy that hears the scale best among those with a free
+    slot; free slots come from the adapter's reported allocations, minus
+    grants whose connection is still being set up, or from
+    `DEFAULT_ADAPTER_SLOTS` if it reports none.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty scheduler."""
+        self.hass = hass
+        self._queue: list[_Request] = []
+        self._slots: dict[str, _Slot] = {}
+        self._sequence = itertools.count()
+        self._cancel_allocations: CALLBACK_TYPE | None = None
+        self.granted = 0
+        self.timeouts = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Re-check the queue whenever an adapter's allocations change."""
+        if self._cancel_allocations is not None:
+            return
+        manager = get_manager()
+        if hasattr(manager, "async_register_allocation_callback"):
+            self._cancel_allocations = manager.async_register_allocation_callback(
+                self._async_allocations_changed
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following allocation changes, e.g. when the last scale unloads."""
+        if self._cancel_allocations is not None:
+            self._cancel_allocations()
+            self._cancel_allocations = None
+
+    @callback
+    def _async_allocations_changed(self, _allocations: Any) -> None:
+        self._async_dispatch()
+
+    async def async_acquire(self, address: str, priority: int) -> BLEDevice:
+        """Wait for a slot and return the device on the adapter to use."""
+        self.async_release(address)
+        request = _Request(
+            priority,
+            next(self._sequence),
+            address,
+            time.monotonic(),
+            self.hass.loop.create_future(),
+        )
+        heapq.heappush(self._queue, request)
+        self._async_dispatch()
+        try:
+            async with asyncio.timeout(ACQUIRE_TIMEOUT):
+                return await request.future
+        except TimeoutError as ex:
+            self.timeouts += 1
+            raise BookooError("No free Bluetooth connection slot") from ex
+        finally:
+            self._async_remove_request(request)
+
+    @callback
+    def async_connected(self, address: str) -> None:
+        """Record that the link on the granted slot is up."""
+        if (slot := self._slots.get(address)) is not None:
+            slot.connected = True
+
+    @callback
+    def async_release(self, address: str) -> None:
+        """Free the slot of `address` after a failed attempt or disconnect."""
+        if self._slots.pop(address, None) is not None:
+            self._async_dispatch()
+
+    @callback
+    def _async_remove_request(self, request: _Request) -> None:
+        if request in self._queue:
+            self._queue.remove(request)
+            heapq.heapify(self._queue)
+        if not request.future.done():
+            request.future.cancel()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Grant slots to waiting requests in priority order."""
+        waiting: list[_Request] = []
+        while self._queue:
+            request = heapq.heappop(self._queue)
+            if request.future.done():
+                continue
+            try:
+                device = self._async_pick_device(request.address)
+            except BookooDeviceNotFound as ex:
+                request.future.set_exception(ex)
+                continue
+            if device is None:
+                waiting.append(request)
+                continue
+            source = device.scanner.source
+            _LOGGER.debug(
+                "Granting connection slot on %s to %s", source, request.address
+            )
+            self._slots[request.address] = _Slot(source, request.priority)
+            self.granted += 1
+            request.future.set_result(device.ble_device)
+        for request in waiting:
+            heapq.heappush(self._queue, request)
+
+    @callback
+    def _async_pick_device(self, address: str) -> BluetoothScannerDevice | None:
+        """Return the device as seen by the best adapter with a free slot."""
+        devices = async_scanner_devices_by_address(self.hass, address, connectable=True)
+        if not devices:
+            raise BookooDeviceNotFound(f"Scale {address} is not in range")
+        for device in sorted(
+            devices, key=lambda device: device.advertisement.rssi, reverse=True
+        ):
+            if self._async_free_slots(device.scanner.source) > 0:
+                return device
+        return None
+
+    @callback
+    def _async_free_slots(self, source: str) -> int:
+        """Return the slots on `source` that can still be granted."""
+        held = [slot for slot in self._slots.values() if slot.source == source]
+        if (allocations := self._async_allocations(source)) is None:
+            return DEFAULT_ADAPTER_SLOTS - len(held)
+        # the adapter reports established links only
+        return allocations.free - sum(not slot.connected for slot in held)
+
+    @callback
+    def _async_allocations(self, source: str) -> HaBluetoothSlotAllocations | None:
+        manager = get_manager()
+        if not hasattr(manager, "async_current_allocations"):
+            return None
+        allocations = manager.async_current_allocations(source)
+        return allocations[0] if allocations else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return slots and queue, e.g. for diagnostics."""
+        now = time.monotonic()
+        sources = {slot.source for slot in self._slots.values()}
+        return {
+            "granted": self.granted,
+            "timeouts": self.timeouts,
+            "slots": {
+                address: {
+                    "source": slot.source,
+                    "priority": slot.priority,
+                    "connected": slot.connected,
+                }
+                for address, slot in self._slots.items()
+            },
+            "queue": [
+                {
+                    "address": request.address,
+                    "priority": request.priority,
+                    "waiting": round(now - request.queued_at, 3),
+                }
+                for request in sorted(self._queue)
+            ],
+            "free_slots": {
+                source: self._async_free_slots(source) for source in sources
+            },
+        }
@@ -2,3 +2,58 @@
 
 DOMAIN = "bookoo"
 CONF_IS_VALID_SCALE = "is_valid_scale"
+
+EVENT_SHOT_COMPLETED = "bookoo_shot_completed"
+EVENT_TARGET_WEIGHT_REACHED = "bookoo_target_weight_reached"
+
+# maximum state writes per second for the streaming sensors, 0 = unlimited
+CONF_MAX_RATE_WEIGHT = "max_rate_weight"
+CONF_MAX_RATE_FLOW_RATE = "max_rate_flow_rate"
+CONF_MAX_RATE_TIMER = "max_rate_timer"
+DEFAULT_MAX_RATE = 0.0
+# sensor key -> option, the estimator sensors share the weight and flow limits
+RATE_LIMIT_OPTIONS = {
+    "weight": CONF_MAX_RATE_WEIGHT,
+    "flow_rate": CONF_MAX_RATE_FLOW_RATE,
+    "timer": CONF_MAX_RATE_TIMER,
+    "estimated_flow_rate": CONF_MAX_RATE_FLOW_RATE,
+    "settled_weight": CONF_MAX_RATE_WEIGHT,
+}
+
+# host-side Kalman estimate of weight and flow
+CONF_FLOW_ESTIMATOR = "flow_estimator"
+CONF_PROCESS_NOISE = "process_noise"
+CONF_MEASUREMENT_NOISE = "measurement_noise"
+DEFAULT_FLOW_ESTIMATOR = True
+
+# what the predictive stop does when the target weight is about to be reached
+CONF_TARGET_ACTION = "target_action"
+TARGET_ACTION_STOP_TIMER = "stop_timer"
+TARGET_ACTION_EVENT = "event"
+TARGET_ACTIONS = [TARGET_ACTION_STOP_TIMER, TARGET_ACTION_EVENT]
+DEFAULT_TARGET_ACTION = TARGET_ACTION_STOP_TIMER
+
+# ingest path latency histograms, off by default
+CONF_INSTRUMENTATION = "instrumentation"
+DEFAULT_INSTRUMENTATION = False
+
+# release the BLE connection after this many idle seconds, 0 = never
+CONF_IDLE_RELEASE = "idle_release"
+DEFAULT_IDLE_RELEASE = 0
+CONNECTION_STATE_CONNECTED = "connected"
+CONNECTION_STATE_SLEEPING = "sleeping"
+CONNECTION_STATE_DISCONNECTED = "disconnected"
+CONNECTION_STATES = [
+    CONNECTION_STATE_CONNECTED,
+    CONNECTION_STATE_SLEEPING,
+    CONNECTION_STATE_DISCONNECTED,
+]
+
+SERVICE_SET_TARGET_WEIGHT = "set_target_weight"
+SERVICE_SEND_COMMAND = "send_command"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_TARGET_WEIGHT = "target_weight"
+ATTR_COMMAND = "command"
+ATTR_CONFIRM = "confirm"
+# set on entities whose value was restored and not yet confirmed by the scale
+ATTR_STALE = "stale"
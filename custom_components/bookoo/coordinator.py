@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Mapping
+from dataclasses import asdict
+from datetime import datetime, timedelta
 import logging
+from pathlib import Path
+import time
+from typing import Any
 
-from aiobookoo_ultra.bookooscale import BookooScale
-from aiobookoo_ultra.exceptions import BookooDeviceNotFound, BookooError
-from bleak.backends.device import BLEDevice
-from bleak.exc import BleakError
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
-from bleak_retry_connector import BleakNotFoundError, BleakOutOfConnectionSlotsError
+from aiobookoo_ultra.bookooscale import (
+    RESTORABLE_FIELDS,
+    BookooDeviceState,
+    BookooScale,
+)
+from aiobookoo_ultra.connection import DisconnectedCallback, establish
+from aiobookoo_ultra.const import BookooField, UnitMass
+from aiobookoo_ultra.estimator import (
+    DEFAULT_MEASUREMENT_NOISE,
+    DEFAULT_PROCESS_NOISE,
+    FlowEstimator,
+)
+from aiobookoo_ultra.history import HistoryWindow
+from aiobookoo_ultra.metrics import IngestMetrics
+from aiobookoo_ultra.session import ShotSummary
+from aiobookoo_ultra.exceptions import BookooError
+from bleak import BleakClient, BLEDevice
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+    async_address_present,
+    async_last_service_info,
+    async_register_callback,
+    async_track_unavailable,
+)
 try:
     from homeassistant.components.bluetooth import (
         async_register_bleak_retry_connector,
@@ -21,13 +47,59 @@ except ImportError:
     async_register_bleak_retry_connector = None
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import CONF_IS_VALID_SCALE
+from .capabilities import BookooCapability, resolve_capabilities
+from .connection_scheduler import (
+    DATA_CONNECTION_SCHEDULER,
+    PRIORITY_COMMAND,
+    PRIORITY_RECONNECT,
+    PRIORITY_SHOT,
+)
+from .const import (
+    CONF_FLOW_ESTIMATOR,
+    CONF_IDLE_RELEASE,
+    CONF_INSTRUMENTATION,
+    CONF_IS_VALID_SCALE,
+    CONF_MEASUREMENT_NOISE,
+    CONF_PROCESS_NOISE,
+    CONF_TARGET_ACTION,
+    CONNECTION_STATE_CONNECTED,
+    CONNECTION_STATE_DISCONNECTED,
+    CONNECTION_STATE_SLEEPING,
+    DEFAULT_FLOW_ESTIMATOR,
+    DEFAULT_IDLE_RELEASE,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_MAX_RATE,
+    DEFAULT_TARGET_ACTION,
+    DOMAIN,
+    EVENT_SHOT_COMPLETED,
+    EVENT_TARGET_WEIGHT_REACHED,
+    RATE_LIMIT_OPTIONS,
+    TARGET_ACTION_STOP_TIMER,
+)
+from .predictive_stop import BookooPredictiveStop
+from .shot_store import BookooShotStore, ShotRecord
+from .throttle import BookooWriteThrottle
 
-SCAN_INTERVAL = timedelta(seconds=5)
+# fallback poll while disconnected, reconnects are driven by advertisements
+SCAN_INTERVAL = timedelta(seconds=60)
+# refresh of entities without scale fields (link, metrics) while connected
+STATISTICS_INTERVAL = timedelta(seconds=5)
+# how often the event loop lag is sampled while instrumentation is on
+LOOP_PROBE_INTERVAL = 0.5
+GATT_STORAGE_VERSION = 1
+# last device state and readings, written at most once per delay
+STATE_STORAGE_VERSION = 1
+STATE_SAVE_DELAY = 30  # seconds
+# weight changes below this do not count as activity for the idle release
+IDLE_WEIGHT_TOLERANCE = 0.5  # grams
+_ACTIVITY_FIELDS = BookooField.WEIGHT | BookooField.TIMER | BookooField.SHOT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,9 +126,41 @@ class BookooCoordinator(DataUpdateCoordinator[None]):
             address_or_ble_device=self._address,
             name=entry.title,
             is_valid_scale=entry.data[CONF_IS_VALID_SCALE],
-            notify_callback=self.async_update_listeners,
+            notify_callback=self._async_handle_scale_update,
         )
-        self._client: BleakClientWithServiceCache | None = None
+        # library accessors of the settings, entities call them directly
+        self.capabilities: dict[str, BookooCapability] = resolve_capabilities(
+            self._scale
+        )
+        # slots are shared with the other scales, see connection_scheduler
+        self._scheduler = hass.data[DATA_CONNECTION_SCHEDULER]
+        self._scale.connection.connector = self._async_establish
+        self._background_connect = False
+        self.write_throttle = BookooWriteThrottle(hass)
+        unique_id = format_mac(self._address).replace(":", "")
+        self.shot_store = BookooShotStore(
+            Path(hass.config.path(DOMAIN, "shots", unique_id))
+        )
+        self.predictive_stop = BookooPredictiveStop(hass, unique_id)
+        # resolved GATT handles, reconnects after a restart skip the lookup
+        self._gatt_store: Store[dict[str, int]] = Store(
+            hass, GATT_STORAGE_VERSION, f"{DOMAIN}.{unique_id}.gatt"
+        )
+        self._stored_handles: dict[str, int] = {}
+        # warm start, entities show the last values until the scale reports
+        self._state_store: Store[dict[str, Any]] = Store(
+            hass, STATE_STORAGE_VERSION, f"{DOMAIN}.{unique_id}.state"
+        )
+        self._state_save_pending = False
+        self._target_action = DEFAULT_TARGET_ACTION
+        self._cancel_loop_probe: CALLBACK_TYPE | None = None
+        self._cancel_statistics: CALLBACK_TYPE | None = None
+        # idle release: the link is dropped after this many quiet seconds
+        self._idle_release: float = DEFAULT_IDLE_RELEASE
+        self._activity_at = time.monotonic()
+        self._activity_weight: float | None = None
+        self.sleeping = False
+        self.async_apply_options(entry.options)
         self._async_register_bleak_connector(entry)
 
     @property
@@ -64,96 +168,447 @@ class BookooCoordinator(DataUpdateCoordinator[None]):
         """Return the scale object."""
         return self._scale
 
-    async def _async_update_data(self) -> None:
-        """Fetch data."""
+    @property
+    def metrics(self) -> IngestMetrics | None:
+        """Return the ingest path metrics, None unless instrumentation is on."""
+        return self._scale.metrics
 
-        # scale is already connected, return
+    @property
+    def connection_state(self) -> str:
+        """Return whether the scale is connected, released while idle or gone."""
         if self._scale.connected:
+            return CONNECTION_STATE_CONNECTED
+        if self.sleeping:
+            return CONNECTION_STATE_SLEEPING
+        return CONNECTION_STATE_DISCONNECTED
+
+    @property
+    def suppressed_updates(self) -> int:
+        """Return the number of state writes dropped by rate limiting."""
+        return self.write_throttle.suppressed_total
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply rate limits and estimator settings from the entry options."""
+        for key, option in RATE_LIMIT_OPTIONS.items():
+            self.write_throttle.async_set_max_rate(
+                key, options.get(option, DEFAULT_MAX_RATE)
+            )
+
+        self._target_action = options.get(CONF_TARGET_ACTION, DEFAULT_TARGET_ACTION)
+        self._idle_release = options.get(CONF_IDLE_RELEASE, DEFAULT_IDLE_RELEASE)
+        self._async_set_instrumentation(
+            options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+        )
+
+        if not options.get(CONF_FLOW_ESTIMATOR, DEFAULT_FLOW_ESTIMATOR):
+            self._scale.estimator = None
+            return
+        process_noise = options.get(CONF_PROCESS_NOISE, DEFAULT_PROCESS_NOISE)
+        measurement_noise = options.get(
+            CONF_MEASUREMENT_NOISE, DEFAULT_MEASUREMENT_NOISE
+        )
+        if (estimator := self._scale.estimator) is None:
+            self._scale.estimator = FlowEstimator(process_noise, measurement_noise)
+        else:
+            estimator.process_noise = process_noise
+            estimator.measurement_noise = measurement_noise
+
+    @callback
+    def _async_set_instrumentation(self, enabled: bool) -> None:
+        """Start or stop collecting ingest path metrics."""
+        if not enabled:
+            self._scale.metrics = None
+            if self._cancel_loop_probe is not None:
+                self._cancel_loop_probe()
+                self._cancel_loop_probe = None
             return
+        if self._scale.metrics is None:
+            self._scale.metrics = IngestMetrics()
+        if self._cancel_loop_probe is None:
+            self._async_schedule_loop_probe()
+
+    @callback
+    def _async_schedule_loop_probe(self) -> None:
+        """Schedule the next event loop lag sample."""
+        loop = self.hass.loop
+        due = loop.time() + LOOP_PROBE_INTERVAL
+        self._cancel_loop_probe = loop.call_at(
+            due, self._async_loop_probe, due
+        ).cancel
+
+    @callback
+    def _async_loop_probe(self, due: float) -> None:
+        """Record how late the event loop ran the probe."""
+        if (metrics := self._scale.metrics) is None:
+            self._cancel_loop_probe = None
+            return
+        metrics.event_loop_lag.record(self.hass.loop.time() - due)
+        self._async_schedule_loop_probe()
+
+    async def _async_setup(self) -> None:
+        """Restore stored state and watch for advertisements."""
+        await self.predictive_stop.async_load()
+        if handles := await self._gatt_store.async_load():
+            self._stored_handles = dict(handles)
+            self._scale.gatt_handles = dict(handles)
+        await self._async_restore_state()
+        self._scheduler.async_start()
+        self.config_entry.async_on_unload(
+            async_register_callback(
+                self.hass,
+                self._async_handle_advertisement,
+                BluetoothCallbackMatcher(address=self._address, connectable=True),
+                BluetoothScanningMode.PASSIVE,
+            )
+        )
+        self.config_entry.async_on_unload(
+            async_track_unavailable(
+                self.hass,
+                self._async_handle_unavailable,
+                self._address,
+                connectable=True,
+            )
+        )
 
-        if self._client and self._client.is_connected:
-            self._sync_scale_client(self._client)
-            if hasattr(self._scale, "attach_client"):
-                await self._scale.attach_client(self._client, setup_tasks=False)
+    async def _async_restore_state(self) -> None:
+        """Preload the scale with the values stored before the restart."""
+        if (data := await self._state_store.async_load()) is None:
+            return
+        device_state = None
+        if (stored := data.get("device_state")) is not None:
+            try:
+                device_state = BookooDeviceState(
+                    **{**stored, "units": UnitMass(stored["units"])}
+                )
+            except (KeyError, TypeError, ValueError) as ex:
+                _LOGGER.debug("Ignoring stored device state %s: %s", stored, ex)
+        self._scale.restore(
+            device_state,
+            weight=data.get("weight"),
+            timer=data.get("timer"),
+            flow_rate=data.get("flow_rate"),
+        )
+
+    @callback
+    def _async_schedule_state_save(self) -> None:
+        """Write the current values once the delay has passed."""
+        if self._state_save_pending:
+            return
+        self._state_save_pending = True
+        self._state_store.async_delay_save(self._state_to_store, STATE_SAVE_DELAY)
+
+    @callback
+    def _state_to_store(self) -> dict[str, Any]:
+        self._state_save_pending = False
+        scale = self._scale
+        return {
+            "device_state": (
+                asdict(scale.device_state) if scale.device_state is not None else None
+            ),
+            "weight": scale.weight,
+            "timer": scale.timer,
+            "flow_rate": scale.flow_rate,
+        }
+
+    @callback
+    def async_set_target_weight(self, target: float | None) -> None:
+        """Set the target weight of the predictive stop."""
+        self.predictive_stop.async_set_target(target)
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel trailing writes, statistics refresh and loop probe."""
+        self._async_set_link_healthy(False)
+        self._scheduler.async_release(self._address)
+        await super().async_shutdown()
+        self.write_throttle.async_cancel()
+        self._async_set_instrumentation(False)
+
+    @callback
+    def _async_handle_scale_update(self, changed: BookooField) -> None:
+        """Only update listeners subscribed to one of the changed fields."""
+        if (metrics := self._scale.metrics) is not None:
+            metrics.callback_dispatched(time.monotonic())
+        if changed & BookooField.SHOT and (shot := self._scale.last_shot):
+            self.hass.bus.async_fire(
+                EVENT_SHOT_COMPLETED,
+                {
+                    CONF_ADDRESS: self._address,
+                    CONF_NAME: self.config_entry.title,
+                    **shot.as_dict(),
+                },
+            )
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_store_shot(shot), "bookoo_store_shot"
+            )
+        if changed & BookooField.CONNECTION:
+            if self._scale.connected:
+                self._scheduler.async_connected(self._address)
+                self.sleeping = False
+                self._async_mark_activity()
+                self._async_store_gatt_handles()
             else:
-                await self._scale.connect(setup_tasks=False)
-            self._ensure_process_queue_task()
+                self._scheduler.async_release(self._address)
+            self._async_set_link_healthy(self._scale.connected)
+        if changed & RESTORABLE_FIELDS and not self._scale.stale:
+            self._async_schedule_state_save()
+        if self._idle_release and changed & _ACTIVITY_FIELDS:
+            self._async_track_activity(changed)
+        if changed & BookooField.WEIGHT:
+            self._async_check_target_weight()
+        for update_callback, fields in list(self._listeners.values()):
+            if fields is None or fields & changed:
+                update_callback()
+
+    @callback
+    def _async_store_gatt_handles(self) -> None:
+        """Persist the GATT handles if the connection resolved new ones."""
+        handles = self._scale.gatt_handles
+        if not handles or handles == self._stored_handles:
+            return
+        self._stored_handles = dict(handles)
+        self._gatt_store.async_delay_save(lambda: self._stored_handles, 0)
+
+    @callback
+    def _async_track_activity(self, changed: BookooField) -> None:
+        """Restart the idle period on timer changes or a weight change."""
+        if changed & (BookooField.TIMER | BookooField.SHOT):
+            self._async_mark_activity()
+            return
+        weight = self._scale.weight
+        if (
+            weight is not None
+            and self._activity_weight is not None
+            and abs(weight - self._activity_weight) <= IDLE_WEIGHT_TOLERANCE
+        ):
+            return
+        self._async_mark_activity()
+
+    @callback
+    def _async_mark_activity(self) -> None:
+        self._activity_at = time.monotonic()
+        self._activity_weight = self._scale.weight
+
+    @callback
+    def _async_check_idle(self) -> None:
+        """Release the connection once the scale has been idle long enough."""
+        scale = self._scale
+        if not self._idle_release or not scale.connected or self.sleeping:
             return
+        if (
+            scale.commands_pending
+            or scale.shot_detector.active
+            or self.predictive_stop.settling
+        ):
+            self._async_mark_activity()
+            return
+        if time.monotonic() - self._activity_at < self._idle_release:
+            return
+        _LOGGER.debug(
+            "Releasing connection to idle scale %s after %s s",
+            self._address,
+            self._idle_release,
+        )
+        self.sleeping = True
+        self.config_entry.async_create_background_task(
+            self.hass, scale.disconnect(), "bookoo_idle_release"
+        )
+
+    @callback
+    def _async_handle_unavailable(
+        self, _service_info: BluetoothServiceInfoBleak
+    ) -> None:
+        """Wake up from sleeping once the scale stopped advertising."""
+        if not self.sleeping:
+            return
+        # the next advertisement comes from a scale that was switched on again
+        self.sleeping = False
+        self.async_update_listeners()
+
+    @callback
+    def _async_check_target_weight(self) -> None:
+        """Stop the shot when the extrapolated weight reaches the target."""
+        scale = self._scale
+        flow_rate = scale.estimated_flow_rate
+        if flow_rate is None:
+            flow_rate = scale.flow_rate
+        if (weight := scale.weight) is None or flow_rate is None:
+            return
+        stop = self.predictive_stop
+        if not stop.async_update(
+            time.monotonic(), weight, flow_rate, scale.shot_detector.active
+        ):
+            return
+
+        _LOGGER.debug(
+            "Target %.1f g reached at %.1f g, %.2f g/s, latency %.2f s",
+            stop.target,
+            weight,
+            flow_rate,
+            stop.latency,
+        )
+        if self._target_action == TARGET_ACTION_STOP_TIMER:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_stop_timer(), "bookoo_target_stop"
+            )
+            return
+        self.hass.bus.async_fire(
+            EVENT_TARGET_WEIGHT_REACHED,
+            {
+                CONF_ADDRESS: self._address,
+                CONF_NAME: self.config_entry.title,
+                "target": stop.target,
+                "weight": weight,
+                "flow_rate": flow_rate,
+                "latency": stop.latency,
+            },
+        )
+
+    async def _async_stop_timer(self) -> None:
+        """Stop the device timer for the predictive stop."""
+        try:
+            await self._scale.stop_timer()
+        except BookooError as ex:
+            _LOGGER.warning("Could not stop the timer at the target weight: %s", ex)
+
+    async def _async_store_shot(self, shot: ShotSummary) -> None:
+        """Write a completed shot to the trace store."""
+        try:
+            await self.hass.async_add_executor_job(self.shot_store.append, shot)
+        except OSError as ex:
+            _LOGGER.warning("Could not store shot trace: %s", ex)
+
+    async def async_list_shots(self, limit: int | None = None) -> list[ShotRecord]:
+        """Return the stored shots, newest first."""
+        return await self.hass.async_add_executor_job(
+            self.shot_store.list_shots, limit
+        )
+
+    async def async_load_shot_trace(self, shot_id: int) -> HistoryWindow:
+        """Load the trace of a stored shot."""
+        return await self.hass.async_add_executor_job(
+            self.shot_store.load_trace, shot_id
+        )
+
+    async def _async_update_data(self) -> None:
+        """Fetch data."""
 
-        if not (ble_device := async_ble_device_from_address(
-            self.hass, self._address, connectable=True
-        )):
+        if service_info := async_last_service_info(
+            self.hass, self._address, connectable=False
+        ):
+            self._scale.link.rssi = service_info.rssi
+
+        # scale is already connected, e.g. by a command
+        if self._scale.connected:
+            self._async_set_link_healthy(True)
+            return
+        # released while idle, a command or a power cycle reconnects
+        if self.sleeping:
+            return
+
+        if not async_address_present(self.hass, self._address, connectable=True):
             _LOGGER.debug("No BLE device available for %s", self._address)
             return
 
-        await self._async_establish_link(ble_device)
-        if self._client and self._client.is_connected:
-            if hasattr(self._scale, "attach_client"):
-                await self._scale.attach_client(self._client, setup_tasks=False)
-            else:
-                await self._scale.connect(setup_tasks=False)
-            self._ensure_process_queue_task()
+        # in the background, so neither setup nor the poll wait for the
+        # connect timeout of a scale that is switched off
+        self._async_start_connect()
 
-    async def _async_establish_link(self, ble_device: BLEDevice) -> None:
-        """Establish the BLE link via the retry connector."""
+    @callback
+    def _async_handle_advertisement(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Connect as soon as the scale advertises, unless backing off."""
+        self._scale.link.rssi = service_info.rssi
+        self._async_start_connect()
+
+    @callback
+    def _async_start_connect(self) -> None:
+        """Start a connection attempt in the background if none is due."""
+        scale = self._scale
+        connection = scale.connection
+        if (
+            scale.connected
+            or self.sleeping
+            or connection.connecting
+            or connection.backoff
+        ):
+            return
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_connect(), "bookoo_connect"
+        )
+
+    async def _async_connect(self) -> None:
+        """Connect the scale, joining an attempt a command already started."""
+        self._background_connect = True
         try:
-            try:
-                self._client = await establish_connection(
-                    BleakClientWithServiceCache,
-                    ble_device,
-                    disconnected_callback=self._async_handle_link_loss,
-                    name="bookoo",
-                    timeout=20.0,
-                )
-            except TypeError:
-                self._client = await establish_connection(
-                    ble_device,
-                    disconnected_callback=self._async_handle_link_loss,
-                    name="bookoo",
-                    timeout=20.0,
-                )
-        except (
-            BleakError,
-            BleakNotFoundError,
-            BleakOutOfConnectionSlotsError,
-            BookooDeviceNotFound,
-            BookooError,
-            TimeoutError,
-        ) as ex:
+            await self._scale.connect(setup_tasks=False)
+        except BookooError as ex:
             _LOGGER.debug(
                 "Could not establish BLE link to scale: %s, Error: %s",
-                self.config_entry.data[CONF_ADDRESS],
+                self._address,
                 ex,
             )
             self._scale.device_disconnected_handler(notify=False)
-            self._client = None
             return
+        finally:
+            self._background_connect = False
+        if self._scale.connected:
+            self._ensure_process_queue_task()
+
+    async def _async_establish(
+        self, _device: str | BLEDevice, disconnected_callback: DisconnectedCallback
+    ) -> BleakClient:
+        """Connect through the adapter the connection scheduler grants."""
+        if self._scale.shot_detector.active:
+            priority = PRIORITY_SHOT
+        elif self._background_connect:
+            priority = PRIORITY_RECONNECT
+        else:
+            priority = PRIORITY_COMMAND
+        # the connect hook runs after this returns and can still fail
+        if (attempt := asyncio.current_task()) is not None:
+            attempt.add_done_callback(self._async_attempt_done)
+        ble_device = await self._scheduler.async_acquire(self._address, priority)
+        return await establish(ble_device, disconnected_callback)
 
-        self._scale.address_or_ble_device = ble_device
-        self._sync_scale_client(self._client)
+    @callback
+    def _async_attempt_done(self, _attempt: asyncio.Task[Any]) -> None:
+        """Free the connection slot unless the attempt left the scale connected."""
+        if not self._scale.connected:
+            self._scheduler.async_release(self._address)
 
-    def _sync_scale_client(self, client: BleakClientWithServiceCache | None) -> None:
-        """Ensure the scale uses the established BLE client."""
-        if client is None:
+    @callback
+    def _async_set_link_healthy(self, healthy: bool) -> None:
+        """Stop polling while connected, resume the fallback poll otherwise."""
+        if healthy == (self._cancel_statistics is not None):
+            return
+        if healthy:
+            self.update_interval = None
+            self._cancel_statistics = async_track_time_interval(
+                self.hass, self._async_handle_connected_interval, STATISTICS_INTERVAL
+            )
             return
+        self._cancel_statistics()
+        self._cancel_statistics = None
+        self.update_interval = SCAN_INTERVAL
+        self._schedule_refresh()
 
-        for attr_name in ("client", "_client", "bleak_client", "_bleak_client"):
-            if hasattr(self._scale, attr_name):
-                setattr(self._scale, attr_name, client)
-        if ble_device := async_ble_device_from_address(
-            self.hass, self._address, connectable=True
-        ):
-            for attr_name in ("device", "_device", "ble_device", "_ble_device"):
-                if hasattr(self._scale, attr_name):
-                    setattr(self._scale, attr_name, ble_device)
+    @callback
+    def _async_handle_connected_interval(self, _now: datetime) -> None:
+        """Check for idleness and update entities that follow no scale field."""
+        self._async_check_idle()
+        for update_callback, fields in list(self._listeners.values()):
+            if fields is None or fields == BookooField.CONNECTION:
+                update_callback()
 
     @callback
-    def _async_handle_link_loss(
-        self, _client: BleakClientWithServiceCache | None = None
-    ) -> None:
+    def _async_handle_link_loss(self, _client: BleakClient | None = None) -> None:
         """Handle link losses triggered by the retry connector."""
         self._scale.device_disconnected_handler(notify=False)
-        self._client = None
+        self._scheduler.async_release(self._address)
+        self._async_set_link_healthy(False)
 
     def _ensure_process_queue_task(self) -> None:
         """Ensure the processing queue task is running."""
@@ -8,6 +8,8 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 
 from . import BookooConfigEntry
+from .connection_scheduler import DATA_CONNECTION_SCHEDULER
+from .shot_store import BookooShotStore
 
 
 async def async_get_config_entry_diagnostics(
@@ -28,4 +30,47 @@ async def async_get_config_entry_diagnostics(
         "last_disconnect_time": scale.last_disconnect_time,
         "timer": scale.timer,
         "weight": scale.weight,
+        "stale": scale.stale,
+        "history": {"samples": len(scale.history), "capacity": scale.history.capacity},
+        "capabilities": {
+            key: capability.as_dict()
+            for key, capability in coordinator.capabilities.items()
+        },
+        "connection_state": coordinator.connection_state,
+        "connection": scale.connection.as_dict(),
+        "gatt_handles": scale.gatt_handles,
+        "time_to_first_frame": scale.time_to_first_frame,
+        "connection_scheduler": hass.data[DATA_CONNECTION_SCHEDULER].as_dict(),
+        "reassembler": scale.reassembler.as_dict(),
+        "link": scale.link.as_dict(),
+        "clock": scale.clock.as_dict(),
+        "estimator": (
+            {
+                "process_noise": estimator.process_noise,
+                "measurement_noise": estimator.measurement_noise,
+                "flow_rate": estimator.flow_rate,
+                "settled_weight": estimator.settled_weight,
+            }
+            if (estimator := scale.estimator) is not None
+            else None
+        ),
+        "predictive_stop": coordinator.predictive_stop.as_dict(),
+        "ingest_metrics": (
+            metrics.as_dict() if (metrics := coordinator.metrics) is not None else None
+        ),
+        "suppressed_updates": dict(coordinator.write_throttle.suppressed),
+        "shot_store": await hass.async_add_executor_job(
+            _shot_store_diagnostics, coordinator.shot_store
+        ),
     }
+
+
+def _shot_store_diagnostics(store: BookooShotStore) -> dict[str, Any]:
+    """Summarize the shot store without loading any trace."""
+    try:
+        return {
+            **store.usage(),
+            "recent": [record.as_dict() for record in store.list_shots(limit=5)],
+        }
+    except (OSError, ValueError) as ex:
+        return {"error": str(ex)}
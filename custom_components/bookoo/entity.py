@@ -1,6 +1,10 @@
 """Base class for Bookoo entities."""
 
 from dataclasses import dataclass
+from typing import Any
+
+from aiobookoo_ultra.bookooscale import RESTORABLE_FIELDS
+from aiobookoo_ultra.const import BookooField
 
 from homeassistant.helpers.device_registry import (
     CONNECTION_BLUETOOTH,
@@ -10,10 +14,19 @@ from homeassistant.helpers.device_registry import (
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTR_STALE, DOMAIN
 from .coordinator import BookooCoordinator
 
 
+@dataclass(kw_only=True, frozen=True)
+class BookooEntityDescription(EntityDescription):
+    """Common description for Bookoo entities."""
+
+    # scale fields whose changes trigger a state write; connection changes
+    # are always delivered
+    update_fields: BookooField = BookooField.NONE
+
+
 @dataclass
 class BookooEntity(CoordinatorEntity[BookooCoordinator]):
     """Common elements for all entities."""
@@ -23,12 +36,15 @@ class BookooEntity(CoordinatorEntity[BookooCoordinator]):
     def __init__(
         self,
         coordinator: BookooCoordinator,
-        entity_description: EntityDescription,
+        entity_description: BookooEntityDescription,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, entity_description.update_fields | BookooField.CONNECTION
+        )
         self.entity_description = entity_description
         self._scale = coordinator.scale
+        self._restored = bool(entity_description.update_fields & RESTORABLE_FIELDS)
         formatted_mac = format_mac(self._scale.mac)
         self._attr_unique_id = f"{formatted_mac}_{entity_description.key}"
 
@@ -40,7 +56,19 @@ class BookooEntity(CoordinatorEntity[BookooCoordinator]):
             connections={(CONNECTION_BLUETOOTH, self._scale.mac)},
         )
 
+    @property
+    def _stale(self) -> bool:
+        """Return True while the value is restored, not yet from the scale."""
+        return self._restored and self._scale.stale
+
     @property
     def available(self) -> bool:
-        """Returns whether entity is available."""
-        return super().available and self._scale.connected
+        """Return True while connected, released while idle or restored."""
+        return super().available and (
+            self._scale.connected or self.coordinator.sleeping or self._stale
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag restored values until the scale confirms them."""
+        return {ATTR_STALE: True} if self._stale else None
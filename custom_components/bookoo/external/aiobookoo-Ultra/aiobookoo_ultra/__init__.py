@@ -1,19 +1,31 @@
 """Offizielles Package für das Bookoo-Themis-Ultra-Protokoll."""
 
-from .bookooscale import BookooDeviceState, BookooScale
+from .bookooscale import RESTORABLE_FIELDS, BookooDeviceState, BookooScale
+from .clock import ClockAligner
+from .connection import BookooConnection
 from .const import (
+    BookooField,
     CHARACTERISTIC_UUID_COMMAND,
     CHARACTERISTIC_UUID_WEIGHT,
     CMD_BYTE1_PRODUCT_NUMBER,
     CMD_BYTE2_TYPE,
+    DEFAULT_HISTORY_SIZE,
     SCALE_START_NAMES,
     SERVICE_UUID,
     UnitMass,
     WEIGHT_BYTE1,
     WEIGHT_BYTE2,
 )
-from .decode import BookooMessage, decode
+from .decode import (
+    FRAME_LENGTH,
+    BookooMessage,
+    checksum_valid,
+    decode,
+    decode_frame,
+)
 from .exceptions import (
+    BookooChecksumMismatch,
+    BookooCommandNotConfirmed,
     BookooDeviceNotFound,
     BookooError,
     BookooMessageError,
@@ -22,22 +34,43 @@ from .exceptions import (
     BookooScaleException,
     BookooUnknownDevice,
 )
-from .helpers import find_bookoo_devices, is_bookoo_scale, scan
+from .estimator import FlowEstimator
+from .history import HistoryWindow, SampleHistory, WindowStats
+from .link import LinkQuality
+from .metrics import IngestMetrics, LatencyHistogram
+from .reassembler import FrameReassembler
+from .session import ShotDetector, ShotSummary, ShotTrigger
+from .helpers import (
+    find_bookoo_devices,
+    is_bookoo_advertisement,
+    is_bookoo_scale,
+    scan,
+)
 
 __all__ = [
+    "RESTORABLE_FIELDS",
     "BookooDeviceState",
     "BookooScale",
+    "ClockAligner",
+    "BookooConnection",
+    "BookooField",
     "CHARACTERISTIC_UUID_COMMAND",
     "CHARACTERISTIC_UUID_WEIGHT",
     "CMD_BYTE1_PRODUCT_NUMBER",
     "CMD_BYTE2_TYPE",
+    "DEFAULT_HISTORY_SIZE",
     "SCALE_START_NAMES",
     "SERVICE_UUID",
     "UnitMass",
     "WEIGHT_BYTE1",
     "WEIGHT_BYTE2",
+    "FRAME_LENGTH",
     "BookooMessage",
+    "checksum_valid",
     "decode",
+    "decode_frame",
+    "BookooChecksumMismatch",
+    "BookooCommandNotConfirmed",
     "BookooDeviceNotFound",
     "BookooError",
     "BookooMessageError",
@@ -45,7 +78,19 @@ __all__ = [
     "BookooMessageTooShort",
     "BookooScaleException",
     "BookooUnknownDevice",
+    "FlowEstimator",
+    "HistoryWindow",
+    "SampleHistory",
+    "WindowStats",
+    "IngestMetrics",
+    "LatencyHistogram",
+    "FrameReassembler",
+    "LinkQuality",
+    "ShotDetector",
+    "ShotSummary",
+    "ShotTrigger",
     "find_bookoo_devices",
+    "is_bookoo_advertisement",
     "is_bookoo_scale",
     "scan",
 ]
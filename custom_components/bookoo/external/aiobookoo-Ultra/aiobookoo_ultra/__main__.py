@@ -0,0 +1,156 @@
+"""Kommandozeile für aiobookoo_ultra.
+
+Beispiel: ``python -m aiobookoo_ultra decode capture.bin -o capture.csv``
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from contextlib import nullcontext
+import csv
+from pathlib import Path
+import sys
+from typing import BinaryIO
+
+from .decode import FRAME_LENGTH
+
+DEFAULT_CHUNK_FRAMES = 65536
+COLUMNS = ("index", "timer", "weight", "flow_rate", "battery", "unit", "bad")
+
+
+def _iter_chunks(source: BinaryIO, chunk_frames: int) -> Iterator[memoryview]:
+    """Yield whole frames from a capture file, `chunk_frames` at a time."""
+
+    buffer = bytearray(chunk_frames * FRAME_LENGTH)
+    view = memoryview(buffer)
+    filled = 0
+    while True:
+        size = source.readinto(view[filled:]) or 0
+        filled += size
+        if size and filled < len(buffer):
+            continue
+        usable = filled - filled % FRAME_LENGTH
+        if usable:
+            yield view[:usable]
+        if not size:
+            if usable != filled:
+                print(
+                    f"Ignoring {filled - usable} trailing bytes of an incomplete frame",
+                    file=sys.stderr,
+                )
+            return
+        filled = 0
+
+
+def _write_csv(batches, output: Path | None) -> tuple[int, int]:
+    """Stream decoded batches to CSV, stdout if no output is given."""
+
+    frames = bad = 0
+    with (
+        open(output, "w", newline="", encoding="utf-8")
+        if output is not None
+        else nullcontext(sys.stdout)
+    ) as target:
+        writer = csv.writer(target)
+        writer.writerow(COLUMNS)
+        for batch in batches:
+            writer.writerows(
+                zip(
+                    range(frames, frames + len(batch)),
+                    batch.timer.round(3).tolist(),
+                    batch.weight.round(2).tolist(),
+                    batch.flow_rate.round(2).tolist(),
+                    batch.battery.tolist(),
+                    batch.unit.tolist(),
+                    batch.bad.astype(int).tolist(),
+                    strict=True,
+                )
+            )
+            frames += len(batch)
+            bad += int(batch.bad.sum())
+    return frames, bad
+
+
+def _write_npz(batches, output: Path) -> tuple[int, int]:
+    """Collect decoded batches column-wise into a compressed `.npz`."""
+
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    columns: dict[str, list] = {name: [] for name in COLUMNS[1:]}
+    for batch in batches:
+        for name, parts in columns.items():
+            parts.append(getattr(batch, name))
+    arrays = {
+        name: np.concatenate(parts) for name, parts in columns.items() if parts
+    }
+    np.savez_compressed(output, **arrays)
+    frames = len(arrays["bad"]) if arrays else 0
+    bad = int(arrays["bad"].sum()) if arrays else 0
+    return frames, bad
+
+
+def _cmd_decode(args: argparse.Namespace) -> int:
+    """Decode a raw capture of concatenated 20-byte frames."""
+
+    try:
+        from .bulk import decode_many  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print("NumPy is required: pip install aiobookoo-ultra[numpy]", file=sys.stderr)
+        return 1
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "npz" if args.output and args.output.suffix == ".npz" else "csv"
+    if fmt == "npz" and args.output is None:
+        print("--output is required for the npz format", file=sys.stderr)
+        return 2
+
+    with open(args.input, "rb") as source:
+        batches = (
+            decode_many(chunk) for chunk in _iter_chunks(source, args.chunk_frames)
+        )
+        if fmt == "npz":
+            frames, bad = _write_npz(batches, args.output)
+        else:
+            frames, bad = _write_csv(batches, args.output)
+
+    print(f"Decoded {frames} frames, {bad} bad", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m aiobookoo_ultra``."""
+
+    parser = argparse.ArgumentParser(prog="python -m aiobookoo_ultra")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    decode_parser = commands.add_parser(
+        "decode", help="decode a raw capture of weight notifications"
+    )
+    decode_parser.add_argument("input", type=Path, help="capture file")
+    decode_parser.add_argument(
+        "-o", "--output", type=Path, help="output file (CSV to stdout if omitted)"
+    )
+    decode_parser.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "npz"),
+        help="output format (default: from the output suffix, else csv)",
+    )
+    decode_parser.add_argument(
+        "--chunk-frames",
+        type=int,
+        default=DEFAULT_CHUNK_FRAMES,
+        help=f"frames decoded per chunk (default: {DEFAULT_CHUNK_FRAMES})",
+    )
+    decode_parser.set_defaults(func=_cmd_decode)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "chunk_frames", 1) < 1:
+        parser.error("--chunk-frames must be positive")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,26 +12,77 @@ from dataclasses import dataclass
 
 from bleak import BleakClient, BleakGATTCharacteristic, BLEDevice
 from bleak.exc import BleakDeviceNotFoundError, BleakError
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from bleak_retry_connector import BleakClientWithServiceCache
 
 from .const import (
+    BookooField,
     CHARACTERISTIC_UUID_WEIGHT,
     CHARACTERISTIC_UUID_COMMAND,
     CMD_BYTE1_PRODUCT_NUMBER,
     CMD_BYTE2_TYPE,
+    DEFAULT_HISTORY_SIZE,
+    SERVICE_UUID,
     UnitMass,
+    WEIGHT_BYTE1,
+    WEIGHT_BYTE2,
 )
 from .exceptions import (
+    BookooCommandNotConfirmed,
     BookooDeviceNotFound,
     BookooError,
     BookooMessageError,
-    BookooMessageTooLong,
-    BookooMessageTooShort,
 )
-from .decode import BookooMessage, decode
+from .clock import ClockAligner
+from .commands import (
+    DEFAULT_CONFIRM_RETRIES,
+    DEFAULT_CONFIRM_TIMEOUT,
+    CommandScheduler,
+    Confirmation,
+    PendingConfirmation,
+    field_confirmation,
+    reset_confirmation,
+    start_confirmation,
+    stop_confirmation,
+    tare_and_start_confirmation,
+    tare_confirmation,
+)
+from .connection import BookooConnection
+from .decode import (
+    FRAME_LENGTH,
+    BookooMessage,
+    Payload,
+    checksum_valid,
+    decode_frame,
+)
+from .estimator import FlowEstimator
+from .history import SampleHistory
+from .link import LinkQuality
+from .metrics import IngestMetrics
+from .reassembler import FrameReassembler
+from .session import ShotDetector, ShotSummary
 
 _LOGGER = logging.getLogger("aiobookoo_ultra")
 
+_WEIGHT_HEADER = bytes((WEIGHT_BYTE1, WEIGHT_BYTE2))
+
+# plain ints for the per-frame change mask, wrapped once per notification
+_WEIGHT = BookooField.WEIGHT.value
+_FLOW_RATE = BookooField.FLOW_RATE.value
+_TIMER = BookooField.TIMER.value
+_BATTERY = BookooField.BATTERY.value
+_UNIT = BookooField.UNIT.value
+_BUZZER_GEAR = BookooField.BUZZER_GEAR.value
+_AUTO_OFF = BookooField.AUTO_OFF.value
+_FLOW_SMOOTHING = BookooField.FLOW_SMOOTHING.value
+_STOP_CONDITION = BookooField.STOP_CONDITION.value
+_SHOT = BookooField.SHOT.value
+_DEVICE_STATE_FIELDS = (
+    _BATTERY | _UNIT | _BUZZER_GEAR | _AUTO_OFF | _FLOW_SMOOTHING | _STOP_CONDITION
+)
+_RESTORABLE_FIELDS = _WEIGHT | _FLOW_RATE | _TIMER | _DEVICE_STATE_FIELDS
+# fields `restore` preloads, e.g. for callers that persist them
+RESTORABLE_FIELDS = BookooField(_RESTORABLE_FIELDS)
+
 
 @dataclass(kw_only=True)
 class BookooDeviceState:
@@ -61,22 +112,44 @@ class BookooScale:
         address_or_ble_device: str | BLEDevice,
         name: str | None = None,
         is_valid_scale: bool = True,
-        notify_callback: Callable[[], None] | None = None,
+        notify_callback: Callable[[BookooField], None] | None = None,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        estimator: FlowEstimator | None = None,
     ) -> None:
-        """Initialisiere die Waage."""
+        """Initialisiere die Waage.
+
+        `notify_callback` receives the fields that changed with each update,
+        `history_size` bounds the number of samples kept in `history` and
+        `estimator` optionally tracks weight and flow on the host.
+        """
 
         self._is_valid_scale = is_valid_scale
-        self._client: BleakClient | None = None
+        # owns the BleakClient, one connection attempt at a time
+        self.connection = BookooConnection(
+            address_or_ble_device,
+            on_connected=self._async_on_connected,
+            on_disconnected=self.device_disconnected_handler,
+        )
+        self._notification_callback: (
+            Callable[[BleakGATTCharacteristic, bytearray], Awaitable[None] | None]
+            | None
+        ) = None
 
-        self.address_or_ble_device = address_or_ble_device
         self.model = "Themis"
         self.name = name
 
         # tasks
         self.process_queue_task: asyncio.Task | None = None
 
+        # GATT handles by UUID, e.g. restored from storage; the characteristics
+        # resolved from them are reused for the writes of one connection
+        self.gatt_handles: dict[str, int] = {}
+        self._characteristics: dict[str, BleakGATTCharacteristic] = {}
+
         # connection diagnostics
         self.connected = False
+        self._connected_at: float | None = None
+        self.time_to_first_frame: float | None = None
         self._timestamp_last_command: float | None = None
         self.last_disconnect_time: float | None = None
 
@@ -86,14 +159,33 @@ class BookooScale:
         self._flow_rate: float | None = None
         self._flow_rate_smoothing: int | None = None
         self._stop_condition: int | None = None
-
-        # queue
-        self._queue: asyncio.Queue = asyncio.Queue()
-        self._add_to_queue_lock = asyncio.Lock()
+        # True while the values above come from `restore`, not the scale
+        self.stale = False
+        self.history = SampleHistory(history_size)
+        self.shot_detector = ShotDetector(self.history)
+        self._last_shot: ShotSummary | None = None
+        self.estimator = estimator
+        # receive/decode timestamps, only collected while set
+        self.metrics: IngestMetrics | None = None
+
+        # outgoing commands, time-critical ones first
+        self._commands = CommandScheduler()
+        # commands waiting for their effect to show up in the notifications
+        self._confirmations: list[PendingConfirmation] = []
+        self.confirm_timeout = DEFAULT_CONFIRM_TIMEOUT
+        self.confirm_retries = DEFAULT_CONFIRM_RETRIES
 
         self._last_short_msg: bytearray | None = None
+        # packet loss from the device timer, decode errors and RSSI
+        self.link = LinkQuality()
+        # collects frames from split or coalesced notifications
+        self.reassembler = FrameReassembler(self.link.decode_error)
+        # maps the device timer to host time for sample timestamps
+        self.clock = ClockAligner()
+        # reused for every notification to avoid per-frame allocations
+        self._message = BookooMessage()
 
-        self._notify_callback: Callable[[], None] | None = notify_callback
+        self._notify_callback: Callable[[BookooField], None] | None = notify_callback
 
         self._msg_types = {
             "tare": self._build_command(0x01),
@@ -103,6 +195,19 @@ class BookooScale:
             "tareAndStartTime": self._build_command(0x07),
         }
 
+    @property
+    def address_or_ble_device(self) -> str | BLEDevice:
+        """Return the address or BLE device used for new connections."""
+        return self.connection.device
+
+    @address_or_ble_device.setter
+    def address_or_ble_device(self, device: str | BLEDevice) -> None:
+        self.connection.device = device
+
+    @property
+    def _client(self) -> BleakClient | None:
+        return self.connection.client
+
     @property
     def mac(self) -> str:
         """Return the mac address of the scale in upper case."""
@@ -133,6 +238,48 @@ class BookooScale:
 
         return self._flow_rate
 
+    @property
+    def estimated_flow_rate(self) -> float | None:
+        """Return the host-side flow estimate, if an estimator is set."""
+        return self.estimator.flow_rate if self.estimator is not None else None
+
+    @property
+    def settled_weight(self) -> float | None:
+        """Return the filtered weight from the last still moment."""
+        return self.estimator.settled_weight if self.estimator is not None else None
+
+    @property
+    def commands_pending(self) -> bool:
+        """Return True while commands are queued or await confirmation."""
+        return not self._commands.idle or bool(self._confirmations)
+
+    def restore(
+        self,
+        device_state: BookooDeviceState | None,
+        weight: float | None = None,
+        timer: float | None = None,
+        flow_rate: float | None = None,
+    ) -> None:
+        """Preload last known values, e.g. from storage.
+
+        They are marked `stale` until the first frame replaces them; that
+        frame reports all restorable fields as changed, even those whose
+        value stayed the same.
+        """
+        self._device_state = device_state
+        self._weight = weight
+        self._timer = timer
+        self._flow_rate = flow_rate
+        if device_state is not None:
+            self._flow_rate_smoothing = device_state.flow_rate_smoothing
+            self._stop_condition = device_state.stop_condition
+        self.stale = True
+
+    @property
+    def last_shot(self) -> ShotSummary | None:
+        """Return the summary of the last completed shot."""
+        return self._last_shot
+
     def device_disconnected_handler(
         self,
         client: BleakClient | None = None,  # pylint: disable=unused-argument
@@ -147,16 +294,28 @@ class BookooScale:
 
         self.connected = False
         self.last_disconnect_time = time.time()
+        self._characteristics.clear()
+        self._connected_at = None
+        self.reassembler.clear()
+        self.link.reset_sequence()
+        self.clock.reset()
         self.async_empty_queue_and_cancel_tasks()
+        for pending in self._confirmations:
+            if not pending.future.done():
+                pending.future.set_exception(
+                    BookooError("Disconnected before confirmation")
+                )
         if notify and self._notify_callback:
-            self._notify_callback()
+            self._notify_callback(BookooField.CONNECTION)
 
     async def _write_msg(self, char_id: str, payload: bytearray) -> None:
         """Write to the device."""
         if self._client is None:
             raise BookooError("Client not initialized")
         try:
-            await self._client.write_gatt_char(char_id, payload)
+            await self._client.write_gatt_char(
+                self._characteristics.get(char_id, char_id), payload
+            )
             self._timestamp_last_command = time.time()
         except BleakDeviceNotFoundError as ex:
             self.connected = False
@@ -174,9 +333,7 @@ class BookooScale:
     def async_empty_queue_and_cancel_tasks(self) -> None:
         """Empty the queue."""
 
-        while not self._queue.empty():
-            self._queue.get_nowait()
-            self._queue.task_done()
+        self._commands.clear()
 
         if self.process_queue_task and not self.process_queue_task.done():
             self.process_queue_task.cancel()
@@ -189,16 +346,20 @@ class BookooScale:
                     self.async_empty_queue_and_cancel_tasks()
                     return
 
-                char_id, payload = await self._queue.get()
+                char_id, payload = await self._commands.get()
+                started = time.monotonic()
                 await self._write_msg(char_id, payload)
-                self._queue.task_done()
-                await asyncio.sleep(0.1)
+                written = time.monotonic()
+                self._commands.task_done(written - started)
+                if self._confirmations:
+                    self._command_written(payload, written)
 
             except asyncio.CancelledError:
                 self.connected = False
                 return
             except (BookooDeviceNotFound, BookooError) as ex:
                 self.connected = False
+                self._commands.clear()
                 _LOGGER.debug("Error writing to device: %s", ex)
                 return
 
@@ -221,6 +382,85 @@ class BookooScale:
         base.append(checksum)
         return base
 
+    def _queue_urgent(self, payload: bytearray) -> None:
+        """Queue a time-critical command ahead of configuration writes."""
+        self._commands.put_urgent((self._command_char_id, payload))
+
+    def _queue_config(self, payload: bytearray) -> None:
+        """Queue a configuration write, superseding a pending one of its kind.
+
+        Commands of the same kind still waiting for confirmation fail, so
+        their retries cannot write the older value over this one.
+        """
+        kind = payload[2]
+        for pending in self._confirmations:
+            if (
+                pending.payload is not payload
+                and pending.payload[2] == kind
+                and not pending.future.done()
+            ):
+                pending.future.set_exception(
+                    BookooCommandNotConfirmed(
+                        f"Command {pending.payload.hex()} superseded by"
+                        f" {payload.hex()}"
+                    )
+                )
+        self._commands.put_config(kind, (self._command_char_id, payload))
+
+    async def _send(
+        self,
+        payload: bytearray,
+        urgent: bool,
+        confirmation: Confirmation | None = None,
+    ) -> None:
+        """Queue a command and optionally wait until its effect is seen.
+
+        Without `confirmation` this returns once the command is queued.
+        Otherwise the command is resent up to `confirm_retries` times when
+        no frame received after the write satisfies `confirmation` within
+        `confirm_timeout` seconds. A configuration write fails early once a
+        newer one of its kind is queued.
+        """
+        queue = self._queue_urgent if urgent else self._queue_config
+        if confirmation is None:
+            queue(payload)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        pending = PendingConfirmation(confirmation, payload, future)
+        self._confirmations.append(pending)
+        try:
+            for attempt in range(self.confirm_retries + 1):
+                queue(payload)
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(future), self.confirm_timeout
+                    )
+                except TimeoutError:
+                    _LOGGER.debug(
+                        "Command %s not confirmed (attempt %s)",
+                        payload.hex(),
+                        attempt + 1,
+                    )
+                else:
+                    return
+        finally:
+            self._confirmations.remove(pending)
+        raise BookooCommandNotConfirmed(
+            f"Command {payload.hex()} not confirmed by the scale"
+        )
+
+    def _command_written(self, payload: bytearray, written: float) -> None:
+        """Start checking frames for the commands that sent `payload`."""
+        for pending in self._confirmations:
+            if pending.payload is payload and pending.written_at is None:
+                pending.written_at = written
+
+    def _check_confirmations(self, msg: BookooMessage, received: float) -> None:
+        """Resolve the commands whose effect shows in this frame."""
+        for pending in self._confirmations:
+            pending.check(msg, received)
+
     async def connect(
         self,
         callback: (
@@ -229,64 +469,23 @@ class BookooScale:
         ) = None,
         setup_tasks: bool = True,
     ) -> None:
-        """Connect the bluetooth client."""
+        """Connect the bluetooth client, or join the attempt in flight."""
 
         if self.connected:
             return
 
-        if self.last_disconnect_time and self.last_disconnect_time > (time.time() - 5):
+        if not self.connection.connecting and (
+            backoff := self.connection.backoff
+        ):
             _LOGGER.debug(
-                "Scale has recently been disconnected, waiting 5 seconds before reconnecting"
+                "Last connection attempt failed, waiting %.1f s before reconnecting",
+                backoff,
             )
             return
 
-        try:
-            ble_device = self.address_or_ble_device
-            try:
-                self._client = await establish_connection(
-                    BleakClientWithServiceCache,
-                    ble_device,
-                    disconnected_callback=self.device_disconnected_handler,
-                    name="bookoo",
-                    timeout=20.0,
-                )
-            except TypeError:
-                self._client = await establish_connection(
-                    ble_device,
-                    disconnected_callback=self.device_disconnected_handler,
-                    name="bookoo",
-                    timeout=20.0,
-                )
-        except BleakError as ex:
-            msg = "Error during connecting to device"
-            _LOGGER.debug("%s: %s", msg, ex)
-            raise BookooError(msg) from ex
-        except TimeoutError as ex:
-            msg = "Timeout during connecting to device"
-            _LOGGER.debug("%s: %s", msg, ex)
-            raise BookooError(msg) from ex
-        except Exception as ex:
-            msg = "Unknown error during connecting to device"
-            _LOGGER.debug("%s: %s", msg, ex)
-            raise BookooError(msg) from ex
-
-        self.connected = True
-        _LOGGER.debug("Connected to Bookoo scale")
-
-        if callback is None:
-            callback = self.on_bluetooth_data_received
-        try:
-            await self._client.start_notify(
-                char_specifier=self._weight_char_id,
-                callback=(
-                    self.on_bluetooth_data_received if callback is None else callback
-                ),
-            )
-            await asyncio.sleep(0.1)
-        except BleakError as ex:
-            msg = "Error subscribing to notifications"
-            _LOGGER.debug("%s: %s", msg, ex)
-            raise BookooError(msg) from ex
+        if not self.connection.connecting:
+            self._notification_callback = callback
+        await self.connection.connect()
 
         if setup_tasks:
             self._setup_tasks()
@@ -304,34 +503,93 @@ class BookooScale:
         if self.connected and self._client is client:
             return
 
-        self._client = client
-        try:
-            if hasattr(self._client, "is_connected") and not self._client.is_connected:
-                await self._client.connect()
-        except BleakError as ex:
-            msg = "Error during connecting to device"
-            _LOGGER.debug("%s: %s", msg, ex)
-            raise BookooError(msg) from ex
+        self._notification_callback = callback
+        await self.connection.attach(client)
+
+        if setup_tasks:
+            self._setup_tasks()
+
+    async def _async_on_connected(self, client: BleakClient) -> None:
+        """Subscribe to notifications on a freshly connected client.
 
+        Known GATT handles are used directly, without the settle delay a
+        fresh discovery needs. If they no longer match the device they are
+        dropped and the characteristics are looked up by UUID again.
+        """
         self.connected = True
+        self._connected_at = time.monotonic()
+        _LOGGER.debug("Connected to Bookoo scale")
 
-        if callback is None:
-            callback = self.on_bluetooth_data_received
+        # synchronous by default, so bleak calls it inline instead of
+        # creating a task
+        callback = self._notification_callback or self.process_notification
         try:
-            await self._client.start_notify(
-                char_specifier=self._weight_char_id,
-                callback=(
-                    self.on_bluetooth_data_received if callback is None else callback
-                ),
-            )
-            await asyncio.sleep(0.1)
+            if self._resolve_cached(client):
+                try:
+                    await client.start_notify(
+                        self._characteristics[self._weight_char_id], callback
+                    )
+                except BleakError as ex:
+                    _LOGGER.debug("Cached GATT handles failed: %s", ex)
+                    self.gatt_handles.clear()
+                    self._characteristics.clear()
+            if not self._characteristics:
+                await self._resolve_by_uuid(client)
+                await client.start_notify(
+                    self._characteristics[self._weight_char_id], callback
+                )
+                await asyncio.sleep(0.1)
         except BleakError as ex:
+            self.connected = False
             msg = "Error subscribing to notifications"
             _LOGGER.debug("%s: %s", msg, ex)
             raise BookooError(msg) from ex
 
-        if setup_tasks:
-            self._setup_tasks()
+        if self._notify_callback:
+            self._notify_callback(BookooField.CONNECTION)
+
+    def _resolve_cached(self, client: BleakClient) -> bool:
+        """Resolve the characteristics from `gatt_handles`, False if stale."""
+        self._characteristics.clear()
+        if not self.gatt_handles:
+            return False
+        services = client.services
+        for uuid in (self._weight_char_id, self._command_char_id):
+            characteristic = (
+                services.get_characteristic(handle)
+                if (handle := self.gatt_handles.get(uuid)) is not None
+                else None
+            )
+            if characteristic is None or characteristic.uuid != uuid:
+                _LOGGER.debug("Cached GATT handle for %s is stale", uuid)
+                self.gatt_handles.clear()
+                self._characteristics.clear()
+                return False
+            self._characteristics[uuid] = characteristic
+        return True
+
+    async def _resolve_by_uuid(self, client: BleakClient) -> None:
+        """Look up the characteristics by UUID and remember their handles.
+
+        If the service table lacks them it came from a stale cache, which
+        is cleared so the next connection runs a full discovery.
+        """
+        services = client.services
+        characteristics = {
+            uuid: services.get_characteristic(uuid)
+            for uuid in (self._weight_char_id, self._command_char_id)
+        }
+        if None in characteristics.values():
+            if isinstance(client, BleakClientWithServiceCache):
+                await client.clear_cache()
+            raise BleakError("Bookoo characteristics not found")
+        self._characteristics.update(characteristics)
+        self.gatt_handles = {
+            uuid: characteristic.handle
+            for uuid, characteristic in characteristics.items()
+        }
+        if (service := services.get_service(SERVICE_UUID)) is not None:
+            self.gatt_handles[SERVICE_UUID] = service.handle
 
     def _setup_tasks(self) -> None:
         """Set up background tasks."""
@@ -343,70 +601,70 @@ class BookooScale:
 
         _LOGGER.debug("Disconnecting from scale")
         self.connected = False
-        await self._queue.join()
-        if not self._client:
-            return
-        try:
-            await self._client.disconnect()
-        except BleakError as ex:
-            _LOGGER.debug("Error disconnecting from device: %s", ex)
-        else:
-            _LOGGER.debug("Disconnected from scale")
+        await self._commands.join()
+        await self.connection.disconnect()
 
-    async def tare(self) -> None:
-        """Tare the scale."""
+    async def tare(self, *, confirm: bool = False) -> None:
+        """Tare the scale, with `confirm` wait until the weight is zero."""
         if not self.connected:
             await self.connect()
-        async with self._add_to_queue_lock:
-            await self._queue.put((self._command_char_id, self._msg_types["tare"]))
+        await self._send(
+            self._msg_types["tare"], True, tare_confirmation() if confirm else None
+        )
 
-    async def start_timer(self) -> None:
-        """Start the timer."""
+    async def start_timer(self, *, confirm: bool = False) -> None:
+        """Start the timer, with `confirm` wait until it is running."""
         if not self.connected:
             await self.connect()
 
         _LOGGER.debug('Sending "start" message')
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (self._command_char_id, self._msg_types["startTimer"])
-            )
+        await self._send(
+            self._msg_types["startTimer"],
+            True,
+            start_confirmation() if confirm else None,
+        )
 
-    async def stop_timer(self) -> None:
-        """Stop the timer."""
+    async def stop_timer(self, *, confirm: bool = False) -> None:
+        """Stop the timer, with `confirm` wait until it stands still."""
         if not self.connected:
             await self.connect()
 
         _LOGGER.debug('Sending "stop" message')
 
-        async with self._add_to_queue_lock:
-            await self._queue.put((self._command_char_id, self._msg_types["stopTimer"]))
+        await self._send(
+            self._msg_types["stopTimer"],
+            True,
+            stop_confirmation() if confirm else None,
+        )
 
-    async def tare_and_start_timer(self) -> None:
-        """Tare and Start the timer."""
+    async def tare_and_start_timer(self, *, confirm: bool = False) -> None:
+        """Tare and Start the timer, with `confirm` wait for both."""
         if not self.connected:
             await self.connect()
 
         _LOGGER.debug('Sending "tare and start" message')
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (self._command_char_id, self._msg_types["tareAndStartTime"])
-            )
+        await self._send(
+            self._msg_types["tareAndStartTime"],
+            True,
+            tare_and_start_confirmation() if confirm else None,
+        )
 
-    async def reset_timer(self) -> None:
-        """Reset the timer."""
+    async def reset_timer(self, *, confirm: bool = False) -> None:
+        """Reset the timer, with `confirm` wait until it reads zero."""
         if not self.connected:
             await self.connect()
 
         _LOGGER.debug('Sending "reset" message')
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (self._command_char_id, self._msg_types["resetTimer"])
-            )
+        await self._send(
+            self._msg_types["resetTimer"],
+            True,
+            reset_confirmation() if confirm else None,
+        )
 
-    async def set_beep_level(self, level: int) -> None:
+    async def set_beep_level(self, level: int, *, confirm: bool = False) -> None:
         """Set the beeper volume (0-5)."""
 
         if not 0 <= level <= 5:
@@ -417,12 +675,15 @@ class BookooScale:
 
         _LOGGER.debug("Setting beep level to %s", level)
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (self._command_char_id, self._build_command(0x02, 0x00, level))
-            )
+        await self._send(
+            self._build_command(0x02, 0x00, level),
+            False,
+            field_confirmation("buzzer_gear", level) if confirm else None,
+        )
 
-    async def set_auto_off_duration(self, minutes: int) -> None:
+    async def set_auto_off_duration(
+        self, minutes: int, *, confirm: bool = False
+    ) -> None:
         """Set the automatic shutdown duration (5-30 minutes)."""
 
         if not 5 <= minutes <= 30:
@@ -433,12 +694,15 @@ class BookooScale:
 
         _LOGGER.debug("Setting auto-off duration to %s minutes", minutes)
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (self._command_char_id, self._build_command(0x03, 0x00, minutes))
-            )
+        await self._send(
+            self._build_command(0x03, 0x00, minutes),
+            False,
+            field_confirmation("standby_time", minutes) if confirm else None,
+        )
 
-    async def set_flow_rate_smoothing(self, enabled: bool) -> None:
+    async def set_flow_rate_smoothing(
+        self, enabled: bool, *, confirm: bool = False
+    ) -> None:
         """Enable or disable flow rate smoothing."""
 
         if not self.connected:
@@ -446,13 +710,15 @@ class BookooScale:
 
         _LOGGER.debug("Setting flow rate smoothing to %s", enabled)
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (
-                    self._command_char_id,
-                    self._build_command(0x08, 0x01 if enabled else 0x00, 0x00),
-                )
-            )
+        await self._send(
+            self._build_command(0x08, 0x01 if enabled else 0x00, 0x00),
+            False,
+            (
+                field_confirmation("flow_rate_smoothing", 0x01 if enabled else 0x00)
+                if confirm
+                else None
+            ),
+        )
 
     async def calibrate(self) -> None:
         """Start calibration."""
@@ -462,10 +728,11 @@ class BookooScale:
 
         _LOGGER.debug("Sending calibration command")
 
-        async with self._add_to_queue_lock:
-            await self._queue.put((self._command_char_id, self._build_command(0x09)))
+        self._queue_config(self._build_command(0x09))
 
-    async def set_auto_mode_stop_condition(self, on_container_removed: bool) -> None:
+    async def set_auto_mode_stop_condition(
+        self, on_container_removed: bool, *, confirm: bool = False
+    ) -> None:
         """Set stop condition for automatic mode."""
 
         if not self.connected:
@@ -476,41 +743,124 @@ class BookooScale:
             "container removed" if on_container_removed else "flow stopped",
         )
 
-        async with self._add_to_queue_lock:
-            await self._queue.put(
-                (
-                    self._command_char_id,
-                    self._build_command(0x0B, 0x01 if on_container_removed else 0x00),
+        await self._send(
+            self._build_command(0x0B, 0x01 if on_container_removed else 0x00),
+            False,
+            (
+                field_confirmation(
+                    "stop_condition", 0x01 if on_container_removed else 0x00
                 )
-            )
+                if confirm
+                else None
+            ),
+        )
 
     async def on_bluetooth_data_received(
         self,
-        characteristic: BleakGATTCharacteristic,  # pylint: disable=unused-argument
+        characteristic: BleakGATTCharacteristic,
+        data: bytearray,
+    ) -> None:
+        """Receive data from scale.
+
+        Coroutine variant of `process_notification` for callers that await
+        it from their own coroutine callback; registering it with bleak
+        directly costs a task per notification.
+        """
+        self.process_notification(characteristic, data)
+
+    def process_notification(
+        self,
+        characteristic: BleakGATTCharacteristic | None,  # pylint: disable=unused-argument
         data: bytearray,
     ) -> None:
-        """Receive data from scale."""
+        """Decode a notification and update the state inline."""
 
+        received = time.monotonic()
+        if (metrics := self.metrics) is not None:
+            metrics.frame_received(received)
         # _LOGGER.debug("Received data: %s", ",".join(f"{byte:02x}" for byte in data))
 
-        try:
-            msg, _ = decode(data)
-        except BookooMessageTooShort as ex:
-            _LOGGER.debug("Non-header message too short: %s", ex.bytes_recvd)
-            return
-        except BookooMessageTooLong as ex:
-            _LOGGER.debug("%s: %s", ex.message, ex.bytes_recvd)
+        reassembler = self.reassembler
+        if (
+            len(data) == FRAME_LENGTH
+            and data[0] == WEIGHT_BYTE1
+            and data[1] == WEIGHT_BYTE2
+            and not reassembler.pending
+        ):
+            if checksum_valid(data):
+                # one whole frame per notification, the usual case
+                self._process_frame(data, received)
+                return
+            # corrupted, or misaligned data the reassembler can recover
+        elif (
+            not reassembler.pending
+            and len(data) > 1
+            and _WEIGHT_HEADER not in data
+        ):
+            # another message type, e.g. a command response; not a resync
+            _LOGGER.debug("Full message: %s", data)
             return
+
+        for frame in reassembler.feed(data):
+            self._process_frame(frame, received)
+
+    def _process_frame(self, data: Payload, received: float) -> None:
+        """Decode one 20-byte frame and update the state."""
+
+        metrics = self.metrics
+        try:
+            msg = decode_frame(data, self._message)
         except BookooMessageError as ex:
+            self.link.decode_error(type(ex))
             _LOGGER.warning("%s: %s", ex.message, ex.bytes_recvd)
             return
 
-        if isinstance(msg, BookooMessage):
+        if msg is None:
+            _LOGGER.debug("Full message: %s", data)
+            return
+        if metrics is not None:
+            metrics.frame_decoded(time.monotonic())
+        if (connected_at := self._connected_at) is not None:
+            self.time_to_first_frame = time.monotonic() - connected_at
+            self._connected_at = None
+        if self._confirmations:
+            self._check_confirmations(msg, received)
+        self.link.frame(msg.timer)
+
+        # when the sample was taken, arrival time while the timer stands
+        sampled = self.clock.align(msg.timer, received)
+        if metrics is not None:
+            metrics.frame_aligned(sampled)
+        self.history.append(sampled, msg.weight, msg.flow_rate, msg.timer)
+        if self.estimator is not None:
+            self.estimator.update(sampled, msg.weight)
+
+        changed = 0
+        if self.stale:
+            # confirm every restored value, changed or not
+            self.stale = False
+            changed = _RESTORABLE_FIELDS
+        if (
+            shot := self.shot_detector.update(
+                sampled, msg.weight, msg.flow_rate, msg.timer
+            )
+        ) is not None:
+            self._last_shot = shot
+            changed |= _SHOT
+        if msg.weight != self._weight:
+            changed |= _WEIGHT
             self._weight = msg.weight
-            self._timer = msg.timer
+        if msg.flow_rate != self._flow_rate:
+            changed |= _FLOW_RATE
             self._flow_rate = msg.flow_rate
-            self._flow_rate_smoothing = msg.flow_rate_smoothing
-            self._stop_condition = msg.stop_condition
+        if msg.timer != self._timer:
+            changed |= _TIMER
+            self._timer = msg.timer
+        self._flow_rate_smoothing = msg.flow_rate_smoothing
+        self._stop_condition = msg.stop_condition
+
+        if (state := self._device_state) is None:
+            changed |= _DEVICE_STATE_FIELDS
             self._device_state = BookooDeviceState(
                 battery_level=msg.battery,
                 units=msg.unit,
@@ -519,9 +869,28 @@ class BookooScale:
                 flow_rate_smoothing=msg.flow_rate_smoothing,
                 stop_condition=msg.stop_condition,
             )
-
-        if self._notify_callback is not None:
-            self._notify_callback()
-
-
-__all__ = ["BookooDeviceState", "BookooScale"]
+        else:
+            if msg.battery != state.battery_level:
+                changed |= _BATTERY
+                state.battery_level = msg.battery
+            if msg.unit is not state.units:
+                changed |= _UNIT
+                state.units = msg.unit
+            if msg.buzzer_gear != state.buzzer_gear:
+                changed |= _BUZZER_GEAR
+                state.buzzer_gear = msg.buzzer_gear
+            if msg.standby_time != state.auto_off_time:
+                changed |= _AUTO_OFF
+                state.auto_off_time = msg.standby_time
+            if msg.flow_rate_smoothing != state.flow_rate_smoothing:
+                changed |= _FLOW_SMOOTHING
+                state.flow_rate_smoothing = msg.flow_rate_smoothing
+            if msg.stop_condition != state.stop_condition:
+                changed |= _STOP_CONDITION
+                state.stop_condition = msg.stop_condition
+
+        if changed and self._notify_callback is not None:
+            self._notify_callback(BookooField(changed))
+
+
+__all__ = ["RESTORABLE_FIELDS", "BookooDeviceState", "BookooScale"]
@@ -0,0 +1,115 @@
+"""Vektorisierte Dekodierung aufgezeichneter Gewichtsnachrichten.
+
+Benötigt NumPy (``pip install aiobookoo-ultra[numpy]``); das Modul wird daher
+nicht vom Package-Root importiert.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+
+from .const import WEIGHT_BYTE1, WEIGHT_BYTE2
+from .decode import FRAME_LENGTH
+
+# Strukturierte Sicht auf eine 20-Byte-Gewichtsnachricht, siehe decode.py
+FRAME_DTYPE: Final = np.dtype(
+    [
+        ("header", "u1", (2,)),
+        ("timer", "u1", (3,)),
+        ("unit", "u1"),
+        ("weight_sign", "u1"),
+        ("weight", "u1", (3,)),
+        ("flow_sign", "u1"),
+        ("flow", ">u2"),
+        ("battery", "u1"),
+        ("standby_time", ">u2"),
+        ("buzzer_gear", "u1"),
+        ("flow_rate_smoothing", "u1"),
+        ("stop_condition", "u1"),
+        ("checksum", "u1"),
+    ]
+)
+assert FRAME_DTYPE.itemsize == FRAME_LENGTH
+
+_SIGNS: Final = np.zeros(256, dtype=np.int8)
+_SIGNS[[0x2B, 0x00]] = 1
+_SIGNS[0x2D] = -1
+
+_VALID_UNITS: Final = np.zeros(256, dtype=bool)
+_VALID_UNITS[[0x01, 0x02]] = True
+
+
+@dataclass(frozen=True, slots=True)
+class BookooFrameBatch:
+    """Spaltenweise dekodierte Gewichtsnachrichten.
+
+    Float columns are NaN where `bad` is set.
+    """
+
+    timer: np.ndarray  # seconds
+    weight: np.ndarray  # grams
+    flow_rate: np.ndarray  # ml/s
+    battery: np.ndarray  # percent
+    unit: np.ndarray  # raw unit byte, 0x01 = ounces, 0x02 = grams
+    bad: np.ndarray  # header, checksum, unit or sign byte invalid
+
+    def __len__(self) -> int:
+        """Return the number of frames in the batch."""
+        return len(self.bad)
+
+
+def _uint24(column: np.ndarray) -> np.ndarray:
+    """Combine a (n, 3) big-endian byte column into uint32 values."""
+
+    wide = column.astype(np.uint32)
+    return (wide[:, 0] << 16) | (wide[:, 1] << 8) | wide[:, 2]
+
+
+def decode_many(
+    buffer: bytes | bytearray | memoryview | np.ndarray,
+) -> BookooFrameBatch:
+    """Decode a contiguous buffer of 20-byte weight frames at once.
+
+    The buffer is interpreted in place as a structured array; frames are
+    validated in bulk instead of raising per frame.
+    """
+
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    if raw.size % FRAME_LENGTH:
+        raise ValueError(
+            f"Buffer length {raw.size} is not a multiple of {FRAME_LENGTH}"
+        )
+    frames = raw.view(FRAME_DTYPE)
+    matrix = raw.reshape(-1, FRAME_LENGTH)
+
+    weight_sign = _SIGNS[frames["weight_sign"]]
+    flow_sign = _SIGNS[frames["flow_sign"]]
+    bad = (
+        (frames["header"][:, 0] != WEIGHT_BYTE1)
+        | (frames["header"][:, 1] != WEIGHT_BYTE2)
+        | (np.bitwise_xor.reduce(matrix, axis=1) != 0)
+        | ~_VALID_UNITS[frames["unit"]]
+        | (weight_sign == 0)
+        | (flow_sign == 0)
+    )
+
+    timer = _uint24(frames["timer"]) / 1000.0
+    weight = _uint24(frames["weight"]) / 100.0 * weight_sign
+    flow_rate = frames["flow"] / 100.0 * flow_sign
+    for column in (timer, weight, flow_rate):
+        column[bad] = np.nan
+
+    return BookooFrameBatch(
+        timer=timer,
+        weight=weight,
+        flow_rate=flow_rate,
+        battery=frames["battery"].copy(),
+        unit=frames["unit"].copy(),
+        bad=bad,
+    )
+
+
+__all__ = ["FRAME_DTYPE", "BookooFrameBatch", "decode_many"]
@@ -0,0 +1,140 @@
+"""Abgleich der Geräteuhr mit der Host-Uhr."""
+
+from __future__ import annotations
+
+from collections import deque
+
+BLOCK_SIZE = 20  # samples per envelope point, about 2 s at 10 Hz
+MAX_BLOCKS = 30  # envelope points kept for the regression
+MAX_DRIFT = 0.01  # reject fits with more than 1 % rate difference
+
+
+class ClockAligner:
+    """Schätzt Offset und Drift zwischen Gerätetimer und Host-Zeit.
+
+    Arrival times are the send time plus a delay that is never negative
+    but jitters with the BLE connection interval and proxy buffering. The
+    samples with the smallest delay therefore form a lower envelope that
+    runs parallel to the true clock. Per block of `BLOCK_SIZE` samples the
+    one with the lowest arrival time relative to the device timer is kept,
+    and a line through these envelope points maps device time to host
+    time. Arrivals below the line pull it down immediately.
+
+    The device timer only advances while it runs; for other samples, and
+    until a run has lasted a block, the arrival time is returned as is.
+    """
+
+    __slots__ = (
+        "_block_min",
+        "_block_samples",
+        "_envelope",
+        "_last_sample",
+        "_last_timer",
+        "drift",
+        "offset",
+    )
+
+    def __init__(self) -> None:
+        """Initialize without a clock model."""
+        self._envelope: deque[tuple[float, float]] = deque(maxlen=MAX_BLOCKS)
+        self._block_min: tuple[float, float] | None = None
+        self._block_samples = 0
+        self._last_timer: float | None = None
+        self._last_sample: float | None = None
+        self.offset: float | None = None
+        self.drift = 0.0
+
+    @property
+    def aligned(self) -> bool:
+        """Return True while samples are mapped through the clock model."""
+        return self.offset is not None
+
+    def reset(self) -> None:
+        """Forget everything, e.g. after a disconnect."""
+        self._drop_model()
+        self._last_timer = None
+        self._last_sample = None
+
+    def _drop_model(self) -> None:
+        """Forget the clock model when the device timer stops or restarts."""
+        self._envelope.clear()
+        self._block_min = None
+        self._block_samples = 0
+        self.offset = None
+        self.drift = 0.0
+
+    def align(self, timer: float | None, arrival: float) -> float:
+        """Return the host time at which the sample was taken.
+
+        The result never goes back behind the previous sample, so
+        consumers can rely on increasing timestamps.
+        """
+        sample = self._sample_time(timer, arrival)
+        if (last_sample := self._last_sample) is not None and sample < last_sample:
+            sample = last_sample
+        self._last_sample = sample
+        return sample
+
+    def _sample_time(self, timer: float | None, arrival: float) -> float:
+        last_timer = self._last_timer
+        self._last_timer = timer
+        if timer is None or last_timer is None or timer <= last_timer:
+            # stopped or reset timer: the device clock carries no time
+            if self._envelope or self._block_min is not None:
+                self._drop_model()
+            return arrival
+
+        # relative to the device timer, so drift only scales small numbers
+        relative = arrival - timer
+        block_min = self._block_min
+        if block_min is None or relative < block_min[1]:
+            self._block_min = block_min = (timer, relative)
+        self._block_samples += 1
+        if self._block_samples >= BLOCK_SIZE:
+            self._envelope.append(block_min)
+            self._block_min = None
+            self._block_samples = 0
+            self._fit()
+
+        if self.offset is None:
+            return arrival
+        estimate = self.offset + self.drift * timer
+        if relative < estimate:
+            # arrived faster than the model allows, lower the envelope
+            self.offset += relative - estimate
+            estimate = relative
+        return timer + estimate
+
+    def _fit(self) -> None:
+        """Fit the envelope points by least squares."""
+        envelope = self._envelope
+        count = len(envelope)
+        if count == 1:
+            self.offset = envelope[0][1]
+            self.drift = 0.0
+            return
+        mean_timer = sum(point[0] for point in envelope) / count
+        mean_relative = sum(point[1] for point in envelope) / count
+        covariance = variance = 0.0
+        for timer, relative in envelope:
+            deviation = timer - mean_timer
+            covariance += deviation * (relative - mean_relative)
+            variance += deviation * deviation
+        drift = covariance / variance if variance else 0.0
+        if abs(drift) > MAX_DRIFT:
+            drift = 0.0
+        self.drift = drift
+        # shift the line onto the lowest envelope point
+        self.offset = min(relative - drift * timer for timer, relative in envelope)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the clock model, e.g. for diagnostics."""
+        return {
+            "aligned": self.aligned,
+            "offset": self.offset,
+            "drift_ppm": self.drift * 1_000_000,
+            "envelope_points": len(self._envelope),
+        }
+
+
+__all__ = ["ClockAligner"]
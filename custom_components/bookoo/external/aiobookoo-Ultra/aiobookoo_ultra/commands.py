@@ -0,0 +1,213 @@
+"""Priorisierte Befehlswarteschlange für die Waage."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+
+from .decode import BookooMessage
+
+# gap between two writes, derived from how long writes take to complete
+DEFAULT_COMMAND_GAP = 0.05
+MIN_COMMAND_GAP = 0.01
+MAX_COMMAND_GAP = 0.25
+WRITE_TIME_SMOOTHING = 0.2
+
+# how long to wait for a command's effect to show up in the notifications
+DEFAULT_CONFIRM_TIMEOUT = 1.0
+DEFAULT_CONFIRM_RETRIES = 2
+TARE_TOLERANCE = 0.3  # grams
+
+Command = tuple[str, bytearray]
+# checked against every frame received after the write until it returns True
+Confirmation = Callable[[BookooMessage], bool]
+
+
+@dataclass(slots=True)
+class PendingConfirmation:
+    """Ein Befehl, der auf seine Wirkung in den Benachrichtigungen wartet.
+
+    Frames are only checked once `written_at` is set, and only those
+    received after it, so state buffered before the write cannot confirm
+    a command the scale has not seen yet.
+    """
+
+    confirmation: Confirmation
+    payload: bytearray
+    future: asyncio.Future[None]
+    written_at: float | None = None
+
+    def check(self, msg: BookooMessage, received: float) -> None:
+        """Resolve the future if `msg` shows the command's effect."""
+        if (
+            self.written_at is not None
+            and received > self.written_at
+            and not self.future.done()
+            and self.confirmation(msg)
+        ):
+            self.future.set_result(None)
+
+
+class CommandScheduler:
+    """Warteschlange mit Vorrang für zeitkritische Befehle.
+
+    Urgent commands (tare, timer control) are sent in FIFO order before any
+    configuration write. Configuration writes are keyed by kind; queuing a
+    kind that is still pending replaces its payload, so only the last
+    value is sent. The gap between writes follows a moving average of the
+    measured write time instead of a fixed sleep.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler."""
+        self._urgent: deque[Command] = deque()
+        self._config: dict[int, Command] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._in_flight = False
+        self._last_write_end = 0.0
+        self.write_time: float | None = None
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending commands."""
+        return len(self._urgent) + len(self._config)
+
+    @property
+    def idle(self) -> bool:
+        """Return True when nothing is queued or being written."""
+        return self._idle.is_set()
+
+    @property
+    def gap(self) -> float:
+        """Return the current minimum gap between two writes in seconds."""
+        if self.write_time is None:
+            return DEFAULT_COMMAND_GAP
+        return min(max(self.write_time, MIN_COMMAND_GAP), MAX_COMMAND_GAP)
+
+    def put_urgent(self, command: Command) -> None:
+        """Queue a time-critical command ahead of configuration writes."""
+        self._urgent.append(command)
+        self._wake()
+
+    def put_config(self, kind: int, command: Command) -> None:
+        """Queue a configuration write, replacing a pending one of `kind`."""
+        if kind in self._config:
+            self.coalesced += 1
+        self._config[kind] = command
+        self._wake()
+
+    def _wake(self) -> None:
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def get(self) -> Command:
+        """Wait for the next command, honouring the gap to the last write.
+
+        The command is picked after the gap has passed, so urgent commands
+        queued meanwhile still go first.
+        """
+        while not self:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        if (delay := self._last_write_end + self.gap - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        self._in_flight = True
+        if self._urgent:
+            return self._urgent.popleft()
+        kind = next(iter(self._config))
+        return self._config.pop(kind)
+
+    def task_done(self, write_time: float | None = None) -> None:
+        """Mark the command from `get` as written and record its duration."""
+        self._in_flight = False
+        self._last_write_end = time.monotonic()
+        if write_time is not None:
+            self.write_time = (
+                write_time
+                if self.write_time is None
+                else self.write_time
+                + WRITE_TIME_SMOOTHING * (write_time - self.write_time)
+            )
+        if not self:
+            self._idle.set()
+
+    def clear(self) -> None:
+        """Drop all pending commands, e.g. when the writer is cancelled."""
+        self._urgent.clear()
+        self._config.clear()
+        self._in_flight = False
+        self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until all queued commands have been written."""
+        await self._idle.wait()
+
+
+def tare_confirmation() -> Confirmation:
+    """Confirm once the weight is near zero."""
+    return lambda msg: abs(msg.weight) < TARE_TOLERANCE
+
+
+def _timer_advancing() -> Confirmation:
+    """Confirm once the timer advanced between two frames."""
+    last_timer: float | None = None
+
+    def _check(msg: BookooMessage) -> bool:
+        nonlocal last_timer
+        advancing = last_timer is not None and msg.timer > last_timer
+        last_timer = msg.timer
+        return advancing
+
+    return _check
+
+
+def start_confirmation() -> Confirmation:
+    """Confirm once the timer is running."""
+    return _timer_advancing()
+
+
+def stop_confirmation() -> Confirmation:
+    """Confirm once the timer stood still between two frames.
+
+    Both frames arrive after the write, the first one only provides the
+    reference timer.
+    """
+    last_timer: float | None = None
+
+    def _check(msg: BookooMessage) -> bool:
+        nonlocal last_timer
+        stopped = last_timer is not None and msg.timer == last_timer
+        last_timer = msg.timer
+        return stopped
+
+    return _check
+
+
+def reset_confirmation() -> Confirmation:
+    """Confirm once the timer is back at zero."""
+    return lambda msg: msg.timer == 0
+
+
+def tare_and_start_confirmation() -> Confirmation:
+    """Confirm once the weight is near zero and the timer is running."""
+    advancing = _timer_advancing()
+    return lambda msg: advancing(msg) and abs(msg.weight) < TARE_TOLERANCE
+
+
+def field_confirmation(field: str, value: int) -> Confirmation:
+    """Confirm once a device setting reports `value`."""
+    return lambda msg: getattr(msg, field) == value
+
+
+__all__ = [
+    "DEFAULT_CONFIRM_RETRIES",
+    "DEFAULT_CONFIRM_TIMEOUT",
+    "CommandScheduler",
+    "Confirmation",
+    "PendingConfirmation",
+]
@@ -0,0 +1,245 @@
+"""Verbindungsverwaltung für die Waage."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import functools
+import logging
+import random
+import time
+
+from bleak import BleakClient, BLEDevice
+from bleak.exc import BleakError
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+
+from .exceptions import BookooError
+
+_LOGGER = logging.getLogger("aiobookoo_ultra")
+
+CONNECT_TIMEOUT = 20.0
+# retry delay after failed attempts, doubled per failure and jittered
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 60.0
+
+DisconnectedCallback = Callable[[BleakClient], None]
+# opens a link to the device, e.g. after waiting for a free connection slot
+Connector = Callable[[str | BLEDevice, DisconnectedCallback], Awaitable[BleakClient]]
+
+
+async def establish(
+    device: str | BLEDevice,
+    disconnected_callback: DisconnectedCallback,
+    *,
+    name: str = "bookoo",
+    timeout: float = CONNECT_TIMEOUT,
+) -> BleakClient:
+    """Connect to `device` through the retry connector."""
+    return await establish_connection(
+        BleakClientWithServiceCache,
+        device,
+        name,
+        disconnected_callback=disconnected_callback,
+        timeout=timeout,
+    )
+
+
+class BookooConnection:
+    """Besitzt den BleakClient und bündelt Verbindungsversuche.
+
+    At most one connection attempt runs at a time. Callers that ask for a
+    connection while an attempt is in flight wait for that attempt instead
+    of starting their own, so a burst of commands during a reconnect
+    competes for one proxy slot, not several. `on_connected` runs as part
+    of the attempt, e.g. to subscribe to notifications, and
+    `on_disconnected` is called when the current client loses its link.
+
+    After a failed attempt the next one should wait `backoff` seconds. The
+    delay doubles with each consecutive failure up to `BACKOFF_MAX` and is
+    drawn from its upper half, so scales that fail together do not retry
+    in lockstep. A successful connection resets it.
+
+    `connector` opens the link and can be replaced, e.g. by a scheduler
+    that shares connection slots between several scales.
+    """
+
+    def __init__(
+        self,
+        device: str | BLEDevice,
+        *,
+        on_connected: Callable[[BleakClient], Awaitable[None]],
+        on_disconnected: DisconnectedCallback,
+        name: str = "bookoo",
+        timeout: float = CONNECT_TIMEOUT,
+    ) -> None:
+        """Initialize the manager for `device`, an address or BLE device."""
+        self.device = device
+        self._on_connected = on_connected
+        self._on_disconnected = on_disconnected
+        self.connector: Connector = functools.partial(
+            establish, name=name, timeout=timeout
+        )
+        self._client: BleakClient | None = None
+        self._attempt: asyncio.Task[None] | None = None
+        self.attempts = 0
+        self.failures = 0
+        self.joined = 0
+        self.last_error: str | None = None
+        self._consecutive_failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def client(self) -> BleakClient | None:
+        """Return the current client, None before the first connection."""
+        return self._client
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while the client holds a link to the scale."""
+        return self._client is not None and self._client.is_connected
+
+    @property
+    def connecting(self) -> bool:
+        """Return True while a connection attempt is in flight."""
+        return self._attempt is not None
+
+    @property
+    def backoff(self) -> float:
+        """Return the seconds to wait before the next attempt, 0 if none."""
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    async def connect(self) -> None:
+        """Connect, or wait for the attempt that is already in flight."""
+        if self._attempt is None:
+            if self.is_connected:
+                return
+            self._start(self._connect())
+        else:
+            self.joined += 1
+        await self._wait(self._attempt)
+
+    async def attach(self, client: BleakClient) -> None:
+        """Take over a client that was connected elsewhere."""
+        if self._attempt is not None:
+            self.joined += 1
+            await self._wait(self._attempt)
+        if client is self._client and self.is_connected:
+            return
+        self._start(self._attach(client))
+        await self._wait(self._attempt)
+
+    @staticmethod
+    async def _wait(attempt: asyncio.Task[None]) -> None:
+        """Wait for `attempt`, failing if `disconnect` cancelled it."""
+        try:
+            # a cancelled caller must not cancel the attempt others wait for
+            await asyncio.shield(attempt)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if attempt.cancelled() and (task is None or not task.cancelling()):
+                raise BookooError("Disconnected during connect") from None
+            raise
+
+    def _start(self, attempt: Awaitable[None]) -> None:
+        self.attempts += 1
+        self._attempt = asyncio.ensure_future(attempt)
+        self._attempt.add_done_callback(self._attempt_done)
+
+    def _attempt_done(self, task: asyncio.Task[None]) -> None:
+        self._attempt = None
+        if task.cancelled():
+            return
+        if (ex := task.exception()) is None:
+            self._consecutive_failures = 0
+            self._retry_at = 0.0
+            return
+        self.failures += 1
+        self.last_error = str(ex)
+        # capped exponent, the delay reaches BACKOFF_MAX long before
+        exponent = min(self._consecutive_failures, 16)
+        delay = min(BACKOFF_INITIAL * 2**exponent, BACKOFF_MAX)
+        self._consecutive_failures += 1
+        self._retry_at = time.monotonic() + random.uniform(delay / 2, delay)
+
+    async def _connect(self) -> None:
+        """Establish a new link through the retry connector."""
+        try:
+            client = await self.connector(self.device, self._handle_disconnect)
+        except BookooError:
+            raise
+        except BleakError as ex:
+            msg = "Error during connecting to device"
+            _LOGGER.debug("%s: %s", msg, ex)
+            raise BookooError(msg) from ex
+        except TimeoutError as ex:
+            msg = "Timeout during connecting to device"
+            _LOGGER.debug("%s: %s", msg, ex)
+            raise BookooError(msg) from ex
+        except Exception as ex:
+            msg = "Unknown error during connecting to device"
+            _LOGGER.debug("%s: %s", msg, ex)
+            raise BookooError(msg) from ex
+        await self._activate(client)
+
+    async def _attach(self, client: BleakClient) -> None:
+        """Connect `client` if needed and make it the current one."""
+        try:
+            if not client.is_connected:
+                await client.connect()
+        except BleakError as ex:
+            msg = "Error during connecting to device"
+            _LOGGER.debug("%s: %s", msg, ex)
+            raise BookooError(msg) from ex
+        await self._activate(client)
+
+    async def _activate(self, client: BleakClient) -> None:
+        """Run the connect hook, dropping the link again if it fails."""
+        self._client = client
+        try:
+            await self._on_connected(client)
+        except BaseException:
+            self._client = None
+            await self._disconnect_client(client)
+            raise
+        self.last_error = None
+
+    def _handle_disconnect(self, client: BleakClient) -> None:
+        """Forward the loss of the current link, ignoring stale clients."""
+        if client is not self._client:
+            return
+        self._client = None
+        self._on_disconnected(client)
+
+    async def disconnect(self) -> None:
+        """Cancel a pending attempt and close the link.
+
+        Callers waiting for the cancelled attempt get a `BookooError`.
+        """
+        if self._attempt is not None:
+            self._attempt.cancel()
+        if (client := self._client) is not None:
+            # the disconnected callback reports the loss as usual
+            await self._disconnect_client(client)
+
+    @staticmethod
+    async def _disconnect_client(client: BleakClient) -> None:
+        try:
+            await client.disconnect()
+        except BleakError as ex:
+            _LOGGER.debug("Error disconnecting from device: %s", ex)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return connection counters, e.g. for diagnostics."""
+        return {
+            "connected": self.is_connected,
+            "connecting": self.connecting,
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "consecutive_failures": self._consecutive_failures,
+            "backoff": round(self.backoff, 3),
+            "joined": self.joined,
+            "last_error": self.last_error,
+        }
+
+
+__all__ = ["BookooConnection", "Connector", "establish"]
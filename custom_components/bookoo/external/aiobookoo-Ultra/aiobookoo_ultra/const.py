@@ -1,6 +1,6 @@
 """Konstanten des Themis-Ultra-Protokolls."""
 
-from enum import StrEnum
+from enum import IntFlag, StrEnum, auto
 from typing import Final
 
 SCALE_START_NAMES: Final = ["BOOKOO"]
@@ -11,6 +11,7 @@ CMD_BYTE1_PRODUCT_NUMBER = 0x03  # Command Data BYTE1
 CMD_BYTE2_TYPE = 0x0A  # Command Data BYTE2
 WEIGHT_BYTE1 = 0x03
 WEIGHT_BYTE2 = 0x0B
+DEFAULT_HISTORY_SIZE: Final = 18000  # 30 minutes at 10 Hz
 
 
 class UnitMass(StrEnum):
@@ -20,6 +21,23 @@ class UnitMass(StrEnum):
     OUNCES = "ounces"
 
 
+class BookooField(IntFlag):
+    """Felder, deren Änderung an den Benachrichtigungs-Callback gemeldet wird."""
+
+    NONE = 0
+    WEIGHT = auto()
+    FLOW_RATE = auto()
+    TIMER = auto()
+    BATTERY = auto()
+    UNIT = auto()
+    BUZZER_GEAR = auto()
+    AUTO_OFF = auto()
+    FLOW_SMOOTHING = auto()
+    STOP_CONDITION = auto()
+    CONNECTION = auto()
+    SHOT = auto()
+
+
 __all__ = [
     "SCALE_START_NAMES",
     "SERVICE_UUID",
@@ -29,5 +47,7 @@ __all__ = [
     "CMD_BYTE2_TYPE",
     "WEIGHT_BYTE1",
     "WEIGHT_BYTE2",
+    "DEFAULT_HISTORY_SIZE",
     "UnitMass",
+    "BookooField",
 ]
@@ -1,73 +1,166 @@
 """Dekodierung der Gewichtsnachrichten des Ultra-Protokolls."""
 
-from dataclasses import dataclass
 import logging
+from struct import Struct
+from typing import Final
 
 from .const import UnitMass, WEIGHT_BYTE1, WEIGHT_BYTE2
-from .exceptions import BookooMessageError, BookooMessageTooLong, BookooMessageTooShort
+from .exceptions import (
+    BookooChecksumMismatch,
+    BookooMessageError,
+    BookooMessageTooLong,
+    BookooMessageTooShort,
+)
 
 _LOGGER = logging.getLogger("aiobookoo_ultra")
 
+FRAME_LENGTH: Final = 20
+
+# Layout einer Gewichtsnachricht (big endian):
+#  0-1  Header (0x03 0x0B)
+#  2-4  Timer in ms (24 bit, als B + H)
+#  5    Einheit
+#  6    Vorzeichen Gewicht
+#  7-9  Gewicht in 1/100 g (24 bit, als B + H)
+#  10   Vorzeichen Flow
+#  11-12 Flow in 1/100 ml/s
+#  13   Akku in %
+#  14-15 Standby-Zeit in Minuten
+#  16   Buzzer-Stufe
+#  17   Flow-Glättung
+#  18   Stoppbedingung
+#  19   XOR-Prüfsumme über Byte 0-18
+_FRAME_LAYOUT: Final = Struct(">BBBHBBBHBHBHBBBB")
+
+# Dieselben 20 Byte als drei Wörter, um die XOR-Prüfsumme ohne Byte-Schleife
+# zu falten. Ein gültiger Frame ergibt über alle 20 Byte XOR 0.
+_CHECKSUM_LAYOUT: Final = Struct(">QQI")
+
+# Lookup-Tabellen statt Verzweigungen je Frame; 0 bzw. None = ungültig.
+_SIGNS: Final = tuple(
+    1 if byte in (0x2B, 0x00) else -1 if byte == 0x2D else 0 for byte in range(256)
+)
+_UNITS: Final = tuple(
+    UnitMass.OUNCES if byte == 0x01 else UnitMass.GRAMS if byte == 0x02 else None
+    for byte in range(256)
+)
+
+Payload = bytes | bytearray | memoryview
+
 
-@dataclass
 class BookooMessage:
     """Inhalt eines Gewichtspakets der Bookoo Themis Ultra."""
 
-    def __init__(self, payload: bytearray) -> None:
-        """Initialisiere eine Nachricht des Ultra-Protokolls."""
-
-        self.timer: float | None = (
-            int.from_bytes(
-                payload[2:5],
-                byteorder="big",  # time in milliseconds
-            )
-            / 1000.0  # time in seconds
-        )
-        self.unit: UnitMass
-        if payload[5] == 0x01:
-            self.unit = UnitMass.OUNCES
-        elif payload[5] == 0x02:
-            self.unit = UnitMass.GRAMS
-        else:
-            raise BookooMessageError(payload, "Unsupported unit byte")
-
-        weight_sign = 1 if payload[6] in (0x2B, 0x00) else -1 if payload[6] == 0x2D else None
-        if weight_sign is None:
-            raise BookooMessageError(payload, "Unsupported weight sign byte")
-        self.weight = (
-            int.from_bytes(payload[7:10], byteorder="big") / 100.0 * weight_sign
-        )  # Convert to grams
-
-        flow_sign = 1 if payload[10] in (0x2B, 0x00) else -1 if payload[10] == 0x2D else None
-        if flow_sign is None:
-            raise BookooMessageError(payload, "Unsupported flow sign byte")
-        self.flow_rate = (
-            int.from_bytes(payload[11:13], byteorder="big") / 100.0 * flow_sign
-        )  # Convert to ml
-        self.battery = payload[13]  # battery level in percent
-        self.standby_time = int.from_bytes(payload[14:16], byteorder="big")  # minutes
-        self.buzzer_gear = payload[16]
-        self.flow_rate_smoothing = payload[17]  # 0 = off, 1 = on
-        self.stop_condition = payload[18]
-
-        # Verify checksum
-        checksum = 0
-        for byte in payload[:-1]:
-            checksum ^= byte
-        if checksum != payload[-1]:
-            raise BookooMessageError(payload, "Checksum mismatch")
-
-        # _LOGGER.debug(
-        #     "Bookoo Message: unit=%s, weight=%s, time=%s, battery=%s, flowRate=%s, standbyTime=%s, buzzerGear=%s, flowRateSmoothing=%s",
-        #     self.unit,
-        #     self.weight,
-        #     self.timer,
-        #     self.battery,
-        #     self.flow_rate,
-        #     self.standby_time,
-        #     self.buzzer_gear,
-        #     self.flow_rate_smoothing,
-        # )
+    __slots__ = (
+        "timer",
+        "unit",
+        "weight",
+        "flow_rate",
+        "battery",
+        "standby_time",
+        "buzzer_gear",
+        "flow_rate_smoothing",
+        "stop_condition",
+    )
+
+    timer: float | None
+    unit: UnitMass
+    weight: float
+    flow_rate: float
+    battery: int
+    standby_time: int
+    buzzer_gear: int
+    flow_rate_smoothing: int
+    stop_condition: int
+
+    def __init__(self, payload: Payload | None = None) -> None:
+        """Initialisiere eine Nachricht des Ultra-Protokolls.
+
+        Ohne `payload` entsteht eine leere Nachricht, die mit `decode_frame`
+        wiederverwendet werden kann.
+        """
+
+        if payload is not None:
+            _unpack_into(self, payload)
+
+
+def checksum_valid(payload: Payload, offset: int = 0) -> bool:
+    """Return True if the 20 frame bytes at `offset` XOR to zero."""
+
+    high, low, tail = _CHECKSUM_LAYOUT.unpack_from(payload, offset)
+    folded = high ^ low
+    folded = (folded >> 32) ^ (folded & 0xFFFFFFFF) ^ tail
+    folded = (folded >> 16) ^ (folded & 0xFFFF)
+    return (folded >> 8) == (folded & 0xFF)
+
+
+def _unpack_into(msg: BookooMessage, payload: Payload) -> BookooMessage:
+    """Validate a 20-byte weight frame and write its fields into `msg`.
+
+    The fields are only assigned once the whole frame is valid, so a reused
+    message keeps its previous content when an exception is raised.
+    """
+
+    (
+        _header1,
+        _header2,
+        timer_high,
+        timer_low,
+        unit_byte,
+        weight_sign_byte,
+        weight_high,
+        weight_low,
+        flow_sign_byte,
+        flow,
+        battery,
+        standby_time,
+        buzzer_gear,
+        flow_rate_smoothing,
+        stop_condition,
+        _checksum,
+    ) = _FRAME_LAYOUT.unpack_from(payload)
+
+    if not checksum_valid(payload):
+        raise BookooChecksumMismatch(bytearray(payload))
+    if (unit := _UNITS[unit_byte]) is None:
+        raise BookooMessageError(bytearray(payload), "Unsupported unit byte")
+    if not (weight_sign := _SIGNS[weight_sign_byte]):
+        raise BookooMessageError(bytearray(payload), "Unsupported weight sign byte")
+    if not (flow_sign := _SIGNS[flow_sign_byte]):
+        raise BookooMessageError(bytearray(payload), "Unsupported flow sign byte")
+
+    msg.timer = ((timer_high << 16) | timer_low) / 1000.0  # time in seconds
+    msg.unit = unit
+    msg.weight = ((weight_high << 16) | weight_low) / 100.0 * weight_sign  # grams
+    msg.flow_rate = flow / 100.0 * flow_sign  # ml/s
+    msg.battery = battery  # battery level in percent
+    msg.standby_time = standby_time  # minutes
+    msg.buzzer_gear = buzzer_gear
+    msg.flow_rate_smoothing = flow_rate_smoothing  # 0 = off, 1 = on
+    msg.stop_condition = stop_condition
+    return msg
+
+
+def decode_frame(
+    payload: Payload, into: BookooMessage | None = None
+) -> BookooMessage | None:
+    """Decode a single notification without copying the payload.
+
+    Returns `into` (or a new message) for weight frames and None for frames
+    with a foreign header. Malformed weight frames raise a
+    `BookooMessageError`.
+    """
+
+    size = len(payload)
+    if size != FRAME_LENGTH:
+        if size < FRAME_LENGTH:
+            raise BookooMessageTooShort(bytearray(payload))
+        raise BookooMessageTooLong(bytearray(payload))
+
+    if payload[0] != WEIGHT_BYTE1 or payload[1] != WEIGHT_BYTE2:
+        return None
+
+    return _unpack_into(BookooMessage() if into is None else into, payload)
 
 
 def decode(byte_msg: bytearray):
@@ -77,18 +170,18 @@ def decode(byte_msg: bytearray):
 
     """
 
-    if len(byte_msg) < 20:
-        raise BookooMessageTooShort(byte_msg)
-
-    if len(byte_msg) > 20:
-        raise BookooMessageTooLong(byte_msg)
-
-    if byte_msg[0] == WEIGHT_BYTE1 and byte_msg[1] == WEIGHT_BYTE2:
-        # _LOGGER.debug("Found valid weight Message")
-        return (BookooMessage(byte_msg), bytearray())
+    msg = decode_frame(byte_msg)
+    if msg is not None:
+        return (msg, bytearray())
 
     _LOGGER.debug("Full message: %s", byte_msg)
     return (None, byte_msg)
 
 
-__all__ = ["BookooMessage", "decode"]
+__all__ = [
+    "FRAME_LENGTH",
+    "BookooMessage",
+    "checksum_valid",
+    "decode",
+    "decode_frame",
+]
@@ -0,0 +1,128 @@
+"""Host-seitige Schätzung von Gewicht und Flussrate."""
+
+from __future__ import annotations
+
+import math
+
+DEFAULT_PROCESS_NOISE = 2.0
+DEFAULT_MEASUREMENT_NOISE = 0.01
+
+
+class FlowEstimator:
+    """Kalman-Filter über Gewicht und Flussrate aus dem rohen Gewichtsstrom.
+
+    The state is weight and its rate of change under a constant-velocity
+    model; flow changes are modelled as white noise with spectral density
+    `process_noise` (g²/s³), readings have variance `measurement_noise`
+    (g²). Each update is O(1) and allocation-free. Jumps larger than
+    `reset_threshold` grams (tare, cup placed or removed) and gaps longer
+    than `max_gap` seconds restart the filter.
+    """
+
+    __slots__ = (
+        "_flow",
+        "_last_time",
+        "_p00",
+        "_p01",
+        "_p11",
+        "_settled_weight",
+        "_weight",
+        "max_gap",
+        "measurement_noise",
+        "process_noise",
+        "reset_threshold",
+        "settle_flow",
+    )
+
+    def __init__(
+        self,
+        process_noise: float = DEFAULT_PROCESS_NOISE,
+        measurement_noise: float = DEFAULT_MEASUREMENT_NOISE,
+        *,
+        settle_flow: float = 0.05,
+        reset_threshold: float = 5.0,
+        max_gap: float = 2.0,
+    ) -> None:
+        """Initialize the estimator."""
+        if process_noise <= 0 or measurement_noise <= 0:
+            raise ValueError("Noise parameters must be positive")
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.settle_flow = settle_flow
+        self.reset_threshold = reset_threshold
+        self.max_gap = max_gap
+        self._last_time: float | None = None
+        self._weight = 0.0
+        self._flow = 0.0
+        self._p00 = self._p01 = self._p11 = 0.0
+        self._settled_weight: float | None = None
+
+    @property
+    def weight(self) -> float | None:
+        """Return the filtered weight in grams."""
+        return None if self._last_time is None else self._weight
+
+    @property
+    def flow_rate(self) -> float | None:
+        """Return the estimated flow rate in g/s."""
+        return None if self._last_time is None else self._flow
+
+    @property
+    def settled_weight(self) -> float | None:
+        """Return the filtered weight from the last time the flow was still."""
+        return self._settled_weight
+
+    def reset(self, timestamp: float | None = None, weight: float = 0.0) -> None:
+        """Restart the filter, optionally at a known weight."""
+        self._last_time = timestamp
+        self._weight = weight
+        self._flow = 0.0
+        self._p00 = self.measurement_noise
+        self._p01 = 0.0
+        self._p11 = 1.0
+
+    def update(self, timestamp: float, weight: float) -> None:
+        """Fold one weight reading taken at `timestamp` into the estimate."""
+        last_time = self._last_time
+        if last_time is None or timestamp - last_time > self.max_gap:
+            self.reset(timestamp, weight)
+            return
+
+        # predict
+        dt = timestamp - last_time
+        if dt > 0:
+            q = self.process_noise
+            dt2 = dt * dt
+            self._weight += self._flow * dt
+            p11 = self._p11
+            p01 = self._p01 + p11 * dt
+            self._p00 += (2 * self._p01 + p11 * dt) * dt + q * dt2 * dt / 3
+            self._p01 = p01 + q * dt2 / 2
+            self._p11 = p11 + q * dt
+            self._last_time = timestamp
+
+        # correct
+        residual = weight - self._weight
+        innovation = self._p00 + self.measurement_noise
+        if abs(residual) > self.reset_threshold and residual * residual > (
+            9 * innovation
+        ):
+            self.reset(timestamp, weight)
+            return
+        gain_weight = self._p00 / innovation
+        gain_flow = self._p01 / innovation
+        self._weight += gain_weight * residual
+        self._flow += gain_flow * residual
+        self._p11 -= gain_flow * self._p01
+        self._p00 -= gain_weight * self._p00
+        self._p01 -= gain_weight * self._p01
+
+        if math.fabs(self._flow) < self.settle_flow:
+            self._settled_weight = self._weight
+
+
+__all__ = [
+    "DEFAULT_MEASUREMENT_NOISE",
+    "DEFAULT_PROCESS_NOISE",
+    "FlowEstimator",
+]
@@ -15,6 +15,10 @@ class BookooError(BleakError):
     """Exception für allgemeine BLE-Fehler."""
 
 
+class BookooCommandNotConfirmed(BookooError):
+    """Exception wenn die Waage einen Befehl nicht bestätigt hat."""
+
+
 class BookooUnknownDevice(Exception):
     """Exception für unbekannte Geräte."""
 
@@ -42,12 +46,21 @@ class BookooMessageTooLong(BookooMessageError):
         super().__init__(bytes_recvd, "Message too long")
 
 
+class BookooChecksumMismatch(BookooMessageError):
+    """Exception für Nachrichten mit falscher Prüfsumme."""
+
+    def __init__(self, bytes_recvd: bytearray) -> None:
+        super().__init__(bytes_recvd, "Checksum mismatch")
+
+
 __all__ = [
     "BookooScaleException",
     "BookooDeviceNotFound",
     "BookooError",
+    "BookooCommandNotConfirmed",
     "BookooUnknownDevice",
     "BookooMessageError",
     "BookooMessageTooShort",
     "BookooMessageTooLong",
+    "BookooChecksumMismatch",
 ]
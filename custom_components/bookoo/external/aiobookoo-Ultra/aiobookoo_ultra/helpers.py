@@ -1,15 +1,20 @@
 """Hilfsfunktionen für Bookoo Themis Ultra."""
 
+from collections.abc import Iterable
 import logging
 
 from bleak import BleakClient, BleakScanner, BLEDevice
+from bleak.backends.scanner import AdvertisementData
 from bleak.exc import BleakDeviceNotFoundError, BleakError
 
-from .const import CHARACTERISTIC_UUID_WEIGHT, SCALE_START_NAMES
+from .const import CHARACTERISTIC_UUID_WEIGHT, SCALE_START_NAMES, SERVICE_UUID
 from .exceptions import BookooDeviceNotFound, BookooError, BookooUnknownDevice
 
 _LOGGER = logging.getLogger("aiobookoo_ultra")
 
+# validation results per upper-case address
+_VALIDATED: dict[str, bool] = {}
+
 
 async def find_bookoo_devices(timeout=10, scanner: BleakScanner | None = None) -> list:
     """Finde BOOKOO-Geräte."""
@@ -22,36 +27,82 @@ async def find_bookoo_devices(timeout=10, scanner: BleakScanner | None = None) -
         return await scan(scanner, timeout)
 
 
+def is_bookoo_advertisement(name: str | None, service_uuids: Iterable[str]) -> bool:
+    """Prüfe anhand von Name und Service-UUIDs, ob eine Bookoo-Waage wirbt."""
+    if name and any(name.startswith(prefix) for prefix in SCALE_START_NAMES):
+        return True
+    return SERVICE_UUID in service_uuids
+
+
+def _is_bookoo_detection(device: BLEDevice, advertisement: AdvertisementData) -> bool:
+    _LOGGER.debug(
+        "Found device with name: %s and address: %s", device.name, device.address
+    )
+    return is_bookoo_advertisement(
+        advertisement.local_name or device.name, advertisement.service_uuids
+    )
+
+
 async def scan(scanner: BleakScanner, timeout) -> list:
-    """Scanne nach Geräten."""
-    addresses = []
+    """Scanne nach Geräten, bis das erste passende gefunden ist."""
+
+    device = await scanner.find_device_by_filter(_is_bookoo_detection, timeout=timeout)
+    return [device.address] if device is not None else []
+
 
-    devices = await scanner.discover(timeout=timeout)
-    for d in devices:
-        _LOGGER.debug("Found device with name: %s and address: %s", d.name, d.address)
-        if d.name and any(d.name.startswith(name) for name in SCALE_START_NAMES):
-            addresses.append(d.address)
+async def is_bookoo_scale(
+    address_or_ble_device: str | BLEDevice,
+    advertisement: AdvertisementData | None = None,
+) -> bool:
+    """Prüfe, ob es sich um eine Themis-Ultra-Waage handelt.
 
-    return addresses
+    The advertisement, if given, and the name of a passed BLE device are
+    checked first; only when they do not identify the scale a connection
+    is opened to look for the weight characteristic. Results are cached
+    per address.
+    """
 
+    if isinstance(address_or_ble_device, str):
+        address, name = address_or_ble_device, None
+    else:
+        address, name = address_or_ble_device.address, address_or_ble_device.name
+    address = address.upper()
+    if (valid := _VALIDATED.get(address)) is None:
+        service_uuids: Iterable[str] = ()
+        if advertisement is not None:
+            name = advertisement.local_name or name
+            service_uuids = advertisement.service_uuids
+        if is_bookoo_advertisement(name, service_uuids):
+            valid = True
+        else:
+            valid = await _probe_characteristic(address_or_ble_device)
+        _VALIDATED[address] = valid
+
+    if valid:
+        return True
+
+    raise BookooUnknownDevice
 
-async def is_bookoo_scale(address_or_ble_device: str | BLEDevice) -> bool:
-    """Prüfe, ob es sich um eine Themis-Ultra-Waage handelt."""
+
+async def _probe_characteristic(address_or_ble_device: str | BLEDevice) -> bool:
+    """Connect and look up the weight characteristic."""
 
     try:
         async with BleakClient(address_or_ble_device) as client:
-            characteristics = [
-                char.uuid for char in client.services.characteristics.values()
-            ]
+            characteristic = client.services.get_characteristic(
+                CHARACTERISTIC_UUID_WEIGHT
+            )
     except BleakDeviceNotFoundError as ex:
         raise BookooDeviceNotFound("Device not found") from ex
     except (BleakError, Exception) as ex:
         raise BookooError(ex) from ex
 
-    if CHARACTERISTIC_UUID_WEIGHT in characteristics:
-        return True
-
-    raise BookooUnknownDevice
+    return characteristic is not None
 
 
-__all__ = ["find_bookoo_devices", "is_bookoo_scale", "scan"]
+__all__ = [
+    "find_bookoo_devices",
+    "is_bookoo_advertisement",
+    "is_bookoo_scale",
+    "scan",
+]
@@ -0,0 +1,176 @@
+"""Ringpuffer der zuletzt empfangenen Messwerte."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import time
+
+from .const import DEFAULT_HISTORY_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryWindow:
+    """Chronologisch sortierter Ausschnitt des Ringpuffers."""
+
+    time: array  # monotonic seconds
+    weight: array  # grams
+    flow_rate: array  # ml/s
+    timer: array  # seconds
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.time)
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Kennzahlen über ein Zeitfenster."""
+
+    count: int
+    duration: float
+    weight_min: float
+    weight_max: float
+    weight_mean: float
+    weight_delta: float
+    flow_rate_mean: float
+    flow_rate_max: float
+
+
+class SampleHistory:
+    """Ringpuffer fester Kapazität mit Zeitstempel, Gewicht, Flow und Timer.
+
+    Samples are stored column-wise in preallocated arrays, so appending is
+    O(1) and does not create a Python object per sample. Timestamps must be
+    non-decreasing (e.g. `time.monotonic()`).
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_flow_rate",
+        "_next",
+        "_size",
+        "_time",
+        "_timer",
+        "_weight",
+    )
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE) -> None:
+        """Initialize the buffer."""
+        if capacity < 1:
+            raise ValueError("History capacity must be positive")
+        self._capacity = capacity
+        self._time = array("d", bytes(8 * capacity))
+        self._weight = array("d", bytes(8 * capacity))
+        self._flow_rate = array("d", bytes(8 * capacity))
+        self._timer = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of samples."""
+        return self._capacity
+
+    def append(
+        self, timestamp: float, weight: float, flow_rate: float, timer: float
+    ) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        index = self._next
+        self._time[index] = timestamp
+        self._weight[index] = weight
+        self._flow_rate[index] = flow_rate
+        self._timer[index] = timer
+        self._next = index + 1 if index + 1 < self._capacity else 0
+        if self._size < self._capacity:
+            self._size += 1
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._next = 0
+        self._size = 0
+
+    def _physical(self, logical: int) -> int:
+        """Map a logical index (0 = oldest sample) to a buffer index."""
+        index = self._next - self._size + logical
+        return index + self._capacity if index < 0 else index
+
+    def _window(self, first: int) -> HistoryWindow:
+        """Copy the samples from logical index `first` to the newest one."""
+        count = self._size - first
+        start = self._physical(first) if count else 0
+        end = start + count
+        columns = []
+        for column in (self._time, self._weight, self._flow_rate, self._timer):
+            if end <= self._capacity:
+                columns.append(column[start:end])
+            else:
+                columns.append(column[start:] + column[: end - self._capacity])
+        return HistoryWindow(*columns)
+
+    def _first_at_or_after(self, timestamp: float) -> int:
+        """Binary search the logical index of the first sample >= timestamp."""
+        low, high = 0, self._size
+        times = self._time
+        while low < high:
+            middle = (low + high) // 2
+            if times[self._physical(middle)] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def last_n(self, n: int) -> HistoryWindow:
+        """Return the newest `n` samples."""
+        return self._window(self._size - min(max(n, 0), self._size))
+
+    def samples_since(self, timestamp: float) -> HistoryWindow:
+        """Return all samples taken at or after `timestamp`."""
+        return self._window(self._first_at_or_after(timestamp))
+
+    def window_stats(
+        self, seconds: float, now: float | None = None
+    ) -> WindowStats | None:
+        """Return statistics over the last `seconds`, None if empty."""
+        if now is None:
+            now = time.monotonic()
+        first = self._first_at_or_after(now - seconds)
+        count = self._size - first
+        if count <= 0:
+            return None
+
+        weight_min = weight_max = self._weight[self._physical(first)]
+        weight_sum = flow_sum = 0.0
+        flow_max = self._flow_rate[self._physical(first)]
+        for logical in range(first, self._size):
+            index = self._physical(logical)
+            weight = self._weight[index]
+            flow_rate = self._flow_rate[index]
+            weight_sum += weight
+            flow_sum += flow_rate
+            if weight < weight_min:
+                weight_min = weight
+            elif weight > weight_max:
+                weight_max = weight
+            if flow_rate > flow_max:
+                flow_max = flow_rate
+
+        first_index = self._physical(first)
+        last_index = self._physical(self._size - 1)
+        return WindowStats(
+            count=count,
+            duration=self._time[last_index] - self._time[first_index],
+            weight_min=weight_min,
+            weight_max=weight_max,
+            weight_mean=weight_sum / count,
+            weight_delta=self._weight[last_index] - self._weight[first_index],
+            flow_rate_mean=flow_sum / count,
+            flow_rate_max=flow_max,
+        )
+
+
+__all__ = ["HistoryWindow", "SampleHistory", "WindowStats"]
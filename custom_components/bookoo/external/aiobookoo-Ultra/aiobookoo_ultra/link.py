@@ -0,0 +1,111 @@
+"""Verbindungsqualität aus dem Gerätetimer."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter, deque
+
+# the scale notifies at about 10 Hz, the interval is refined from the timer
+DEFAULT_FRAME_INTERVAL = 0.1
+INTERVAL_SMOOTHING = 0.05
+LOSS_WINDOW = 600  # received frames, about a minute at 10 Hz
+
+# gap buckets by missing frames: 1, 2-3, 4-7, 8-15, 16-31, 32+
+GAP_BUCKETS = ("1", "2-3", "4-7", "8-15", "16-31", "32+")
+
+
+class LinkQuality:
+    """Paketverlust und Dekodierfehler einer Verbindung.
+
+    While the device timer runs it advances by one frame interval per
+    notification, so it serves as a sequence number: a step of n intervals
+    means n - 1 notifications were lost. Frames with a stopped, reset or
+    jumping-back timer are received but not counted for loss.
+    """
+
+    __slots__ = (
+        "_gaps",
+        "_last_timer",
+        "_window",
+        "_window_expected",
+        "decode_errors",
+        "expected",
+        "frame_interval",
+        "missed",
+        "received",
+        "rssi",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.frame_interval = DEFAULT_FRAME_INTERVAL
+        self.expected = 0
+        self.received = 0
+        self.missed = 0
+        self._gaps = array("Q", bytes(8 * len(GAP_BUCKETS)))
+        self._window: deque[int] = deque(maxlen=LOSS_WINDOW)
+        self._window_expected = 0
+        self._last_timer: float | None = None
+        self.decode_errors: Counter[str] = Counter()
+        self.rssi: int | None = None
+
+    def frame(self, timer: float | None) -> None:
+        """Account one decoded frame by its device timer in seconds."""
+        last_timer = self._last_timer
+        self._last_timer = timer
+        if last_timer is None or timer is None or timer <= last_timer:
+            return
+
+        delta = timer - last_timer
+        interval = self.frame_interval
+        steps = max(round(delta / interval), 1)
+        if steps == 1:
+            self.frame_interval = interval + INTERVAL_SMOOTHING * (delta - interval)
+        self.expected += steps
+        self.received += 1
+        if steps > 1:
+            missing = steps - 1
+            self.missed += missing
+            self._gaps[min(missing.bit_length(), len(GAP_BUCKETS)) - 1] += 1
+
+        window = self._window
+        if len(window) == window.maxlen:
+            self._window_expected -= window[0]
+        window.append(steps)
+        self._window_expected += steps
+
+    def decode_error(self, error_type: type[Exception]) -> None:
+        """Count a frame rejected by the decoder, by exception type."""
+        self.decode_errors[error_type.__name__] += 1
+
+    def reset_sequence(self) -> None:
+        """Forget the last timer, e.g. after a reconnect."""
+        self._last_timer = None
+
+    @property
+    def loss(self) -> float | None:
+        """Return the lost share of the last frames in percent."""
+        if not self._window_expected:
+            return None
+        return 100 * (1 - len(self._window) / self._window_expected)
+
+    @property
+    def gaps(self) -> dict[str, int]:
+        """Return the number of gaps per length bucket."""
+        return dict(zip(GAP_BUCKETS, self._gaps, strict=True))
+
+    def as_dict(self) -> dict[str, object]:
+        """Return all counters, e.g. for diagnostics."""
+        return {
+            "frame_interval": self.frame_interval,
+            "expected": self.expected,
+            "received": self.received,
+            "missed": self.missed,
+            "loss": self.loss,
+            "gaps": self.gaps,
+            "decode_errors": dict(self.decode_errors),
+            "rssi": self.rssi,
+        }
+
+
+__all__ = ["LinkQuality"]
@@ -0,0 +1,199 @@
+"""Laufzeitmessung des Empfangspfads."""
+
+from __future__ import annotations
+
+from array import array
+
+# bucket i counts durations below 2**i microseconds, the last one is open
+HISTOGRAM_BUCKETS = 24
+RATE_SMOOTHING = 0.05
+
+
+class LatencyHistogram:
+    """Histogramm mit logarithmischen Buckets für Zeitdauern.
+
+    Recording is O(1) and allocation-free: the bucket index is the bit
+    length of the duration in whole microseconds. Percentiles are reported
+    as the upper bound of the bucket they fall into.
+    """
+
+    __slots__ = ("_buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets = array("Q", bytes(8 * HISTOGRAM_BUCKETS))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration in seconds."""
+        if seconds < 0:
+            seconds = 0.0
+        index = int(seconds * 1_000_000).bit_length()
+        self._buckets[index if index < HISTOGRAM_BUCKETS else -1] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def clear(self) -> None:
+        """Drop all recorded durations."""
+        for index in range(HISTOGRAM_BUCKETS):
+            self._buckets[index] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration in seconds."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which `fraction` of durations lie."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self._buckets):
+            seen += bucket
+            if seen >= rank:
+                return min((1 << index) / 1_000_000, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, object]:
+        """Return summary values in milliseconds and the non-empty buckets."""
+
+        def _ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.mean),
+            "p50_ms": _ms(self.percentile(0.5)),
+            "p95_ms": _ms(self.percentile(0.95)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "max_ms": _ms(self.max if self.count else None),
+            "buckets_ms": {
+                f"<{(1 << index) / 1000:g}": bucket
+                for index, bucket in enumerate(self._buckets)
+                if bucket
+            },
+        }
+
+
+class IngestMetrics:
+    """Zeitstempel und Histogramme vom BLE-Empfang bis zum Entity-Update.
+
+    The scale stamps each notification on receipt and after decoding; the
+    consumer stamps the dispatch of its callback and the state writes.
+    All stamps are `time.monotonic()` seconds. When the sample time is
+    known from the device clock, the delay before receipt and the age of
+    the sample at the state write are recorded as well.
+    """
+
+    __slots__ = (
+        "_interval",
+        "decode",
+        "dispatch",
+        "end_to_end",
+        "event_loop_lag",
+        "frames",
+        "inter_arrival",
+        "last_decoded",
+        "last_received",
+        "last_sample",
+        "transport",
+        "write",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty histograms."""
+        self.inter_arrival = LatencyHistogram()
+        self.decode = LatencyHistogram()
+        self.dispatch = LatencyHistogram()
+        self.write = LatencyHistogram()
+        self.event_loop_lag = LatencyHistogram()
+        self.transport = LatencyHistogram()
+        self.end_to_end = LatencyHistogram()
+        self.frames = 0
+        self.last_received: float | None = None
+        self.last_decoded: float | None = None
+        self.last_sample: float | None = None
+        self._interval: float | None = None
+
+    @property
+    def notification_rate(self) -> float | None:
+        """Return the smoothed number of notifications per second."""
+        return 1 / self._interval if self._interval else None
+
+    def frame_received(self, timestamp: float) -> None:
+        """Stamp the receipt of a notification."""
+        if (last := self.last_received) is not None:
+            interval = timestamp - last
+            self.inter_arrival.record(interval)
+            self._interval = (
+                interval
+                if self._interval is None
+                else self._interval + RATE_SMOOTHING * (interval - self._interval)
+            )
+        self.last_received = timestamp
+        self.frames += 1
+
+    def frame_decoded(self, timestamp: float) -> None:
+        """Stamp the end of decoding the last received notification."""
+        self.last_decoded = timestamp
+        if self.last_received is not None:
+            self.decode.record(timestamp - self.last_received)
+
+    def frame_aligned(self, sample_time: float) -> None:
+        """Stamp the device-clock time at which the last frame was taken."""
+        self.last_sample = sample_time
+        if self.last_received is not None:
+            self.transport.record(self.last_received - sample_time)
+
+    def callback_dispatched(self, timestamp: float) -> None:
+        """Stamp the dispatch of the notify callback."""
+        if self.last_received is not None:
+            self.dispatch.record(timestamp - self.last_received)
+
+    def state_written(self, timestamp: float) -> None:
+        """Stamp an entity state write caused by the last notification."""
+        if self.last_received is not None:
+            self.write.record(timestamp - self.last_received)
+        if self.last_sample is not None:
+            self.end_to_end.record(timestamp - self.last_sample)
+
+    def clear(self) -> None:
+        """Reset all histograms and stamps."""
+        for histogram in (
+            self.inter_arrival,
+            self.decode,
+            self.dispatch,
+            self.write,
+            self.event_loop_lag,
+            self.transport,
+            self.end_to_end,
+        ):
+            histogram.clear()
+        self.frames = 0
+        self.last_received = self.last_decoded = self.last_sample = None
+        self._interval = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return all histograms, e.g. for diagnostics."""
+        return {
+            "frames": self.frames,
+            "notification_rate": self.notification_rate,
+            "inter_arrival": self.inter_arrival.as_dict(),
+            "decode": self.decode.as_dict(),
+            "dispatch": self.dispatch.as_dict(),
+            "write": self.write.as_dict(),
+            "event_loop_lag": self.event_loop_lag.as_dict(),
+            "transport": self.transport.as_dict(),
+            "end_to_end": self.end_to_end.as_dict(),
+        }
+
+
+__all__ = ["IngestMetrics", "LatencyHistogram"]
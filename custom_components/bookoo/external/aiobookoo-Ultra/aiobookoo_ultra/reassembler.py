@@ -0,0 +1,124 @@
+"""Zusammensetzen von Gewichtsnachrichten aus einem Bytestrom."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from .const import WEIGHT_BYTE1, WEIGHT_BYTE2
+from .decode import FRAME_LENGTH, Payload, checksum_valid
+from .exceptions import (
+    BookooChecksumMismatch,
+    BookooMessageError,
+    BookooMessageTooLong,
+    BookooMessageTooShort,
+)
+
+_HEADER = bytes((WEIGHT_BYTE1, WEIGHT_BYTE2))
+
+
+class FrameReassembler:
+    """Puffer, der aus beliebig zerteilten Notifications Frames gewinnt.
+
+    Notifications may carry a fragment of a frame or several frames at
+    once (e.g. through Bluetooth proxies). Bytes are appended to a buffer
+    that is scanned for the weight header; a candidate is only accepted if
+    its checksum is valid, otherwise the scan resumes one byte later.
+    Skipped bytes are counted in `bytes_discarded`, every skipped run in
+    `resyncs`.
+
+    Rejected input is reported to `on_error` by type: a candidate cut off
+    by the next header is too short, bytes trailing a frame before the
+    next header make it too long, and other candidates failed their
+    checksum.
+    """
+
+    __slots__ = ("_buffer", "_on_error", "bytes_discarded", "frames", "resyncs")
+
+    def __init__(
+        self, on_error: Callable[[type[BookooMessageError]], None] | None = None
+    ) -> None:
+        """Initialize an empty buffer."""
+        self._buffer = bytearray()
+        self._on_error = on_error
+        self.frames = 0
+        self.resyncs = 0
+        self.bytes_discarded = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes not yet part of a frame."""
+        return len(self._buffer)
+
+    def feed(self, data: Payload) -> list[bytes]:
+        """Append received bytes and return all frames completed by them."""
+        buffer = self._buffer
+        buffer += data
+        size = len(buffer)
+        frames: list[bytes] = []
+        position = 0
+        # set while the bytes at `position` directly follow a frame
+        after_frame = False
+        while size - position >= len(_HEADER):
+            start = buffer.find(_HEADER, position)
+            if start < 0:
+                # keep a trailing first header byte, its partner may follow
+                start = size - 1 if buffer[-1] == WEIGHT_BYTE1 else size
+                if after_frame and start > position:
+                    self._error(BookooMessageTooLong)
+                self._discard(start - position)
+                position = start
+                break
+            if start > position:
+                if after_frame:
+                    self._error(BookooMessageTooLong)
+                self._discard(start - position)
+                position = start
+            after_frame = False
+            if size - position < FRAME_LENGTH:
+                break
+            if not checksum_valid(buffer, position):
+                next_header = buffer.find(
+                    _HEADER, position + 1, position + FRAME_LENGTH
+                )
+                if next_header < 0:
+                    # a header inside corrupted data, rescan after it
+                    self._error(BookooChecksumMismatch)
+                    self._discard(1)
+                    position += 1
+                else:
+                    # cut off by the next frame
+                    self._error(BookooMessageTooShort)
+                    self._discard(next_header - position)
+                    position = next_header
+                continue
+            frames.append(bytes(buffer[position : position + FRAME_LENGTH]))
+            position += FRAME_LENGTH
+            after_frame = True
+        del buffer[:position]
+        self.frames += len(frames)
+        return frames
+
+    def _error(self, error_type: type[BookooMessageError]) -> None:
+        if self._on_error is not None:
+            self._on_error(error_type)
+
+    def _discard(self, count: int) -> None:
+        if count:
+            self.resyncs += 1
+            self.bytes_discarded += count
+
+    def clear(self) -> None:
+        """Drop buffered bytes, e.g. after a reconnect."""
+        self._buffer.clear()
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters, e.g. for diagnostics."""
+        return {
+            "frames": self.frames,
+            "resyncs": self.resyncs,
+            "bytes_discarded": self.bytes_discarded,
+            "pending": self.pending,
+        }
+
+
+__all__ = ["FrameReassembler"]
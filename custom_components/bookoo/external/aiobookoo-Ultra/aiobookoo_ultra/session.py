@@ -0,0 +1,270 @@
+"""Erkennung von Espresso-Bezügen aus dem Messwertstrom."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import StrEnum
+
+from .history import HistoryWindow, SampleHistory
+
+
+class ShotTrigger(StrEnum):
+    """Auslöser für Beginn bzw. Ende eines Bezugs."""
+
+    TIMER = "timer"
+    FLOW = "flow"
+    TIMER_RESET = "timer_reset"
+    TIMEOUT = "timeout"
+
+
+@dataclass(frozen=True, slots=True)
+class ShotSummary:
+    """Zusammenfassung eines abgeschlossenen Bezugs."""
+
+    start: float  # monotonic seconds
+    end: float  # monotonic seconds
+    started_by: ShotTrigger
+    ended_by: ShotTrigger
+    dose: float | None  # grams, weight removed by the tare before the shot
+    yield_weight: float  # grams
+    ratio: float | None  # yield / dose
+    total_time: float  # seconds
+    time_to_first_drip: float | None  # seconds
+    peak_flow_rate: float  # ml/s
+    mean_flow_rate: float  # ml/s
+    trace: HistoryWindow | None = None
+
+    def as_dict(self) -> dict[str, float | str | None]:
+        """Return the summary without the trace, e.g. for event data."""
+        return {
+            "started_by": self.started_by.value,
+            "ended_by": self.ended_by.value,
+            "dose": self.dose,
+            "yield": self.yield_weight,
+            "ratio": self.ratio,
+            "total_time": self.total_time,
+            "time_to_first_drip": self.time_to_first_drip,
+            "peak_flow_rate": self.peak_flow_rate,
+            "mean_flow_rate": self.mean_flow_rate,
+        }
+
+
+class ShotDetector:
+    """Zustandsautomat, der aus Timer, Tara und Flow Bezüge erkennt.
+
+    A shot starts when the device timer starts advancing, or when flow
+    sets in shortly after a tare while the timer is idle. It ends when the
+    timer stops or is reset, or, for flow-started shots, once the flow has
+    stayed below `flow_end` for `flow_end_time` seconds.
+    """
+
+    def __init__(
+        self,
+        history: SampleHistory | None = None,
+        *,
+        tare_threshold: float = 0.3,
+        min_dose: float = 3.0,
+        max_dose: float = 40.0,
+        tare_window: float = 300.0,
+        flow_onset: float = 0.3,
+        onset_samples: int = 3,
+        flow_end: float = 0.1,
+        flow_end_time: float = 3.0,
+        timer_stall_time: float = 1.0,
+        first_drip_weight: float = 0.5,
+        min_shot_time: float = 5.0,
+        max_shot_time: float = 180.0,
+    ) -> None:
+        """Initialize the detector, `history` is used to cut out the trace."""
+        self._history = history
+        self._tare_threshold = tare_threshold
+        self._min_dose = min_dose
+        self._max_dose = max_dose
+        self._tare_window = tare_window
+        self._flow_onset = flow_onset
+        self._onset_samples = onset_samples
+        self._flow_end = flow_end
+        self._flow_end_time = flow_end_time
+        self._timer_stall_time = timer_stall_time
+        self._first_drip_weight = first_drip_weight
+        self._min_shot_time = min_shot_time
+        self._max_shot_time = max_shot_time
+
+        self._last_weight: float | None = None
+        self._last_timer: float | None = None
+        self._timer_advanced_at: float | None = None
+        self._dose: float | None = None
+        self._dose_time: float | None = None
+        self._tare_time: float | None = None
+        self._onset_count = 0
+        self._onset_at = 0.0
+        self._reset_shot()
+
+    def _reset_shot(self) -> None:
+        """Forget the shot in progress."""
+        self._active = False
+        self._start = 0.0
+        self._started_by = ShotTrigger.TIMER
+        self._first_drip: float | None = None
+        self._last_flow_at = 0.0
+        self._last_weight_in_shot = 0.0
+        self._peak_flow = 0.0
+        self._flow_sum = 0.0
+        self._flow_count = 0
+
+    @property
+    def active(self) -> bool:
+        """Return True while a shot is in progress."""
+        return self._active
+
+    def update(
+        self, timestamp: float, weight: float, flow_rate: float, timer: float
+    ) -> ShotSummary | None:
+        """Feed one sample, return a summary when a shot has just ended."""
+        last_weight = self._last_weight
+        last_timer = self._last_timer
+        self._last_weight = weight
+        self._last_timer = timer
+
+        timer_advancing = last_timer is not None and timer > last_timer
+        if timer_advancing:
+            self._timer_advanced_at = timestamp
+
+        if not self._active:
+            self._detect_tare(timestamp, last_weight, weight)
+            if timer_advancing and last_timer is not None:
+                # backdate to the moment the device timer started
+                self._start_shot(timestamp - timer + last_timer, ShotTrigger.TIMER)
+            elif self._flow_onset_detected(timestamp, flow_rate, timer, last_timer):
+                self._start_shot(self._onset_at, ShotTrigger.FLOW)
+            else:
+                return None
+
+        self._track(timestamp, weight, flow_rate)
+
+        if last_timer is not None and timer < last_timer:
+            return self._finish(timestamp, ShotTrigger.TIMER_RESET)
+        if timestamp - self._start > self._max_shot_time:
+            return self._finish(timestamp, ShotTrigger.TIMEOUT)
+        if self._started_by is ShotTrigger.TIMER:
+            advanced_at = self._timer_advanced_at or timestamp
+            if timestamp - advanced_at >= self._timer_stall_time:
+                return self._finish(advanced_at, ShotTrigger.TIMER)
+        elif timestamp - self._last_flow_at >= self._flow_end_time:
+            return self._finish(self._last_flow_at, ShotTrigger.FLOW)
+        return None
+
+    def _detect_tare(
+        self, timestamp: float, last_weight: float | None, weight: float
+    ) -> None:
+        """Remember the weight removed by a tare as dose candidate.
+
+        Heavier loads (e.g. the cup) count as tare but keep the dose.
+        """
+        if (
+            last_weight is not None
+            and abs(weight) < self._tare_threshold
+            and last_weight >= self._min_dose
+        ):
+            if last_weight <= self._max_dose:
+                self._dose = last_weight
+                self._dose_time = timestamp
+            self._tare_time = timestamp
+            self._onset_count = 0
+
+    def _flow_onset_detected(
+        self,
+        timestamp: float,
+        flow_rate: float,
+        timer: float,
+        last_timer: float | None,
+    ) -> bool:
+        """Return True once flow has set in after a recent tare."""
+        if (
+            self._tare_time is None
+            or timestamp - self._tare_time > self._tare_window
+            or timer != last_timer
+        ):
+            self._onset_count = 0
+            return False
+        if flow_rate >= self._flow_onset:
+            if not self._onset_count:
+                self._onset_at = timestamp
+            self._onset_count += 1
+        else:
+            self._onset_count = 0
+        return self._onset_count >= self._onset_samples
+
+    def _start_shot(self, start: float, trigger: ShotTrigger) -> None:
+        """Enter the running state."""
+        self._reset_shot()
+        self._active = True
+        self._start = start
+        self._started_by = trigger
+        self._last_flow_at = start
+
+    def _track(self, timestamp: float, weight: float, flow_rate: float) -> None:
+        """Accumulate the per-shot statistics."""
+        self._last_weight_in_shot = weight
+        if self._first_drip is None and weight >= self._first_drip_weight:
+            self._first_drip = timestamp
+        if flow_rate > self._flow_end:
+            self._last_flow_at = timestamp
+        if flow_rate > self._peak_flow:
+            self._peak_flow = flow_rate
+        self._flow_sum += flow_rate
+        self._flow_count += 1
+
+    def _finish(self, end: float, trigger: ShotTrigger) -> ShotSummary | None:
+        """Leave the running state and build the summary."""
+        start = self._start
+        total_time = max(end - start, 0.0)
+        dose = (
+            self._dose
+            if self._dose_time is not None
+            and start - self._dose_time <= self._tare_window
+            else None
+        )
+        yield_weight = self._last_weight_in_shot
+        summary = ShotSummary(
+            start=start,
+            end=end,
+            started_by=self._started_by,
+            ended_by=trigger,
+            dose=dose,
+            yield_weight=yield_weight,
+            ratio=yield_weight / dose if dose else None,
+            total_time=total_time,
+            time_to_first_drip=(
+                self._first_drip - start if self._first_drip is not None else None
+            ),
+            peak_flow_rate=self._peak_flow,
+            mean_flow_rate=(
+                self._flow_sum / self._flow_count if self._flow_count else 0.0
+            ),
+            trace=self._cut_trace(start, end),
+        )
+        self._reset_shot()
+        self._dose = self._dose_time = self._tare_time = None
+        if total_time < self._min_shot_time:
+            return None
+        return summary
+
+    def _cut_trace(self, start: float, end: float) -> HistoryWindow | None:
+        """Copy the samples between start and end out of the history."""
+        if self._history is None:
+            return None
+        window = self._history.samples_since(start)
+        stop = bisect_right(window.time, end)
+        if stop == len(window):
+            return window
+        return HistoryWindow(
+            window.time[:stop],
+            window.weight[:stop],
+            window.flow_rate[:stop],
+            window.timer[:stop],
+        )
+
+
+__all__ = ["ShotDetector", "ShotSummary", "ShotTrigger"]
@@ -0,0 +1,93 @@
+"""Mikro-Benchmark für den Notification-Pfad auf dem Event-Loop.
+
+Vergleicht den synchronen Callback mit der Coroutine-Variante, für die
+bleak pro Notification einen Task anlegt.
+
+Aufruf: ``python benchmarks/bench_notify.py``
+"""
+
+import asyncio
+from collections.abc import Callable
+import functools
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiobookoo_ultra.bookooscale import BookooScale  # noqa: E402
+from aiobookoo_ultra.decode import FRAME_LENGTH  # noqa: E402
+
+NOTIFICATIONS = 20_000
+
+
+def _frames(count: int) -> list[bytearray]:
+    """Return weight frames with a rising weight and timer."""
+    frames = []
+    for index in range(count):
+        weight = index + 1
+        timer = index * 100 % 0xFFFFFF
+        frame = bytearray(FRAME_LENGTH)
+        frame[0:2] = b"\x03\x0b"
+        frame[2:5] = timer.to_bytes(3, "big")
+        frame[5] = 0x02  # grams
+        frame[6] = 0x2B
+        frame[7:10] = weight.to_bytes(3, "big")
+        frame[10] = 0x2B
+        frame[13] = 80
+        checksum = 0
+        for byte in frame[:-1]:
+            checksum ^= byte
+        frame[-1] = checksum
+        frames.append(frame)
+    return frames
+
+
+def _bleak_wrapper(callback: Callable) -> Callable[[bytearray], None]:
+    """Wrap a callback the way bleak's start_notify does."""
+    if asyncio.iscoroutinefunction(callback):
+        background_tasks: set[asyncio.Task] = set()
+
+        def wrapped_callback(data: bytearray) -> None:
+            task = asyncio.create_task(callback(None, data))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
+        return wrapped_callback
+    return functools.partial(callback, None)
+
+
+async def _run(label: str, method: str, frames: list[bytearray]) -> None:
+    """Deliver all frames through the loop and report the cost per frame."""
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    remaining = len(frames)
+
+    def _notified(_fields: object) -> None:
+        # every frame changes the weight, so each one ends in a notify
+        nonlocal remaining
+        remaining -= 1
+        if not remaining:
+            done.set_result(None)
+
+    scale = BookooScale("AA:BB:CC:DD:EE:FF", notify_callback=_notified)
+    wrapped = _bleak_wrapper(getattr(scale, method))
+
+    start = time.perf_counter()
+    for frame in frames:
+        loop.call_soon(wrapped, frame)
+    await done
+    elapsed = time.perf_counter() - start
+    print(f"{label:32s} {elapsed / len(frames) * 1e9:7.0f} ns/notification")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    frames = _frames(NOTIFICATIONS)
+    for _ in range(3):
+        await _run("process_notification (sync)", "process_notification", frames)
+        await _run("on_bluetooth_data_received", "on_bluetooth_data_received", frames)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,75 +2,46 @@
 
 from __future__ import annotations
 
-import inspect
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from aiobookoo_ultra.bookooscale import BookooScale
+from aiobookoo_ultra.const import BookooField
 from homeassistant.components.number import (
     NumberDeviceClass,
     NumberEntity,
     NumberEntityDescription,
+    NumberMode,
 )
-from homeassistant.const import UnitOfTime
+from homeassistant.const import UnitOfMass, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .capabilities import CAPABILITY_AUTO_OFF
+from .coordinator import BookooConfigEntry, BookooCoordinator
+from .entity import BookooEntity, BookooEntityDescription
 
 PARALLEL_UPDATES = 0
 
 
-async def _async_call_first_available(
-    scale: BookooScale, method_names: tuple[str, ...], value: float
-) -> bool:
-    """Call the first available setter on the scale."""
-    for method_name in method_names:
-        method = getattr(scale, method_name, None)
-        if method is None:
-            continue
-        adjusted_value = (
-            int(value * 60)
-            if "seconds" in method_name
-            else int(value)
-        )
-        result = method(adjusted_value)
-        if inspect.isawaitable(result):
-            await result
-        return True
-    return False
-
-
-def _get_auto_off_minutes(scale: BookooScale) -> float | None:
-    """Return the auto-off duration in minutes."""
-    for source in (scale, scale.device_state):
-        if source is None:
-            continue
-        for name in ("auto_off_time", "auto_off_duration", "auto_off", "auto_off_seconds"):
-            if not hasattr(source, name):
-                continue
-            value = getattr(source, name)
-            if value is None:
-                continue
-            try:
-                numeric_value = float(value)
-            except (TypeError, ValueError):
-                continue
-            if name == "auto_off_seconds":
-                return numeric_value / 60.0
-            return numeric_value
-    return None
+def _as_float(value: object | None) -> float | None:
+    """Return the value as float, None if it is not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 @dataclass(kw_only=True, frozen=True)
-class BookooNumberEntityDescription(NumberEntityDescription):
+class BookooNumberEntityDescription(NumberEntityDescription, BookooEntityDescription):
     """Description for Bookoo number entities."""
 
-    value_fn: Callable[[BookooScale], float | None]
-    setter_methods: tuple[str, ...]
+    capability: str
+    # normalizes the value read through the capability
+    value_fn: Callable[[object | None], float | None] = _as_float
 
 
 NUMBERS: tuple[BookooNumberEntityDescription, ...] = (
@@ -83,17 +54,31 @@ NUMBERS: tuple[BookooNumberEntityDescription, ...] = (
         native_min_value=5,
         native_max_value=30,
         entity_category=EntityCategory.CONFIG,
-        value_fn=_get_auto_off_minutes,
-        setter_methods=(
-            "set_auto_off_duration",
-            "set_auto_off_time",
-            "set_auto_off",
-            "set_auto_off_seconds",
-        ),
+        update_fields=BookooField.AUTO_OFF,
+        capability=CAPABILITY_AUTO_OFF,
     ),
 )
 
 
+@dataclass(kw_only=True, frozen=True)
+class BookooTargetNumberEntityDescription(
+    NumberEntityDescription, BookooEntityDescription
+):
+    """Description for the predictive stop target."""
+
+
+TARGET_WEIGHT = BookooTargetNumberEntityDescription(
+    key="target_weight",
+    translation_key="target_weight",
+    device_class=NumberDeviceClass.WEIGHT,
+    native_unit_of_measurement=UnitOfMass.GRAMS,
+    native_step=0.1,
+    native_min_value=0,
+    native_max_value=1000,
+    mode=NumberMode.BOX,
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: BookooConfigEntry,
@@ -103,7 +88,10 @@ async def async_setup_entry(
 
     coordinator = entry.runtime_data
     async_add_entities(
-        BookooNumber(coordinator, description) for description in NUMBERS
+        [
+            *(BookooNumber(coordinator, description) for description in NUMBERS),
+            BookooTargetWeightNumber(coordinator, TARGET_WEIGHT),
+        ]
     )
 
 
@@ -112,16 +100,43 @@ class BookooNumber(BookooEntity, NumberEntity):
 
     entity_description: BookooNumberEntityDescription
 
+    def __init__(
+        self,
+        coordinator: BookooCoordinator,
+        entity_description: BookooNumberEntityDescription,
+    ) -> None:
+        """Initialize the number with the resolved accessors."""
+        super().__init__(coordinator, entity_description)
+        self._capability = coordinator.capabilities[entity_description.capability]
+
     @property
     def native_value(self) -> float | None:
         """Return current value."""
-        return self.entity_description.value_fn(self._scale)
+        return self.entity_description.value_fn(self._capability.get(self._scale))
 
     async def async_set_native_value(self, value: float) -> None:
         """Set a new value."""
-        success = await _async_call_first_available(
-            self._scale, self.entity_description.setter_methods, value
-        )
-        if not success:
+        if (set_value := self._capability.set) is None:
             raise HomeAssistantError("Dieses Gerät unterstützt die Einstellung nicht.")
+        await set_value(int(value))
         self.async_write_ha_state()
+
+
+class BookooTargetWeightNumber(BookooEntity, NumberEntity):
+    """Target weight of the predictive stop, 0 disables it."""
+
+    entity_description: BookooTargetNumberEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Return True, the target can be set while the scale is away."""
+        return True
+
+    @property
+    def native_value(self) -> float:
+        """Return the current target weight."""
+        return self.coordinator.predictive_stop.target or 0.0
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set a new target weight."""
+        self.coordinator.async_set_target_weight(value)
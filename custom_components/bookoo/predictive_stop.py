@@ -0,0 +1,137 @@
+"""Latency-compensated target-weight stop for Bookoo."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+DEFAULT_LATENCY = 0.5  # seconds
+MAX_LATENCY = 3.0
+LEARNING_RATE = 0.3
+MIN_FLOW = 0.2  # g/s, below this no prediction is made
+SETTLE_FLOW = 0.1  # g/s
+SETTLE_TIME = 2.0  # seconds
+SETTLE_TIMEOUT = 30.0  # seconds
+REMOVAL_THRESHOLD = 2.0  # grams below the trigger weight, e.g. cup lifted
+
+
+class BookooPredictiveStop:
+    """Trigger a stop early enough for the final weight to land on target.
+
+    While a shot is running the weight is extrapolated by `latency` seconds
+    of the current flow; once that reaches the target the stop fires. After
+    the flow has settled, the weight that still arrived after the trigger
+    is turned into an observed latency and blended into the estimate, so
+    BLE, event loop and device delays are learned per scale.
+    """
+
+    def __init__(self, hass: HomeAssistant, unique_id: str) -> None:
+        """Initialize the stop, `async_load` restores target and latency."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{unique_id}.predictive_stop"
+        )
+        self.target: float | None = None
+        self.latency = DEFAULT_LATENCY
+        self.last_overshoot: float | None = None
+        self._armed = True
+        self._fired_at: float | None = None
+        self._fired_weight = 0.0
+        self._fired_flow = 0.0
+        self._settled_since: float | None = None
+
+    async def async_load(self) -> None:
+        """Restore the persisted target and learned latency."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.target = data.get("target")
+        self.latency = data.get("latency", DEFAULT_LATENCY)
+        self.last_overshoot = data.get("last_overshoot")
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(
+            lambda: {
+                "target": self.target,
+                "latency": self.latency,
+                "last_overshoot": self.last_overshoot,
+            },
+            SAVE_DELAY,
+        )
+
+    @callback
+    def async_set_target(self, target: float | None) -> None:
+        """Set the target weight in grams, None or 0 disables the stop."""
+        self.target = target or None
+        self._async_schedule_save()
+
+    @property
+    def settling(self) -> bool:
+        """Return True while the overshoot of the last stop is measured."""
+        return self._fired_at is not None
+
+    @callback
+    def async_update(
+        self, timestamp: float, weight: float, flow_rate: float, shot_active: bool
+    ) -> bool:
+        """Feed one sample, return True when the stop should fire now."""
+        if self._fired_at is not None:
+            self._track_settling(timestamp, weight, flow_rate)
+            return False
+        if not shot_active:
+            self._armed = True
+            return False
+        if not self._armed or self.target is None or flow_rate < MIN_FLOW:
+            return False
+        if weight + flow_rate * self.latency < self.target:
+            return False
+
+        self._armed = False
+        self._fired_at = timestamp
+        self._fired_weight = weight
+        self._fired_flow = flow_rate
+        self._settled_since = None
+        return True
+
+    def _track_settling(
+        self, timestamp: float, weight: float, flow_rate: float
+    ) -> None:
+        """Wait for the flow to stop, then learn from the final weight."""
+        if (
+            timestamp - self._fired_at > SETTLE_TIMEOUT
+            or weight < self._fired_weight - REMOVAL_THRESHOLD
+        ):
+            self._fired_at = None
+            return
+        if flow_rate > SETTLE_FLOW:
+            self._settled_since = None
+            return
+        if self._settled_since is None:
+            self._settled_since = timestamp
+            return
+        if timestamp - self._settled_since < SETTLE_TIME:
+            return
+
+        self._fired_at = None
+        observed = min(
+            max((weight - self._fired_weight) / self._fired_flow, 0.0), MAX_LATENCY
+        )
+        self.latency += LEARNING_RATE * (observed - self.latency)
+        if self.target is not None:
+            self.last_overshoot = weight - self.target
+        self._async_schedule_save()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current state for diagnostics."""
+        return {
+            "target": self.target,
+            "latency": self.latency,
+            "last_overshoot": self.last_overshoot,
+            "settling": self.settling,
+        }
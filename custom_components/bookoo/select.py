@@ -2,71 +2,44 @@
 
 from __future__ import annotations
 
-import inspect
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from aiobookoo_ultra.bookooscale import BookooScale
+from aiobookoo_ultra.const import BookooField
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .capabilities import (
+    CAPABILITY_BEEPER_LEVEL,
+    CAPABILITY_BEEPER_LEVELS,
+    CAPABILITY_FLOW_SMOOTHING,
+)
+from .coordinator import BookooConfigEntry, BookooCoordinator
+from .entity import BookooEntity, BookooEntityDescription
 
 PARALLEL_UPDATES = 0
 
-
-def _get_first_available_value(
-    scale: BookooScale, names: tuple[str, ...]
-) -> object | None:
-    """Return the first existing attribute value on the scale."""
-    for name in names:
-        value = getattr(scale, name, None)
-        if value is not None:
-            return value
-    if scale.device_state is None:
-        return None
-    for name in names:
-        value = getattr(scale.device_state, name, None)
-        if value is not None:
-            return value
-    return None
-
-
-async def _async_call_first_available(
-    scale: BookooScale, method_names: tuple[str, ...], value: object
-) -> bool:
-    """Call the first available setter on the scale."""
-    for method_name in method_names:
-        method = getattr(scale, method_name, None)
-        if method is None:
-            continue
-        result = method(value)
-        if inspect.isawaitable(result):
-            await result
-        return True
-    return False
+_DEFAULT_BEEPER_OPTIONS = [str(level) for level in range(0, 6)]
 
 
-def _beeper_options(scale: BookooScale) -> list[str]:
+def _beeper_options(coordinator: BookooCoordinator) -> list[str]:
     """Return supported beeper levels, fallback to six levels (0-5)."""
-    if scale.device_state is not None:
-        supported = getattr(scale.device_state, "supported_beeper_levels", None)
-        if supported:
-            levels: list[str] = []
-            for level in supported:
-                try:
-                    numeric_level = int(level)
-                except (TypeError, ValueError):
-                    continue
-                if 0 <= numeric_level <= 5:
-                    levels.append(str(numeric_level))
-            if levels:
-                return levels
-    return [str(level) for level in range(0, 6)]
+    capability = coordinator.capabilities[CAPABILITY_BEEPER_LEVELS]
+    if supported := capability.get(coordinator.scale):
+        levels: list[str] = []
+        for level in supported:
+            try:
+                numeric_level = int(level)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= numeric_level <= 5:
+                levels.append(str(numeric_level))
+        if levels:
+            return levels
+    return _DEFAULT_BEEPER_OPTIONS
 
 
 def _normalize_buzzer_level(value: object | None) -> str | None:
@@ -116,20 +89,14 @@ def _coerce_flow_smoothing(option: str) -> bool:
     raise HomeAssistantError("Ungültiger Wert für Flow-Smoothing.")
 
 
-def _has_supported_setter(
-    scale: BookooScale, setter_methods: tuple[str, ...]
-) -> bool:
-    """Check if any setter exists on the scale."""
-    return any(callable(getattr(scale, method, None)) for method in setter_methods)
-
-
 @dataclass(kw_only=True, frozen=True)
-class BookooSelectEntityDescription(SelectEntityDescription):
+class BookooSelectEntityDescription(SelectEntityDescription, BookooEntityDescription):
     """Description for Bookoo select entities."""
 
-    current_fn: Callable[[BookooScale], str | None]
-    options_fn: Callable[[BookooScale], list[str]]
-    setter_methods: tuple[str, ...]
+    capability: str
+    # normalizes the value read through the capability
+    current_fn: Callable[[object | None], str | None]
+    options_fn: Callable[[BookooCoordinator], list[str]]
     coerce_fn: Callable[[str], object] = lambda option: option
 
 
@@ -138,32 +105,20 @@ SELECTS: tuple[BookooSelectEntityDescription, ...] = (
         key="beeper_level",
         translation_key="beeper_level",
         entity_category=EntityCategory.CONFIG,
-        current_fn=lambda scale: _normalize_buzzer_level(
-            _get_first_available_value(
-                scale, ("beeper_level", "buzzer_level", "buzzer_gear")
-            )
-        ),
+        update_fields=BookooField.BUZZER_GEAR,
+        capability=CAPABILITY_BEEPER_LEVEL,
+        current_fn=_normalize_buzzer_level,
         options_fn=_beeper_options,
-        setter_methods=("set_beep_level", "set_beeper_level", "set_buzzer_level"),
         coerce_fn=_coerce_int_option,
     ),
     BookooSelectEntityDescription(
         key="flow_smoothing",
         translation_key="flow_smoothing",
         entity_category=EntityCategory.CONFIG,
-        current_fn=lambda scale: _flow_smoothing_current(
-            _get_first_available_value(
-                scale,
-                ("flow_smoothing", "flow_smoothing_mode", "flow_rate_smoothing"),
-            )
-        ),
-        options_fn=lambda scale: ["off", "on"],
-        setter_methods=(
-            "set_flow_rate_smoothing",
-            "set_flow_smoothing",
-            "set_flow_smoothing_mode",
-            "set_flow_smoothing_enabled",
-        ),
+        update_fields=BookooField.FLOW_SMOOTHING,
+        capability=CAPABILITY_FLOW_SMOOTHING,
+        current_fn=_flow_smoothing_current,
+        options_fn=lambda coordinator: ["off", "on"],
         coerce_fn=_coerce_flow_smoothing,
     ),
 )
@@ -180,7 +135,7 @@ async def async_setup_entry(
     entities = [
         BookooSelect(coordinator, description)
         for description in SELECTS
-        if _has_supported_setter(coordinator.scale, description.setter_methods)
+        if coordinator.capabilities[description.capability].set is not None
     ]
     if entities:
         async_add_entities(entities)
@@ -191,23 +146,28 @@ class BookooSelect(BookooEntity, SelectEntity):
 
     entity_description: BookooSelectEntityDescription
 
+    def __init__(
+        self,
+        coordinator: BookooCoordinator,
+        entity_description: BookooSelectEntityDescription,
+    ) -> None:
+        """Initialize the select with the resolved accessors."""
+        super().__init__(coordinator, entity_description)
+        self._capability = coordinator.capabilities[entity_description.capability]
+
     @property
     def current_option(self) -> str | None:
         """Return the currently selected option."""
-        return self.entity_description.current_fn(self._scale)
+        return self.entity_description.current_fn(self._capability.get(self._scale))
 
     @property
     def options(self) -> list[str]:
         """Return available options."""
-        return self.entity_description.options_fn(self._scale)
+        return self.entity_description.options_fn(self.coordinator)
 
     async def async_select_option(self, option: str) -> None:
         """Select a new option."""
-        success = await _async_call_first_available(
-            self._scale,
-            self.entity_description.setter_methods,
-            self.entity_description.coerce_fn(option),
-        )
-        if not success:
+        if (set_value := self._capability.set) is None:
             raise HomeAssistantError("Dieses Gerät unterstützt die Einstellung nicht.")
+        await set_value(self.entity_description.coerce_fn(option))
         self.async_write_ha_state()
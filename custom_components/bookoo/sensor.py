@@ -2,9 +2,13 @@
 
 from collections.abc import Callable  # noqa: I001
 from dataclasses import dataclass
+from typing import Any
+from functools import partial
+import time
 
 from aiobookoo_ultra.bookooscale import BookooDeviceState, BookooScale
-from aiobookoo_ultra.const import UnitMass as BookooUnitOfMass
+from aiobookoo_ultra.const import BookooField, UnitMass as BookooUnitOfMass
+from aiobookoo_ultra.metrics import LatencyHistogram
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
@@ -13,12 +17,21 @@ from homeassistant.components.sensor import (
     SensorExtraStoredData,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfMass, UnitOfVolumeFlowRate, UnitOfTime
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfFrequency,
+    UnitOfMass,
+    UnitOfTime,
+    UnitOfVolumeFlowRate,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .const import CONNECTION_STATES
+from .coordinator import BookooConfigEntry, BookooCoordinator
+from .entity import BookooEntity, BookooEntityDescription
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
@@ -41,7 +54,7 @@ BOOKOO_UNIT_TO_HA_UNIT_OF_MASS = {
 
 
 @dataclass(kw_only=True, frozen=True)
-class BookooSensorEntityDescription(SensorEntityDescription):
+class BookooSensorEntityDescription(SensorEntityDescription, BookooEntityDescription):
     """Description for Bookoo sensor entities."""
 
     value_fn: Callable[[BookooScale], int | float | None]
@@ -60,6 +73,7 @@ SENSORS: tuple[BookooSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WEIGHT,
         native_unit_of_measurement=UnitOfMass.GRAMS,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.WEIGHT | BookooField.UNIT,
         value_fn=lambda scale: scale.weight,
         unit_fn=lambda device_state: BOOKOO_UNIT_TO_HA_UNIT_OF_MASS.get(
             device_state.weight_unit
@@ -71,6 +85,7 @@ SENSORS: tuple[BookooSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfVolumeFlowRate.MILLILITERS_PER_SECOND,
         suggested_display_precision=1,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.FLOW_RATE,
         value_fn=lambda scale: scale.flow_rate,
     ),
     BookooDynamicUnitSensorEntityDescription(
@@ -79,8 +94,32 @@ SENSORS: tuple[BookooSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.SECONDS,
         suggested_display_precision=2,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.TIMER,
         value_fn=lambda scale: scale.timer,
     ),
+    BookooDynamicUnitSensorEntityDescription(
+        key="estimated_flow_rate",
+        translation_key="estimated_flow_rate",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.MILLILITERS_PER_SECOND,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.WEIGHT,
+        value_fn=lambda scale: scale.estimated_flow_rate,
+    ),
+    BookooDynamicUnitSensorEntityDescription(
+        key="settled_weight",
+        translation_key="settled_weight",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.GRAMS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.WEIGHT | BookooField.UNIT,
+        value_fn=lambda scale: scale.settled_weight,
+        unit_fn=lambda device_state: BOOKOO_UNIT_TO_HA_UNIT_OF_MASS.get(
+            device_state.weight_unit
+        ),
+    ),
 )
 RESTORE_SENSORS: tuple[BookooSensorEntityDescription, ...] = (
     BookooSensorEntityDescription(
@@ -88,6 +127,7 @@ RESTORE_SENSORS: tuple[BookooSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        update_fields=BookooField.BATTERY,
         value_fn=lambda scale: (
             scale.device_state.battery_level if scale.device_state else None
         ),
@@ -95,6 +135,221 @@ RESTORE_SENSORS: tuple[BookooSensorEntityDescription, ...] = (
 )
 
 
+SHOT_SENSORS: tuple[BookooSensorEntityDescription, ...] = (
+    BookooSensorEntityDescription(
+        key="last_shot_dose",
+        translation_key="last_shot_dose",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.GRAMS,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.dose,
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_yield",
+        translation_key="last_shot_yield",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.GRAMS,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.yield_weight,
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_ratio",
+        translation_key="last_shot_ratio",
+        suggested_display_precision=2,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.ratio,
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_time",
+        translation_key="last_shot_time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.total_time,
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_time_to_first_drip",
+        translation_key="last_shot_time_to_first_drip",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: (
+            scale.last_shot and scale.last_shot.time_to_first_drip
+        ),
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_peak_flow_rate",
+        translation_key="last_shot_peak_flow_rate",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.MILLILITERS_PER_SECOND,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.peak_flow_rate,
+    ),
+    BookooSensorEntityDescription(
+        key="last_shot_mean_flow_rate",
+        translation_key="last_shot_mean_flow_rate",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.MILLILITERS_PER_SECOND,
+        suggested_display_precision=1,
+        update_fields=BookooField.SHOT,
+        value_fn=lambda scale: scale.last_shot and scale.last_shot.mean_flow_rate,
+    ),
+)
+
+
+def _p95_ms(histogram: LatencyHistogram) -> float | None:
+    """Return the 95th percentile of a histogram in milliseconds."""
+    if (value := histogram.percentile(0.95)) is None:
+        return None
+    return value * 1000
+
+
+# ingest path metrics, only available while instrumentation is enabled; they
+# follow the coordinator poll instead of every notification
+METRIC_SENSORS: tuple[BookooSensorEntityDescription, ...] = (
+    BookooSensorEntityDescription(
+        key="notification_rate",
+        translation_key="notification_rate",
+        device_class=SensorDeviceClass.FREQUENCY,
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.metrics and scale.metrics.notification_rate,
+    ),
+    BookooSensorEntityDescription(
+        key="dispatch_lag",
+        translation_key="dispatch_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.metrics and _p95_ms(scale.metrics.dispatch),
+    ),
+    BookooSensorEntityDescription(
+        key="write_lag",
+        translation_key="write_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.metrics and _p95_ms(scale.metrics.write),
+    ),
+    BookooSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: (
+            scale.metrics and _p95_ms(scale.metrics.event_loop_lag)
+        ),
+    ),
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class BookooLinkSensorEntityDescription(BookooSensorEntityDescription):
+    """Description for Bookoo link quality sensors."""
+
+    attributes_fn: Callable[[BookooScale], dict[str, Any]] | None = None
+
+
+# link quality derived from the device timer; like the metrics they follow
+# the coordinator poll
+LINK_SENSORS: tuple[BookooLinkSensorEntityDescription, ...] = (
+    BookooLinkSensorEntityDescription(
+        key="packet_loss",
+        translation_key="packet_loss",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda scale: scale.link.loss,
+    ),
+    BookooLinkSensorEntityDescription(
+        key="missed_notifications",
+        translation_key="missed_notifications",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.link.missed,
+        attributes_fn=lambda scale: {
+            f"gaps_{bucket}": count for bucket, count in scale.link.gaps.items()
+        },
+    ),
+    BookooLinkSensorEntityDescription(
+        key="decode_errors",
+        translation_key="decode_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.link.decode_errors.total(),
+        attributes_fn=lambda scale: dict(scale.link.decode_errors),
+    ),
+    BookooLinkSensorEntityDescription(
+        key="signal_strength",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: scale.link.rssi,
+    ),
+    BookooLinkSensorEntityDescription(
+        key="time_to_first_frame",
+        translation_key="time_to_first_frame",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda scale: (
+            scale.time_to_first_frame * 1000
+            if scale.time_to_first_frame is not None
+            else None
+        ),
+    ),
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class BookooCoordinatorSensorEntityDescription(
+    SensorEntityDescription, BookooEntityDescription
+):
+    """Description for sensors reporting coordinator state."""
+
+    value_fn: Callable[[BookooCoordinator], str | None]
+
+
+# stay available while the scale is away, they describe why it is
+COORDINATOR_SENSORS: tuple[BookooCoordinatorSensorEntityDescription, ...] = (
+    BookooCoordinatorSensorEntityDescription(
+        key="connection_state",
+        translation_key="connection_state",
+        device_class=SensorDeviceClass.ENUM,
+        options=CONNECTION_STATES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        update_fields=BookooField.CONNECTION,
+        value_fn=lambda coordinator: coordinator.connection_state,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: BookooConfigEntry,
@@ -110,6 +365,22 @@ async def async_setup_entry(
         BookooRestoreSensor(coordinator, entity_description)
         for entity_description in RESTORE_SENSORS
     )
+    entities.extend(
+        BookooShotSensor(coordinator, entity_description)
+        for entity_description in SHOT_SENSORS
+    )
+    entities.extend(
+        BookooMetricSensor(coordinator, entity_description)
+        for entity_description in METRIC_SENSORS
+    )
+    entities.extend(
+        BookooLinkSensor(coordinator, entity_description)
+        for entity_description in LINK_SENSORS
+    )
+    entities.extend(
+        BookooCoordinatorSensor(coordinator, entity_description)
+        for entity_description in COORDINATOR_SENSORS
+    )
     async_add_entities(entities)
 
 
@@ -118,6 +389,30 @@ class BookooSensor(BookooEntity, SensorEntity):
 
     entity_description: BookooDynamicUnitSensorEntityDescription
 
+    async def async_added_to_hass(self) -> None:
+        """Drop a pending rate-limited write on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            partial(
+                self.coordinator.write_throttle.async_cancel,
+                self.entity_description.key,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, rate limited per sensor."""
+        self.coordinator.write_throttle.async_write(
+            self.entity_description.key, self._async_write_state
+        )
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state and stamp it for the ingest metrics."""
+        self.async_write_ha_state()
+        if (metrics := self._scale.metrics) is not None:
+            metrics.state_written(time.monotonic())
+
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement of this entity."""
@@ -164,3 +459,83 @@ class BookooRestoreSensor(BookooEntity, RestoreSensor):
     def available(self) -> bool:
         """Return True if entity is available."""
         return super().available or self._restored_data is not None
+
+
+class BookooShotSensor(BookooEntity, RestoreSensor):
+    """Representation of a last-shot summary value.
+
+    The value is kept across restarts and while the scale is disconnected.
+    """
+
+    entity_description: BookooSensorEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+
+        if self._scale.last_shot is not None:
+            self._attr_native_value = self.entity_description.value_fn(self._scale)
+        elif (restored := await self.async_get_last_sensor_data()) is not None:
+            self._attr_native_value = restored.native_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._scale.last_shot is not None:
+            self._attr_native_value = self.entity_description.value_fn(self._scale)
+        self._async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True once a shot summary is known."""
+        return super().available or self._attr_native_value is not None
+
+
+class BookooMetricSensor(BookooEntity, SensorEntity):
+    """Representation of an ingest path metric."""
+
+    entity_description: BookooSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Return True while instrumentation is enabled."""
+        return self.coordinator.last_update_success and self._scale.metrics is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the entity."""
+        return self.entity_description.value_fn(self._scale)
+
+
+class BookooLinkSensor(BookooEntity, SensorEntity):
+    """Representation of a link quality value."""
+
+    entity_description: BookooLinkSensorEntityDescription
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the entity."""
+        return self.entity_description.value_fn(self._scale)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breakdown of the value."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self._scale)
+
+
+class BookooCoordinatorSensor(BookooEntity, SensorEntity):
+    """Representation of a coordinator state value."""
+
+    entity_description: BookooCoordinatorSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Return True unless the coordinator failed."""
+        return self.coordinator.last_update_success
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the state of the entity."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,100 @@
+"""Services for the Bookoo integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from aiobookoo_ultra.bookooscale import BookooScale
+from aiobookoo_ultra.exceptions import BookooCommandNotConfirmed, BookooError
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_COMMAND,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CONFIRM,
+    ATTR_TARGET_WEIGHT,
+    DOMAIN,
+    SERVICE_SEND_COMMAND,
+    SERVICE_SET_TARGET_WEIGHT,
+)
+from .coordinator import BookooCoordinator
+
+SET_TARGET_WEIGHT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TARGET_WEIGHT): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1000)
+        ),
+    }
+)
+
+COMMANDS: dict[str, Callable[[BookooScale, bool], Coroutine[Any, Any, None]]] = {
+    "tare": lambda scale, confirm: scale.tare(confirm=confirm),
+    "start": lambda scale, confirm: scale.start_timer(confirm=confirm),
+    "stop": lambda scale, confirm: scale.stop_timer(confirm=confirm),
+    "reset_timer": lambda scale, confirm: scale.reset_timer(confirm=confirm),
+    "tare_and_start": lambda scale, confirm: scale.tare_and_start_timer(
+        confirm=confirm
+    ),
+}
+
+SEND_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_COMMAND): vol.In(COMMANDS),
+        vol.Optional(ATTR_CONFIRM, default=False): cv.boolean,
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> BookooCoordinator:
+    """Return the coordinator of the config entry addressed by a call."""
+    entry = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError("Unbekannter Bookoo-Eintrag.")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError("Der Bookoo-Eintrag ist nicht geladen.")
+    return entry.runtime_data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Bookoo services."""
+
+    @callback
+    def _async_set_target_weight(call: ServiceCall) -> None:
+        """Set the target weight of the predictive stop."""
+        _get_coordinator(hass, call).async_set_target_weight(
+            call.data[ATTR_TARGET_WEIGHT]
+        )
+
+    async def _async_send_command(call: ServiceCall) -> None:
+        """Send a command, optionally waiting until the scale shows its effect."""
+        scale = _get_coordinator(hass, call).scale
+        try:
+            await COMMANDS[call.data[ATTR_COMMAND]](scale, call.data[ATTR_CONFIRM])
+        except BookooCommandNotConfirmed as ex:
+            raise HomeAssistantError(
+                "Die Waage hat den Befehl nicht bestätigt."
+            ) from ex
+        except BookooError as ex:
+            raise HomeAssistantError("Der Befehl konnte nicht gesendet werden.") from ex
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMAND,
+        _async_send_command,
+        schema=SEND_COMMAND_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TARGET_WEIGHT,
+        _async_set_target_weight,
+        schema=SET_TARGET_WEIGHT_SCHEMA,
+    )
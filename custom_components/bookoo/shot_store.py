@@ -0,0 +1,273 @@
+"""On-disk store for Bookoo shot traces.
+
+Every shot is kept in its own compact trace file next to a fixed-size
+record in an index file. Both are read through `mmap`, so listing shots
+only touches the index and loading a trace only decodes that one file.
+All methods block and must run in the executor.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+import math
+import mmap
+import os
+from pathlib import Path
+from struct import Struct
+import time
+
+from aiobookoo_ultra.history import HistoryWindow
+from aiobookoo_ultra.session import ShotSummary, ShotTrigger
+
+STORE_VERSION = 1
+
+# magic, version, record size
+_INDEX_HEADER = Struct("<4sHH")
+_INDEX_MAGIC = b"BKIX"
+# shot id, start (epoch s), total time, dose, yield, ratio, time to first drip,
+# peak flow, mean flow, sample count, trace bytes, started by, ended by
+_INDEX_RECORD = Struct("<QdfffffffIIBBxx")
+
+# magic, version, sample count, start (epoch s), byte length of the
+# time/weight/flow/timer columns
+_TRACE_HEADER = Struct("<4sHxxId4I")
+_TRACE_MAGIC = b"BKTR"
+
+_TRIGGERS = tuple(ShotTrigger)
+
+
+@dataclass(frozen=True, slots=True)
+class ShotRecord:
+    """Index entry of a stored shot."""
+
+    shot_id: int
+    started_at: float
+    total_time: float
+    dose: float | None
+    yield_weight: float
+    ratio: float | None
+    time_to_first_drip: float | None
+    peak_flow_rate: float
+    mean_flow_rate: float
+    samples: int
+    trace_bytes: int
+    started_by: ShotTrigger
+    ended_by: ShotTrigger
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the record as plain data."""
+        return asdict(self)
+
+
+def _encode_column(values: Iterable[int]) -> bytes:
+    """Delta-encode integers as zigzag LEB128 varints."""
+    out = bytearray()
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        zigzag = (delta << 1) ^ (delta >> 63)
+        while zigzag > 0x7F:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out)
+
+
+def _decode_column(buffer: memoryview, count: int) -> array:
+    """Decode `count` delta/zigzag/varint integers."""
+    values = array("q", bytes(8 * count))
+    position = previous = 0
+    for index in range(count):
+        shift = result = 0
+        while True:
+            byte = buffer[position]
+            position += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        previous += (result >> 1) ^ -(result & 1)
+        values[index] = previous
+    return values
+
+
+def _nan_if_none(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _none_if_nan(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+class BookooShotStore:
+    """Append-only archive of shot traces for one scale."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store, the directory is created on first write."""
+        self.directory = directory
+        self._index_path = directory / "index.bin"
+
+    def _trace_path(self, shot_id: int) -> Path:
+        return self.directory / f"{shot_id}.bkt"
+
+    def append(self, shot: ShotSummary) -> ShotRecord | None:
+        """Persist a shot and its trace, None if it has no trace."""
+        if (trace := shot.trace) is None or not len(trace):
+            return None
+
+        # shot timestamps are monotonic, anchor them to the wall clock
+        started_at = time.time() - (time.monotonic() - shot.start)
+        shot_id = int(started_at * 1000)
+        start = shot.start
+        columns = (
+            _encode_column(round((t - start) * 1000) for t in trace.time),
+            _encode_column(round(w * 100) for w in trace.weight),
+            _encode_column(round(f * 100) for f in trace.flow_rate),
+            _encode_column(round(t * 1000) for t in trace.timer),
+        )
+        header = _TRACE_HEADER.pack(
+            _TRACE_MAGIC,
+            STORE_VERSION,
+            len(trace),
+            started_at,
+            *(len(column) for column in columns),
+        )
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        trace_path = self._trace_path(shot_id)
+        temp_path = trace_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            file.write(header)
+            for column in columns:
+                file.write(column)
+        os.replace(temp_path, trace_path)
+
+        record = ShotRecord(
+            shot_id=shot_id,
+            started_at=started_at,
+            total_time=shot.total_time,
+            dose=shot.dose,
+            yield_weight=shot.yield_weight,
+            ratio=shot.ratio,
+            time_to_first_drip=shot.time_to_first_drip,
+            peak_flow_rate=shot.peak_flow_rate,
+            mean_flow_rate=shot.mean_flow_rate,
+            samples=len(trace),
+            trace_bytes=len(header) + sum(len(column) for column in columns),
+            started_by=shot.started_by,
+            ended_by=shot.ended_by,
+        )
+        new_index = not self._index_path.exists()
+        with open(self._index_path, "ab") as file:
+            if new_index:
+                file.write(
+                    _INDEX_HEADER.pack(_INDEX_MAGIC, STORE_VERSION, _INDEX_RECORD.size)
+                )
+            file.write(
+                _INDEX_RECORD.pack(
+                    record.shot_id,
+                    record.started_at,
+                    record.total_time,
+                    _nan_if_none(record.dose),
+                    record.yield_weight,
+                    _nan_if_none(record.ratio),
+                    _nan_if_none(record.time_to_first_drip),
+                    record.peak_flow_rate,
+                    record.mean_flow_rate,
+                    record.samples,
+                    record.trace_bytes,
+                    _TRIGGERS.index(record.started_by),
+                    _TRIGGERS.index(record.ended_by),
+                )
+            )
+        return record
+
+    def list_shots(self, limit: int | None = None) -> list[ShotRecord]:
+        """Return the newest shots first, reading only the index."""
+        try:
+            file = open(self._index_path, "rb")
+        except FileNotFoundError:
+            return []
+        with file:
+            size = os.fstat(file.fileno()).st_size
+            if size <= _INDEX_HEADER.size:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                magic, _version, record_size = _INDEX_HEADER.unpack_from(view)
+                if magic != _INDEX_MAGIC or record_size != _INDEX_RECORD.size:
+                    raise ValueError(f"Unsupported shot index {self._index_path}")
+                count = (size - _INDEX_HEADER.size) // record_size
+                first = 0 if limit is None else max(count - limit, 0)
+                records = []
+                for position in range(count - 1, first - 1, -1):
+                    (
+                        shot_id,
+                        started_at,
+                        total_time,
+                        dose,
+                        yield_weight,
+                        ratio,
+                        time_to_first_drip,
+                        peak_flow_rate,
+                        mean_flow_rate,
+                        samples,
+                        trace_bytes,
+                        started_by,
+                        ended_by,
+                    ) = _INDEX_RECORD.unpack_from(
+                        view, _INDEX_HEADER.size + position * record_size
+                    )
+                    records.append(
+                        ShotRecord(
+                            shot_id=shot_id,
+                            started_at=started_at,
+                            total_time=total_time,
+                            dose=_none_if_nan(dose),
+                            yield_weight=yield_weight,
+                            ratio=_none_if_nan(ratio),
+                            time_to_first_drip=_none_if_nan(time_to_first_drip),
+                            peak_flow_rate=peak_flow_rate,
+                            mean_flow_rate=mean_flow_rate,
+                            samples=samples,
+                            trace_bytes=trace_bytes,
+                            started_by=_TRIGGERS[started_by],
+                            ended_by=_TRIGGERS[ended_by],
+                        )
+                    )
+                return records
+
+    def load_trace(self, shot_id: int) -> HistoryWindow:
+        """Decode one stored trace; times are seconds since the shot start."""
+        with (
+            open(self._trace_path(shot_id), "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view,
+        ):
+            (magic, version, count, _started_at, *lengths) = (
+                _TRACE_HEADER.unpack_from(view)
+            )
+            if magic != _TRACE_MAGIC or version != STORE_VERSION:
+                raise ValueError(f"Unsupported shot trace {shot_id}")
+            buffer = memoryview(view)
+            try:
+                offset = _TRACE_HEADER.size
+                columns = []
+                for length, scale in zip(lengths, (1000, 100, 100, 1000), strict=True):
+                    values = _decode_column(buffer[offset : offset + length], count)
+                    columns.append(array("d", (value / scale for value in values)))
+                    offset += length
+            finally:
+                buffer.release()
+        return HistoryWindow(*columns)
+
+    def usage(self) -> dict[str, int]:
+        """Return the number of stored shots and their size on disk."""
+        records = self.list_shots()
+        return {
+            "shots": len(records),
+            "bytes": sum(record.trace_bytes for record in records)
+            + _INDEX_HEADER.size
+            + len(records) * _INDEX_RECORD.size,
+        }
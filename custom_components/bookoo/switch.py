@@ -2,67 +2,32 @@
 
 from __future__ import annotations
 
-import inspect
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from aiobookoo_ultra.bookooscale import BookooScale
+from aiobookoo_ultra.const import BookooField
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .coordinator import BookooConfigEntry
-from .entity import BookooEntity
+from .capabilities import CAPABILITY_FLOW_SMOOTHING
+from .coordinator import BookooConfigEntry, BookooCoordinator
+from .entity import BookooEntity, BookooEntityDescription
 
 PARALLEL_UPDATES = 0
 
 
-async def _async_call_first_available(
-    scale: BookooScale, method_names: tuple[str, ...], value: bool
-) -> bool:
-    """Call the first available setter on the scale."""
-    for method_name in method_names:
-        method = getattr(scale, method_name, None)
-        if method is None:
-            continue
-        result = method(value)
-        if inspect.isawaitable(result):
-            await result
-        return True
-    return False
-
-
-def _get_first_available_bool(
-    scale: BookooScale, names: tuple[str, ...]
-) -> bool | None:
-    """Return the first existing boolean value on the scale/device state."""
-    for source in (scale, scale.device_state):
-        if source is None:
-            continue
-        for name in names:
-            if not hasattr(source, name):
-                continue
-            value = getattr(source, name)
-            if value is not None:
-                return bool(value)
-    return None
-
-
-def _has_supported_setter(
-    scale: BookooScale, setter_methods: tuple[str, ...]
-) -> bool:
-    """Check if any setter exists on the scale."""
-    return any(callable(getattr(scale, method, None)) for method in setter_methods)
-
-
 @dataclass(kw_only=True, frozen=True)
-class BookooSwitchEntityDescription(SwitchEntityDescription):
+class BookooSwitchEntityDescription(SwitchEntityDescription, BookooEntityDescription):
     """Description for Bookoo switch entities."""
 
-    is_on_fn: Callable[[BookooScale], bool | None]
-    setter_methods: tuple[str, ...]
+    capability: str
+    # normalizes the value read through the capability
+    is_on_fn: Callable[[object | None], bool | None] = (
+        lambda value: None if value is None else bool(value)
+    )
 
 
 SWITCHES: tuple[BookooSwitchEntityDescription, ...] = (
@@ -70,15 +35,8 @@ SWITCHES: tuple[BookooSwitchEntityDescription, ...] = (
         key="flow_smoothing_enabled",
         translation_key="flow_smoothing_enabled",
         entity_category=EntityCategory.CONFIG,
-        is_on_fn=lambda scale: _get_first_available_bool(
-            scale,
-            ("flow_smoothing_enabled", "flow_smoothing", "flow_rate_smoothing"),
-        ),
-        setter_methods=(
-            "set_flow_rate_smoothing",
-            "set_flow_smoothing_enabled",
-            "set_flow_smoothing",
-        ),
+        update_fields=BookooField.FLOW_SMOOTHING,
+        capability=CAPABILITY_FLOW_SMOOTHING,
     ),
 )
 
@@ -94,7 +52,7 @@ async def async_setup_entry(
     entities = [
         BookooFlowSmoothingSwitch(coordinator, description)
         for description in SWITCHES
-        if _has_supported_setter(coordinator.scale, description.setter_methods)
+        if coordinator.capabilities[description.capability].set is not None
     ]
     if entities:
         async_add_entities(entities)
@@ -105,10 +63,19 @@ class BookooFlowSmoothingSwitch(BookooEntity, SwitchEntity):
 
     entity_description: BookooSwitchEntityDescription
 
+    def __init__(
+        self,
+        coordinator: BookooCoordinator,
+        entity_description: BookooSwitchEntityDescription,
+    ) -> None:
+        """Initialize the switch with the resolved accessors."""
+        super().__init__(coordinator, entity_description)
+        self._capability = coordinator.capabilities[entity_description.capability]
+
     @property
     def is_on(self) -> bool | None:
         """Return switch state."""
-        return self.entity_description.is_on_fn(self._scale)
+        return self.entity_description.is_on_fn(self._capability.get(self._scale))
 
     async def async_turn_on(self, **kwargs: object) -> None:
         """Turn the switch on."""
@@ -119,9 +86,7 @@ class BookooFlowSmoothingSwitch(BookooEntity, SwitchEntity):
         await self._async_set_state(False)
 
     async def _async_set_state(self, value: bool) -> None:
-        success = await _async_call_first_available(
-            self._scale, self.entity_description.setter_methods, value
-        )
-        if not success:
+        if (set_value := self._capability.set) is None:
             raise HomeAssistantError("Dieses Gerät unterstützt die Einstellung nicht.")
+        await set_value(value)
         self.async_write_ha_state()
@@ -0,0 +1,78 @@
+"""Rate limiting of entity state writes for Bookoo."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from functools import partial
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+class BookooWriteThrottle:
+    """Coalesce state writes per key to a maximum rate.
+
+    Writes inside the minimum interval are deferred to a single trailing
+    flush; intermediate values are dropped but the latest one is always
+    written once the burst is over.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the throttle."""
+        self._hass = hass
+        self._min_interval: dict[str, float] = {}
+        self._last_write: dict[str, float] = {}
+        self._pending: dict[str, CALLBACK_TYPE] = {}
+        self.suppressed: defaultdict[str, int] = defaultdict(int)
+
+    @property
+    def suppressed_total(self) -> int:
+        """Return the number of dropped intermediate writes."""
+        return sum(self.suppressed.values())
+
+    @callback
+    def async_set_max_rate(self, key: str, max_rate: float) -> None:
+        """Limit writes for `key` to `max_rate` per second, 0 disables."""
+        if max_rate > 0:
+            self._min_interval[key] = 1.0 / max_rate
+        else:
+            self._min_interval.pop(key, None)
+
+    @callback
+    def async_write(self, key: str, write: CALLBACK_TYPE) -> None:
+        """Write now, or schedule a trailing write if inside the interval."""
+        if (interval := self._min_interval.get(key)) is None:
+            write()
+            return
+
+        if key in self._pending:
+            # the scheduled flush reads the latest value, so this one is dropped
+            self.suppressed[key] += 1
+            return
+
+        now = time.monotonic()
+        delay = self._last_write.get(key, now - interval) + interval - now
+        if delay <= 0:
+            self._last_write[key] = now
+            write()
+            return
+
+        self._pending[key] = async_call_later(
+            self._hass, delay, partial(self._async_flush, key, write)
+        )
+
+    @callback
+    def _async_flush(self, key: str, write: CALLBACK_TYPE, _now: datetime) -> None:
+        """Write the latest value after the interval has passed."""
+        del self._pending[key]
+        self._last_write[key] = time.monotonic()
+        write()
+
+    @callback
+    def async_cancel(self, key: str | None = None) -> None:
+        """Cancel pending trailing writes for `key`, or for all keys."""
+        for pending_key in [key] if key is not None else list(self._pending):
+            if cancel := self._pending.pop(pending_key, None):
+                cancel()